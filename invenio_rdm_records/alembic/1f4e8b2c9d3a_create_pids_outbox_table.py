@@ -0,0 +1,43 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2024 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create PIDs outbox table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1f4e8b2c9d3a"
+down_revision = "425b691f768b"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "rdm_pids_outbox",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("record_pid", sa.String(length=255), nullable=False),
+        sa.Column("scheme", sa.String(length=255), nullable=False),
+        sa.Column("parent", sa.Boolean(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_rdm_pids_outbox")),
+        sa.UniqueConstraint(
+            "record_pid",
+            "scheme",
+            "parent",
+            name="uq_rdm_pids_outbox_record_pid_scheme_parent",
+        ),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("rdm_pids_outbox")
@@ -0,0 +1,57 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2024 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Add OAI sets search indexes."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2e4f6a8c0b1d"
+down_revision = "9b1f3c5d7e2a"
+branch_labels = ()
+depends_on = "5d25c1981985"
+
+
+def upgrade():
+    """Upgrade database."""
+    # keyset pagination of the sets sorted by date
+    op.create_index(
+        op.f("ix_oaiserver_set_created_id"),
+        "oaiserver_set",
+        ["created", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_oaiserver_set_updated_id"),
+        "oaiserver_set",
+        ["updated", "id"],
+        unique=False,
+    )
+
+    # trigram indexes for the substring search of the names and specs
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for column in ("name", "spec"):
+            op.create_index(
+                op.f(f"ix_oaiserver_set_{column}_trgm"),
+                "oaiserver_set",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade():
+    """Downgrade database."""
+    if op.get_context().dialect.name == "postgresql":
+        for column in ("name", "spec"):
+            op.drop_index(
+                op.f(f"ix_oaiserver_set_{column}_trgm"), table_name="oaiserver_set"
+            )
+    op.drop_index(op.f("ix_oaiserver_set_updated_id"), table_name="oaiserver_set")
+    op.drop_index(op.f("ix_oaiserver_set_created_id"), table_name="oaiserver_set")
@@ -0,0 +1,45 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2024 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create PIDs journal table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3e7a9d1c5b2f"
+down_revision = "8c2d6e4f1a7b"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "rdm_pids_journal",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("pid_id", sa.Integer(), nullable=False),
+        sa.Column("provider", sa.String(length=255), nullable=False),
+        sa.Column("operation", sa.String(length=16), nullable=False),
+        sa.Column("record_pid", sa.String(length=255), nullable=True),
+        sa.Column("parent", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["pid_id"],
+            ["pidstore_pid.id"],
+            name=op.f("fk_rdm_pids_journal_pid_id_pidstore_pid"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_rdm_pids_journal")),
+        sa.UniqueConstraint("pid_id", name=op.f("uq_rdm_pids_journal_pid_id")),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("rdm_pids_journal")
@@ -0,0 +1,40 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2024 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create PIDs remote state table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b3e9c7a1d2f"
+down_revision = "1f4e8b2c9d3a"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "rdm_pids_remote_state",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.Column("pid_id", sa.Integer(), nullable=False),
+        sa.Column("payload_hash", sa.String(length=64), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["pid_id"],
+            ["pidstore_pid.id"],
+            name=op.f("fk_rdm_pids_remote_state_pid_id_pidstore_pid"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("pid_id", name=op.f("pk_rdm_pids_remote_state")),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("rdm_pids_remote_state")
@@ -0,0 +1,32 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2024 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Add index on the parent and version index of records."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6d4b2a8e9f1c"
+down_revision = "3e7a9d1c5b2f"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        "ix_rdm_records_metadata_parent_id_index",
+        "rdm_records_metadata",
+        ["parent_id", "index"],
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        "ix_rdm_records_metadata_parent_id_index", table_name="rdm_records_metadata"
+    )
@@ -0,0 +1,29 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2024 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Add next attempt column to the PIDs outbox table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8c2d6e4f1a7b"
+down_revision = "5b3e9c7a1d2f"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column(
+        "rdm_pids_outbox", sa.Column("next_attempt", sa.DateTime(), nullable=True)
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_column("rdm_pids_outbox", "next_attempt")
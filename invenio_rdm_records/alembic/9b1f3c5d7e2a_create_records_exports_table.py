@@ -0,0 +1,39 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2024 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create records exports table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b1f3c5d7e2a"
+down_revision = "6d4b2a8e9f1c"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "rdm_records_exports",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.Column("record_pid", sa.String(length=255), nullable=False),
+        sa.Column("format", sa.String(length=255), nullable=False),
+        sa.Column("revision_id", sa.Integer(), nullable=False),
+        sa.Column("parent_revision_id", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "record_pid", "format", name=op.f("pk_rdm_records_exports")
+        ),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("rdm_records_exports")
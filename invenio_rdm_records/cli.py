@@ -9,6 +9,8 @@
 
 """Command-line tools for demo module."""
 
+from datetime import datetime
+
 import click
 from flask import current_app
 from flask.cli import with_appcontext
@@ -25,6 +27,7 @@ from invenio_records_resources.services.custom_fields.validate import (
 from invenio_search import current_search_client
 from invenio_search.engine import dsl, search
 from invenio_search.utils import build_alias_name
+from invenio_stats.bookmark import BookmarkAPI
 
 from .fixtures import FixturesEngine
 from .fixtures.demo import (
@@ -41,6 +44,7 @@ from .fixtures.tasks import (
     get_authenticated_identity,
 )
 from .proxies import current_rdm_records, current_rdm_records_service
+from .resources.dump import RecordsDump
 from .utils import get_or_create_user
 
 COMMUNITY_OWNER_EMAIL = "community@demo.org"
@@ -344,6 +348,116 @@ def rebuild_index():
     click.secho("Reindexed records and vocabularies!", fg="green")
 
 
+@rdm_records.command("dump")
+@click.argument("output", type=click.Path(file_okay=False))
+@click.option(
+    "--format",
+    "mimetype",
+    default="application/json",
+    show_default=True,
+    help="Mimetype of the export format.",
+)
+@click.option(
+    "--shards",
+    default=8,
+    show_default=True,
+    type=int,
+    help="Number of id ranges the records are split in.",
+)
+@click.option(
+    "--workers", default=None, type=int, help="Number of processes [default: CPUs]."
+)
+@click.option("--records-per-file", default=10000, show_default=True, type=int)
+@click.option(
+    "--compression",
+    default="gzip",
+    show_default=True,
+    type=click.Choice(["gzip", "zstd", "none"]),
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Dump only the records updated since the last incremental dump, "
+    "and list the ids of the records deleted or restricted since then.",
+)
+@with_appcontext
+def dump(output, mimetype, shards, workers, records_per_file, compression, incremental):
+    """Dump all the public records in an export format."""
+    since = None
+    if incremental:
+        bm = BookmarkAPI(current_search_client, f"records_dump_{mimetype}", "day")
+        last_run = bm.get_bookmark()
+        since = last_run.isoformat() if last_run else None
+    start_time = datetime.utcnow().isoformat()
+
+    click.secho(f"Dumping records as {mimetype} to {output}...", fg="green")
+    manifest = RecordsDump(
+        output,
+        mimetype=mimetype,
+        shards=shards,
+        workers=workers,
+        records_per_file=records_per_file,
+        compression=None if compression == "none" else compression,
+        since=since,
+    ).run()
+
+    if incremental:
+        bm.set_bookmark(start_time)
+    click.secho(
+        f"Dumped {manifest['records']} records in {len(manifest['files'])} files, "
+        f"and {len(manifest['deletions'])} deletions.",
+        fg="green",
+    )
+
+
+@rdm_records.group()
+def pids():
+    """InvenioRDM PIDs commands."""
+
+
+@pids.command("sync")
+@click.option("--scheme", default="doi", show_default=True, help="PID scheme.")
+@click.option("--parent", is_flag=True, help="Synchronize the parent (concept) PIDs.")
+@click.option("--batch-size", default=100, show_default=True, type=int)
+@click.option(
+    "--concurrency",
+    default=8,
+    show_default=True,
+    type=int,
+    help="Maximum number of requests in flight.",
+)
+@click.option(
+    "--rate",
+    default=None,
+    type=float,
+    help="Maximum number of requests per second, instead of the provider rate limit.",
+)
+@click.option(
+    "--checkpoint",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="File storing the progress, to resume an interrupted synchronization.",
+)
+@click.option("--limit", default=None, type=int, help="Maximum number of records.")
+@click.option("--force", is_flag=True, help="Send also the unchanged payloads.")
+@with_appcontext
+def sync_pids(scheme, parent, batch_size, concurrency, rate, checkpoint, limit, force):
+    """Push the metadata of all the registered PIDs to their provider."""
+    click.secho(f"Synchronizing {scheme} PIDs...", fg="green")
+    summary = current_rdm_records.records_service.pids.bulk_sync(
+        system_identity,
+        scheme=scheme,
+        parent=parent,
+        limit=limit,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        rate=rate,
+        checkpoint=checkpoint,
+        force=force,
+    )
+    click.secho(str(summary), fg="red" if summary.failed else "green")
+
+
 # CUSTOM FIELDS
 
 
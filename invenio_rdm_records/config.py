@@ -349,6 +349,44 @@ RDM_OAI_PMH_SEARCH = {
 }
 """OAI-PMH search configuration."""
 
+RDM_OAI_CURSOR_PAGINATION = False
+"""Resume the OAI-PMH lists from ``search_after`` cursors instead of scrolls.
+
+The resumption tokens hold the sort values of the last harvested record, so
+they don't keep any scroll context open in the search cluster. Since resuming
+a list costs nothing, ``OAISERVER_RESUMPTION_TOKEN_EXPIRE_TIME`` can be raised
+safely. The resumption tokens of the scrolls and of the cursors can't be used
+interchangeably, so the harvests in progress have to be restarted when this
+is changed.
+"""
+
+RDM_OAI_POINT_IN_TIME = False
+"""Harvest all the pages of an OAI-PMH list from the same point in time.
+
+Requires Elasticsearch 7.10 or OpenSearch 2.4 or newer. The points in time are
+kept for ``OAISERVER_RESUMPTION_TOKEN_EXPIRE_TIME``; a list resumed after
+that continues on the live index.
+"""
+
+RDM_OAI_PRECOMPUTED_SETS = False
+"""Store the OAI-PMH set specs of the records in the records index.
+
+The sets of a record are computed when it is indexed, from the set
+percolators, so that the set-restricted lists are a term filter and the
+headers don't percolate the harvested records. The records of a set are
+reindexed in the background when the set is created, updated or deleted.
+Enable it after updating the mapping of the records index and reindexing the
+records.
+
+The OAI-PMH lists read the stored set specs. Unless configured otherwise,
+``OAISERVER_RECORD_SETS_FETCHER`` and ``OAISERVER_SET_RECORDS_QUERY_FETCHER``
+are set to ``invenio_rdm_records.oai:record_sets_fetcher`` and
+``invenio_rdm_records.oai:set_records_query_fetcher``, which read them as well.
+"""
+
+RDM_OAI_SETS_REINDEX_CONSUMERS = 4
+"""Number of tasks consuming the records reindexed after a set change."""
+
 #
 # Persistent identifiers configuration
 #
@@ -437,6 +475,59 @@ RDM_PARENT_PERSISTENT_IDENTIFIERS = {
 RDM_ALLOW_EXTERNAL_DOI_VERSIONING = True
 """Allow records with external DOIs to be versioned."""
 
+RDM_PIDS_OUTBOX_DISPATCH_ON_COMMIT = True
+"""Dispatch the PIDs outbox right after a transaction enqueued PID operations.
+
+If disabled, the outbox is only drained by the periodic ``dispatch_pid_outbox``
+task (see ``invenio_rdm_records.services.pids.tasks.DispatchPIDOutboxTask``).
+
+The periodic task has to be added to the ``CELERY_BEAT_SCHEDULE`` in any case:
+it pushes the operations of interrupted dispatches, and the operations that
+were re-queued outside of a dispatch (e.g. when DataCite throttled them).
+"""
+
+RDM_PIDS_OUTBOX_DISPATCH_COUNTDOWN = 10
+"""Seconds to wait before dispatching the PIDs outbox after a commit.
+
+Operations enqueued for the same record during this time are pushed only once.
+"""
+
+RDM_PIDS_OUTBOX_BATCH_SIZE = 1000
+"""Maximum number of PIDs outbox entries processed by a single dispatch."""
+
+RDM_PIDS_OUTBOX_CLAIM_TIMEOUT = 600
+"""Seconds a dispatch holds the PIDs outbox entries it is pushing.
+
+Concurrent dispatches skip the claimed entries. The entries of an interrupted
+dispatch are pushed again once this time has passed.
+"""
+
+RDM_PIDS_OUTBOX_MAX_ATTEMPTS = 5
+"""Number of failed dispatches after which a PIDs outbox entry is dropped."""
+
+RDM_PIDS_OUTBOX_RETRY_DELAY = 60
+"""Delay in seconds before retrying a failed PID operation of the outbox.
+
+The delay doubles with each failed attempt (exponential backoff) and is
+randomized between half and the full delay (jitter).
+"""
+
+RDM_PIDS_OUTBOX_RETRY_MAX_DELAY = 3600
+"""Maximum delay in seconds between two attempts of a failed PID operation."""
+
+RDM_VERSIONS_INDEX_CACHE_TIMEOUT = 3600
+"""Seconds the PIDs of the versions of a parent record are cached.
+
+The cache is invalidated when a version is published, deleted or restored.
+"""
+
+RDM_PIDS_JOURNAL_REPLAY_PARALLELISM = 4
+"""Number of parallel tasks replaying the journaled PID operations.
+
+Operations are journaled instead of being sent while the circuit breaker of
+the remote provider is open (see ``DATACITE_CIRCUIT_BREAKER_THRESHOLD``).
+"""
+
 # Configuration for the DataCiteClient used by the DataCitePIDProvider
 
 DATACITE_ENABLED = False
@@ -469,6 +560,56 @@ You can also provide a callable instead:
     DATACITE_FORMAT = make_doi
 """
 
+DATACITE_SKIP_UNCHANGED_UPDATES = True
+"""Skip DOI updates when the metadata is the same as the last one sent to DataCite.
+
+The hash of the last successfully sent payload is stored for each DOI. The
+number of sent and skipped updates is available in the ``counters`` of the
+``DataCitePIDProvider``.
+"""
+
+DATACITE_HTTP_POOL_SIZE = 10
+"""Number of keep-alive connections to the DataCite API kept per process.
+
+Requests to DataCite reuse pooled connections instead of opening a new TCP
+connection (and TLS handshake) for each DOI. Set to ``0`` to disable pooling.
+"""
+
+DATACITE_HTTP_TIMEOUT = (3.05, 30)
+"""Connect and read timeout in seconds for requests to the DataCite API."""
+
+DATACITE_RATE_LIMIT = None
+"""Maximum number of requests per second to the DataCite API, disabled if ``None``.
+
+The rate is lowered when DataCite throttles the requests (HTTP 429) or fails
+(HTTP 5xx), and the throttled operations are retried later through the PID
+outbox. With the default ``LocalRateLimiter`` the rate applies to each process
+separately, so the overall rate is multiplied by the number of processes.
+"""
+
+DATACITE_RATE_LIMITER = (
+    "invenio_rdm_records.services.pids.providers.ratelimit:LocalRateLimiter"
+)
+"""Rate limiter class (or import string) of the DataCite client.
+
+The ``LocalRateLimiter`` limits the requests of each process. Use
+``RedisRateLimiter`` to share the rate limit between all the processes,
+through the Redis instance configured in ``CACHE_REDIS_URL`` (it requires the
+``redis`` package).
+"""
+
+DATACITE_CIRCUIT_BREAKER_THRESHOLD = 0
+"""Consecutive failed requests after which requests to DataCite are suspended.
+
+While suspended, the DOI operations are journaled and replayed later by the
+``replay_pid_journal`` task. The circuit breaker is disabled if ``0``. It is
+local to each process: the failures are counted, and the requests suspended,
+per process.
+"""
+
+DATACITE_CIRCUIT_BREAKER_RESET_TIMEOUT = 60
+"""Seconds after which a trial request is sent to DataCite again."""
+
 DATACITE_DATACENTER_SYMBOL = ""
 """DataCite data center symbol.
 
@@ -619,6 +760,117 @@ RDM_FILES_DEFAULT_MAX_FILE_SIZE = None
 RDM_DATACITE_FUNDER_IDENTIFIERS_PRIORITY = ("ror", "doi", "grid", "isni", "gnd")
 """Priority of funder identifiers types to be used for DataCite serialization."""
 
+RDM_VOCABULARY_PROPS_CACHE_TTL = 300
+"""Seconds before the cached vocabulary props are checked for updates.
+
+The serializers look up the props of vocabulary items (e.g. the DataCite
+resource type) in in-memory tables. Once this time has passed, the tables are
+reloaded if the vocabulary items were created, updated or deleted meanwhile.
+"""
+
+RDM_VOCABULARY_PROPS_CACHE_VOCABULARIES = [
+    "resourcetypes",
+    "relationtypes",
+    "datetypes",
+    "contributorsroles",
+]
+"""Vocabularies loaded together with the first lookup of vocabulary props."""
+
+RDM_CITATION_STYLES_CACHE_SIZE = 32
+"""Maximum number of parsed CSL styles kept in memory, per style and locale."""
+
+RDM_CITATION_STYLES_CACHE_WARM_UP = True
+"""Parse the configured citation styles when a worker starts serving requests.
+
+The default style (``RDM_CITATION_STYLES_DEFAULT``) and the styles listed in
+``RDM_CITATION_STYLES`` are parsed in a background thread on the first request
+of each process, in the CSL locales of ``BABEL_DEFAULT_LOCALE`` and
+``I18N_LANGUAGES`` (e.g. ``de-DE`` for ``de``), up to
+``RDM_CITATION_STYLES_CACHE_SIZE`` entries. CLI commands and Celery workers
+don't serve requests, so they don't parse them.
+"""
+
+RDM_CITATIONS_MAX_RECORDS = 500
+"""Maximum number of records cited by a single bulk citations request."""
+
+RDM_RECORDS_EXPORT_MAX_RESULTS = 10000
+"""Maximum number of records streamed by a single search export request.
+
+Searches matching more records are rejected with a 400 error, which gives the
+limit. Set to ``None`` to export all the records matching the search. Who can export
+is controlled by the ``can_search_export`` permission of the records.
+"""
+
+RDM_RECORDS_SERIALIZATION_CACHE = None
+"""Cache of the records serialized by the REST API, disabled if ``None``.
+
+Either ``invenio_rdm_records.resources.cache.LRUSerializationCache`` (per
+process) or ``invenio_rdm_records.resources.cache.RedisSerializationCache``
+(shared), or an import string of a class with the same interface. The
+responses are cached per record revision, mimetype and query string for
+anonymous users only.
+
+Fields that change without a new revision of the record, such as the version
+status or the statistics, can be outdated until the entry expires.
+"""
+
+RDM_RECORDS_SERIALIZATION_CACHE_SIZE = 1024
+"""Maximum number of serialized records kept by the LRU cache."""
+
+RDM_RECORDS_SERIALIZATION_CACHE_TIMEOUT = 3600
+"""Seconds a serialized record is kept in the cache."""
+
+RDM_RECORDS_EXPORTS_STORE = None
+"""Store of the materialized export formats, disabled if ``None``.
+
+Either ``invenio_rdm_records.resources.exports.DBExportsStore`` or
+``invenio_rdm_records.resources.exports.FileSystemExportsStore``, or an import
+string of a class with the same interface. The formats are rendered when a
+record is published, if the ``ExportsComponent`` is added to the
+``RDM_RECORDS_SERVICE_COMPONENTS``.
+"""
+
+RDM_RECORDS_EXPORTS_FORMATS = {
+    "application/vnd.datacite.datacite+xml": (
+        "invenio_rdm_records.resources.serializers:DataCite43XMLSerializer"
+    ),
+    "application/dcat+xml": "invenio_rdm_records.resources.serializers:DCATSerializer",
+    "application/marcxml+xml": (
+        "invenio_rdm_records.resources.serializers:MARCXMLSerializer"
+    ),
+}
+"""Serializers of the export formats rendered when a record is published.
+
+Maps the mimetypes of the formats to the import strings of their serializer
+classes. The record resource only serves the stored exports of these formats.
+"""
+
+RDM_RECORDS_EXPORTS_PATH = None
+"""Directory of the filesystem exports store, ``<instance path>/exports`` if unset."""
+
+RDM_SIGNPOSTING_LINK_HEADER = True
+"""Add the Signposting ``Link`` header to the responses of the record API.
+
+Clients can also opt out of the header per request, with the
+``Prefer: return=minimal`` request header.
+"""
+
+RDM_SIGNPOSTING_CACHE_SIZE = 1024
+"""Maximum number of linksets of public record revisions kept in memory.
+
+The linksets (``application/linkset+json``) are cached per record revision in
+each process. Set to ``0`` to disable the cache.
+"""
+
+RDM_RECORDS_JSON_ENCODER = None
+"""Function encoding the JSON serializations of the records.
+
+If ``None``, ``orjson`` is used when it is installed and the standard library
+otherwise. Set to ``invenio_rdm_records.resources.serializers.fastjson.json_dumps``
+to always use the standard library, or to the import string of a function with
+the same signature.
+"""
+
 RDM_IIIF_MANIFEST_FORMATS = [
     "gif",
     "jp2",
@@ -13,9 +13,10 @@
 
 from warnings import warn
 
-from flask import Blueprint
+from flask import Blueprint, current_app
 from flask_iiif import IIIF
 from flask_principal import identity_loaded
+from invenio_oaiserver import config as oaiserver_config
 from invenio_records_resources.resources.files import FileResource
 
 from . import config
@@ -23,10 +24,16 @@ from .collections.resources.config import CollectionsResourceConfig
 from .collections.resources.resource import CollectionsResource
 from .collections.services.config import CollectionServiceConfig
 from .collections.services.service import CollectionsService
+from .oai import (
+    oaipmh_response,
+    record_sets_fetcher,
+    set_records_query_fetcher,
+)
 from .oaiserver.resources.config import OAIPMHServerResourceConfig
 from .oaiserver.resources.resources import OAIPMHServerResource
 from .oaiserver.services.config import OAIPMHServerServiceConfig
 from .oaiserver.services.services import OAIPMHServerService
+from .records.schemes import SchemeRegistry
 from .resources import (
     IIIFResource,
     IIIFResourceConfig,
@@ -46,11 +53,16 @@ from .resources import (
     RDMRecordResource,
     RDMRecordResourceConfig,
 )
+from .resources.cache import LRUSerializationCache, get_serialization_cache
 from .resources.config import (
     RDMDraftMediaFilesResourceConfig,
     RDMRecordMediaFilesResourceConfig,
 )
+from .resources.exports import get_exports_serializers, get_exports_store
 from .resources.resources import RDMRecordCommunitiesResource, RDMRecordRequestsResource
+from .resources.serializers.csl import CitationStylesCache, get_csl_locale
+from .resources.serializers.fastjson import get_json_encoder
+from .resources.serializers.utils import VocabularyPropsCache
 from .services import (
     CommunityRecordsService,
     IIIFService,
@@ -104,6 +116,20 @@ class InvenioRDMRecords(object):
         self.init_config(app)
         self.init_services(app)
         self.init_resource(app)
+        self.vocabulary_props_cache = VocabularyPropsCache()
+        self._schemes = None
+        self.serialization_cache = get_serialization_cache(app)
+        self.exports_store = get_exports_store(app)
+        self.exports_serializers = get_exports_serializers(app)
+        self.json_encoder = get_json_encoder(app)
+        self.signposting_cache = (
+            LRUSerializationCache(app, maxsize=app.config["RDM_SIGNPOSTING_CACHE_SIZE"])
+            if app.config["RDM_SIGNPOSTING_CACHE_SIZE"]
+            else None
+        )
+        self.citation_styles = CitationStylesCache(
+            app.config["RDM_CITATION_STYLES_CACHE_SIZE"]
+        )
         app.extensions["invenio-rdm-records"] = self
         app.register_blueprint(blueprint)
         # Load flask IIIF
@@ -298,6 +324,13 @@ class InvenioRDMRecords(object):
             config=IIIFResourceConfig.build(app),
         )
 
+    @property
+    def schemes(self):
+        """Registry of the identifier schemes, compiled on first use."""
+        if self._schemes is None:
+            self._schemes = SchemeRegistry(current_app.config)
+        return self._schemes
+
     def fix_datacite_configs(self, app):
         """Make sure that the DataCite config items are strings."""
         datacite_config_items = [
@@ -347,3 +380,35 @@ def init(app):
     iregistry = app.extensions["invenio-indexer"].registry
     iregistry.register(ext.records_service.indexer, indexer_id="records")
     iregistry.register(ext.records_service.draft_indexer, indexer_id="records-drafts")
+    # List the OAI-PMH records with the pagination of ``oai.get_records``
+    if "invenio_oaiserver.response" in app.view_functions:
+        app.view_functions["invenio_oaiserver.response"] = oaipmh_response
+    # Read the sets of the harvested records from their search dumps, unless
+    # other fetchers are configured (Invenio-OAIServer sets its defaults first)
+    if app.config["RDM_OAI_PRECOMPUTED_SETS"]:
+        fetchers = {
+            "OAISERVER_RECORD_SETS_FETCHER": record_sets_fetcher,
+            "OAISERVER_SET_RECORDS_QUERY_FETCHER": set_records_query_fetcher,
+        }
+        for key, fetcher in fetchers.items():
+            if app.config.get(key) in (None, getattr(oaiserver_config, key)):
+                app.config[key] = fetcher
+    # Parse the citation styles when the worker starts serving requests
+    if app.config["RDM_CITATION_STYLES_CACHE_WARM_UP"]:
+        app.before_request(lambda: warm_up_citation_styles(app))
+
+
+def warm_up_citation_styles(app):
+    """Parse the configured citation styles, once per process.
+
+    The default style and the styles of ``RDM_CITATION_STYLES`` are parsed in
+    the CSL locales of ``I18N_LANGUAGES``, in a background thread.
+    """
+    styles = [app.config.get("RDM_CITATION_STYLES_DEFAULT", "apa")]
+    styles += [style["style"] for style in app.config.get("RDM_CITATION_STYLES", [])]
+    languages = [app.config.get("BABEL_DEFAULT_LOCALE", "en")]
+    languages += [lang for lang, _ in app.config.get("I18N_LANGUAGES", [])]
+    locales = [get_csl_locale(lang) for lang in languages]
+    app.extensions["invenio-rdm-records"].citation_styles.start_warm_up(
+        app, list(dict.fromkeys(styles)), list(dict.fromkeys(locales))
+    )
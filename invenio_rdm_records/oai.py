@@ -8,17 +8,34 @@
 
 """Invenio-RDM-Records OAI Functionality."""
 
-from datacite import schema43
-from dcxml import simpledc
-from flask import current_app, g
+import base64
+import json
+from datetime import datetime
+
+from flask import current_app, g, make_response
+from invenio_oaiserver import current_oaiserver
+from invenio_oaiserver import response as oaiserver_response
+from invenio_oaiserver.errors import OAINoRecordsMatchError
+from invenio_oaiserver.fetchers import (
+    set_records_query_fetcher as oaiserver_set_records_query_fetcher,
+)
+from invenio_oaiserver.percolator import sets_search_all as oaiserver_sets_search_all
+from invenio_oaiserver.query import get_records as oaiserver_get_records
+from invenio_oaiserver.response import NS_OAIPMH, header, resumption_token, verb
+from invenio_oaiserver.utils import serializer
+from invenio_oaiserver.verbs import make_request_validator
 from invenio_pidstore.errors import PersistentIdentifierError, PIDDoesNotExistError
 from invenio_pidstore.fetchers import FetchedPID
 from invenio_pidstore.models import PersistentIdentifier
 from invenio_records_resources.services.errors import PermissionDeniedError
-from invenio_search import RecordsSearch
+from invenio_search import RecordsSearch, current_search_client
 from invenio_search.engine import dsl
+from invenio_search.engine import search as search_engine
+from invenio_search.utils import prefix_index
 from lxml import etree
+from webargs.flaskparser import use_args
 
+from .oaiserver.percolator import percolate_sets
 from .proxies import current_rdm_records, current_rdm_records_service
 from .resources.serializers.datacite import DataCite43XMLSerializer
 from .resources.serializers.dcat import DCATSerializer
@@ -26,34 +43,92 @@ from .resources.serializers.dublincore import DublinCoreXMLSerializer
 from .resources.serializers.marcxml import MARCXMLSerializer
 from .services.pids.providers.oai import OAIPIDProvider
 
+_dublincore_serializer = DublinCoreXMLSerializer()
+_marcxml_serializer = MARCXMLSerializer()
+_dcat_serializer = DCATSerializer()
+_datacite_serializer = DataCite43XMLSerializer()
+
+
+def _materialized_etree(record, mimetype):
+    """Get the materialized export of the indexed record revision, if any."""
+    store = current_rdm_records.exports_store
+    if store is None:
+        return None
+    source = record["_source"]
+    # the search dump holds the version ids, one more than the revision ids
+    data = store.get(
+        source["id"],
+        mimetype,
+        source["version_id"] - 1,
+        source["parent"]["version_id"] - 1,
+    )
+    return etree.fromstring(data) if data is not None else None
+
+
+class OAIRecordDump(dict):
+    """Search dump of a record read by GetRecord, with its result item."""
+
+    def __init__(self, dump, item):
+        """Constructor."""
+        super().__init__(dump)
+        self.item = item
+
+
+class OAIPage:
+    """Records of an OAI-PMH list page, hydrated all at once when first used."""
+
+    def __init__(self, hits):
+        """Constructor."""
+        self.hits = hits
+        self._projections = None
+
+    def projection(self, hit):
+        """Projection of a record of the page."""
+        if self._projections is None:
+            projections = current_rdm_records_service.oai_result_items(
+                g.identity, [h["_source"] for h in self.hits]
+            )
+            self._projections = {
+                h["_id"]: projection for h, projection in zip(self.hits, projections)
+            }
+        return self._projections[hit["_id"]]
+
+
+def _record_dict(record):
+    """Projection of a record for the serializers."""
+    page = record.get("_oai_page")
+    if page is not None:
+        return page.projection(record)
+    source = record["_source"]
+    if isinstance(source, OAIRecordDump):
+        return source.item.to_dict()
+    return current_rdm_records_service.oai_result_item(g.identity, source).to_dict()
+
 
 def dublincore_etree(pid, record, **serializer_kwargs):
     """Get DublinCore XML etree for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: DublinCoreXMLSerializer should be able to dump an etree directly
-    # instead. See https://github.com/inveniosoftware/flask-resources/issues/117
-    obj = DublinCoreXMLSerializer(**serializer_kwargs).dump_obj(item.to_dict())
-    return simpledc.dump_etree(obj)
+    serializer = (
+        DublinCoreXMLSerializer(**serializer_kwargs)
+        if serializer_kwargs
+        else _dublincore_serializer
+    )
+    return serializer.serialize_object_etree(_record_dict(record))
 
 
 def marcxml_etree(pid, record):
     """OAI MARCXML format for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: MARCXMLSerializer should directly be able to dump an etree instead
-    # of internally creating an etree, then dump to xml, then parse into an
-    # etree. See https://github.com/inveniosoftware/flask-resources/issues/117
-    return etree.fromstring(
-        MARCXMLSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
-    )
+    materialized = _materialized_etree(record, "application/marcxml+xml")
+    if materialized is not None:
+        return materialized
+    return _marcxml_serializer.serialize_object_etree(_record_dict(record))
 
 
 def dcat_etree(pid, record):
     """OAI DCAT-AP format for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: Ditto. See https://github.com/inveniosoftware/flask-resources/issues/117
-    return etree.fromstring(
-        DCATSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
-    )
+    materialized = _materialized_etree(record, "application/dcat+xml")
+    if materialized is not None:
+        return materialized
+    return _dcat_serializer.serialize_object_etree(_record_dict(record))
 
 
 def datacite_etree(pid, record):
@@ -61,9 +136,10 @@ def datacite_etree(pid, record):
 
     It assumes that record is a search result.
     """
-    # TODO: Ditto. See https://github.com/inveniosoftware/flask-resources/issues/117
-    data_dict = DataCite43XMLSerializer().dump_obj(record["_source"])
-    return schema43.dump_etree(data_dict)
+    materialized = _materialized_etree(record, "application/vnd.datacite.datacite+xml")
+    if materialized is not None:
+        return materialized
+    return _datacite_serializer.serialize_object_etree(record["_source"])
 
 
 def oai_datacite_etree(pid, record):
@@ -71,10 +147,6 @@ def oai_datacite_etree(pid, record):
 
     It assumes that record is a search result.
     """
-    # TODO: See https://github.com/inveniosoftware/flask-resources/issues/117
-    # This should be made into a serializer similar to the ones above.
-    resource_dict = DataCite43XMLSerializer().dump_obj(record["_source"])
-
     nsmap = {
         None: "http://schema.datacite.org/oai/oai-1.1/",
         "xsi": "http://www.w3.org/2001/XMLSchema-instance",
@@ -94,8 +166,7 @@ def oai_datacite_etree(pid, record):
     payload = etree.SubElement(oai_datacite, "payload")
 
     # dump the record's metadata as usual
-    resource = schema43.dump_etree(resource_dict)
-    payload.append(resource)
+    payload.append(datacite_etree(pid, record))
 
     # set up the elements' contents
     schema_version.text = "4.3"
@@ -134,9 +205,40 @@ def getrecord_fetcher(record_id):
         # if it is a restricted record.
         raise PIDDoesNotExistError("recid", None)
 
-    # TODO: Calling dumps() is not the best way here, since later on it will call
-    # loads() in the service to "normalize" the result.
-    return result._record.dumps()
+    # the dump is used for the header and the sets, the serializers reuse the
+    # result item instead of loading the dump again
+    return OAIRecordDump(result._record.dumps(), result)
+
+
+def set_records_query_fetcher(spec):
+    """Fetch the query of the records of a set.
+
+    With ``RDM_OAI_PRECOMPUTED_SETS``, it filters on the set specs stored in
+    the records index instead of evaluating the search pattern of the set.
+    """
+    if not current_app.config["RDM_OAI_PRECOMPUTED_SETS"]:
+        return oaiserver_set_records_query_fetcher(spec)
+    return dsl.Q("term", oai_sets=spec)
+
+
+def sets_search_all(records):
+    """Fetch the set specs of the search dumps of records.
+
+    The stored set specs are used, and only the records indexed without them
+    are percolated.
+    """
+    records_sets = [record.get("oai_sets") for record in records]
+    missing = [i for i, specs in enumerate(records_sets) if specs is None]
+    if missing:
+        percolated = percolate_sets([records[i] for i in missing])
+        for i, specs in zip(missing, percolated):
+            records_sets[i] = specs
+    return records_sets
+
+
+def record_sets_fetcher(record):
+    """Fetch the set specs of a record."""
+    return sets_search_all([record])[0]
 
 
 class OAIRecordSearch(RecordsSearch):
@@ -152,6 +254,205 @@ class OAIRecordSearch(RecordsSearch):
         ]
 
 
+def _open_pit(index, keep_alive):
+    """Open a point in time of an index, with Elasticsearch or OpenSearch."""
+    client = current_search_client
+    if hasattr(client, "create_pit"):
+        return client.create_pit(index=index, params={"keep_alive": keep_alive})[
+            "pit_id"
+        ]
+    return client.open_point_in_time(index=index, keep_alive=keep_alive)["id"]
+
+
+def _close_pit(pit_id):
+    """Close a point in time, which may have expired already."""
+    client = current_search_client
+    try:
+        if hasattr(client, "delete_pit"):
+            client.delete_pit(body={"pit_id": [pit_id]})
+        else:
+            client.close_point_in_time(body={"id": pit_id})
+    except search_engine.NotFoundError:
+        pass
+
+
+def _encode_cursor(cursor):
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(value):
+    return json.loads(base64.urlsafe_b64decode(value.encode("ascii")))
+
+
+class CursorPagination:
+    """Page of OAI-PMH records, resumed from a ``search_after`` cursor.
+
+    The cursor (the sort values of the last record of the page and the point
+    in time, if any) is exposed as the ``_scroll_id`` of the page, which
+    Invenio-OAIServer stores in the signed resumption token.
+    """
+
+    def __init__(self, response, page, per_page, pit_id=None):
+        """Constructor."""
+        self.response = response
+        self.page = page
+        self.per_page = per_page
+        self.total = response["hits"]["total"]["value"]
+        if self.total == 0:
+            raise OAINoRecordsMatchError()
+
+        hits = response["hits"]["hits"]
+        pit_id = response.get("pit_id", pit_id)
+        self.has_next = len(hits) == per_page and page * per_page < self.total
+        self.next_num = page + 1 if self.has_next else None
+        if self.has_next:
+            self._scroll_id = _encode_cursor({"after": hits[-1]["sort"], "pit": pit_id})
+        else:
+            self._scroll_id = None
+            if pit_id:
+                _close_pit(pit_id)
+
+    @property
+    def items(self):
+        """Return iterator."""
+        hits = self.response["hits"]["hits"]
+        # the serializers hydrate all the records of the page at once
+        page = OAIPage(hits)
+        for result in hits:
+            result["_oai_page"] = page
+            yield {
+                "id": result["_id"],
+                "json": result,
+                "updated": datetime.strptime(
+                    result["_source"][current_oaiserver.last_update_key][:19],
+                    "%Y-%m-%dT%H:%M:%S",
+                ),
+            }
+
+
+def get_records(**kwargs):
+    """Get a page of records for the OAI-PMH lists, without scroll contexts.
+
+    The records are sorted by their last update and id, and each page is
+    searched after the last record of the previous page, so that the
+    resumption tokens do not hold any state in the search cluster. With
+    ``RDM_OAI_POINT_IN_TIME``, all the pages of a list are searched in the same
+    point in time of the index.
+    """
+    if not current_app.config["RDM_OAI_CURSOR_PAGINATION"]:
+        return oaiserver_get_records(**kwargs)
+
+    token = kwargs.get("resumptionToken") or {}
+    params = token or kwargs
+    page = token.get("page", 1)
+    size = current_app.config["OAISERVER_PAGE_SIZE"]
+    keep_alive = "{0}s".format(
+        current_app.config["OAISERVER_RESUMPTION_TOKEN_EXPIRE_TIME"]
+    )
+    index = current_app.config["OAISERVER_RECORD_INDEX"]
+    last_update_key = current_oaiserver.last_update_key
+
+    cursor = _decode_cursor(token["scroll_id"]) if token.get("scroll_id") else {}
+    pit_id = cursor.get("pit")
+    if not token and current_app.config["RDM_OAI_POINT_IN_TIME"]:
+        pit_id = _open_pit(prefix_index(index), keep_alive)
+
+    search = (
+        current_oaiserver.search_cls(index=index)
+        .sort({last_update_key: "asc"}, {"id": "asc"})
+        .extra(version=True, track_total_hits=True)[0:size]
+    )
+    if "set" in params:
+        search = search.query(
+            current_oaiserver.set_records_query_fetcher(params["set"])
+        )
+    time_range = {}
+    if "from_" in params:
+        time_range["gte"] = params["from_"]
+    if "until" in params:
+        time_range["lte"] = params["until"]
+    if time_range:
+        search = search.filter("range", **{last_update_key: time_range})
+    if cursor.get("after"):
+        search = search.extra(search_after=cursor["after"])
+
+    if pit_id:
+        try:
+            response = (
+                search.index()
+                .extra(pit={"id": pit_id, "keep_alive": keep_alive})
+                .execute()
+                .to_dict()
+            )
+        except search_engine.NotFoundError:
+            # the point in time expired, continue on the live index
+            pit_id = None
+    if not pit_id:
+        response = search.execute().to_dict()
+
+    return CursorPagination(response, page, size, pit_id=pit_id)
+
+
+def _list_records(e_list, kwargs, record_dumper=None):
+    """Add a page of records to an OAI-PMH list, with their metadata if dumped."""
+    result = get_records(**kwargs)
+    records = list(result.items)
+    search_sets = (
+        sets_search_all
+        if current_app.config["RDM_OAI_PRECOMPUTED_SETS"]
+        else oaiserver_sets_search_all
+    )
+    records_sets = search_sets([record["json"]["_source"] for record in records])
+    for record, sets in zip(records, records_sets):
+        pid = current_oaiserver.oaiid_fetcher(record["id"], record["json"]["_source"])
+        e_parent = e_list
+        if record_dumper is not None:
+            e_parent = etree.SubElement(e_list, etree.QName(NS_OAIPMH, "record"))
+        header(
+            e_parent, identifier=pid.pid_value, datestamp=record["updated"], sets=sets
+        )
+        if record_dumper is not None:
+            e_metadata = etree.SubElement(e_parent, etree.QName(NS_OAIPMH, "metadata"))
+            e_metadata.append(record_dumper(pid, record["json"]))
+    resumption_token(e_list, result, **kwargs)
+
+
+def listidentifiers(**kwargs):
+    """Create the OAI-PMH response of the ListIdentifiers verb."""
+    e_tree, e_listidentifiers = verb(**kwargs)
+    _list_records(e_listidentifiers, kwargs)
+    return e_tree
+
+
+def listrecords(**kwargs):
+    """Create the OAI-PMH response of the ListRecords verb."""
+    token = kwargs.get("resumptionToken")
+    metadata_prefix = token["metadataPrefix"] if token else kwargs["metadataPrefix"]
+    e_tree, e_listrecords = verb(**kwargs)
+    _list_records(e_listrecords, kwargs, record_dumper=serializer(metadata_prefix))
+    return e_tree
+
+
+@use_args(make_request_validator)
+def oaipmh_response(args):
+    """OAI-PMH endpoint, listing the records with ``get_records``.
+
+    It replaces the view of the Invenio-OAIServer endpoint, which has no hook
+    for the pagination of the lists. The other verbs are answered by
+    Invenio-OAIServer.
+    """
+    verbs = {"listidentifiers": listidentifiers, "listrecords": listrecords}
+    verb_name = args["verb"].lower()
+    e_tree = verbs.get(verb_name, getattr(oaiserver_response, verb_name))(**args)
+    response = make_response(
+        etree.tostring(
+            e_tree, pretty_print=True, xml_declaration=True, encoding="UTF-8"
+        )
+    )
+    response.headers["Content-Type"] = "text/xml"
+    return response
+
+
 # Alias methods, to be deprecated
 oai_marcxml_etree = marcxml_etree
 oai_dcat = dcat_etree
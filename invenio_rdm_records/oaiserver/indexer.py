@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Records indexer storing the OAI-PMH set membership of the records."""
+
+import threading
+from itertools import islice
+
+from flask import current_app
+from invenio_indexer.api import RecordIndexer
+
+from .percolator import percolate_sets
+
+
+class OAISetsRecordIndexer(RecordIndexer):
+    """Records indexer storing the OAI-PMH sets of the published records.
+
+    With ``RDM_OAI_PRECOMPUTED_SETS``, the search dump of an indexed record is
+    percolated against the set queries, and the specs of its sets are stored
+    in a keyword field, so that the records of a set are found with a term
+    filter. The records of a bulk indexing are percolated by batches of
+    ``percolate_batch_size``, with a single request per batch.
+    """
+
+    sets_field = "oai_sets"
+    """Top-level field of the search dump where to store the set specs."""
+
+    percolate_batch_size = 100
+    """Number of records of a bulk indexing percolated at once."""
+
+    def __init__(self, *args, **kwargs):
+        """Constructor."""
+        super().__init__(*args, **kwargs)
+        self._bulk = threading.local()
+
+    def _prepare_record(self, record, index, arguments=None, **kwargs):
+        """Prepare the search dump of a record, with its set specs."""
+        data = super()._prepare_record(record, index, arguments, **kwargs)
+        if record.is_draft or not current_app.config["RDM_OAI_PRECOMPUTED_SETS"]:
+            return data
+
+        pending = getattr(self._bulk, "pending", None)
+        if pending is not None:
+            # percolated with the other records of the batch
+            pending.append(data)
+        else:
+            data[self.sets_field] = percolate_sets([data])[0]
+        return data
+
+    def _actionsiter(self, message_iterator):
+        """Iterate bulk actions, percolating the records of a batch at once."""
+        actions = super()._actionsiter(message_iterator)
+        while True:
+            self._bulk.pending = pending = []
+            try:
+                batch = list(islice(actions, self.percolate_batch_size))
+            finally:
+                self._bulk.pending = None
+            if not batch:
+                return
+            for data, specs in zip(pending, percolate_sets(pending)):
+                data[self.sets_field] = specs
+            yield from batch
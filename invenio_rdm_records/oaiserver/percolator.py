@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""OAI-PMH set membership of the records, from the set percolators.
+
+Invenio-OAIServer stores the compiled query of each set as a percolator
+(``oaiset-<spec>``) next to the records index. The set specs of a record are
+found by percolating its search dump against them.
+"""
+
+from flask import current_app
+from invenio_oaiserver.percolator import (
+    _build_percolator_index_name,
+    _create_percolator_mapping,
+    create_percolate_query,
+)
+from invenio_oaiserver.query import query_string_parser
+from invenio_search import current_search, current_search_client
+from invenio_search.engine import dsl
+from invenio_search.engine import search as search_engine
+
+PERCOLATOR_PREFIX = "oaiset-"
+"""Prefix of the ids of the set percolators."""
+
+MAX_RECORD_SETS = 10000
+"""Maximum number of sets a record can be found in."""
+
+
+def percolator_indices():
+    """Names of the percolator indices of the OAI-PMH records indices.
+
+    The percolator indices are created if they don't exist yet.
+    """
+    # NOTE: `str` handles lazy values (e.g. a LocalProxy)
+    oai_records_index = str(current_app.config["OAISERVER_RECORD_INDEX"])
+    indices = []
+    for index, mapping_path in current_search.mappings.items():
+        if not index.startswith(oai_records_index):
+            continue
+        _create_percolator_mapping(index, mapping_path)
+        indices.append(_build_percolator_index_name(index))
+    return indices
+
+
+def set_query(search_pattern):
+    """Compiled query of a set search pattern, as stored in its percolator."""
+    return query_string_parser(search_pattern=search_pattern).to_dict()
+
+
+def records_query(specs=None, search_patterns=None):
+    """Query of the records in some sets, or matching some search patterns."""
+    queries = [dsl.Q("terms", oai_sets=list(specs))] if specs else []
+    queries += [dsl.Q(set_query(pattern)) for pattern in search_patterns or []]
+    if not queries:
+        return dsl.Q("match_none")
+    return dsl.Q("bool", should=queries, minimum_should_match=1)
+
+
+def percolate_sets(documents):
+    """Set specs of each of the documents, sorted.
+
+    :param documents: search dumps of records.
+    :returns: a list with the set specs of each document.
+    """
+    record_sets = [set() for _ in documents]
+    if not documents:
+        return []
+
+    index = _build_percolator_index_name(
+        str(current_app.config["OAISERVER_RECORD_INDEX"])
+    )
+    body = create_percolate_query(documents=documents)
+    body.update({"size": MAX_RECORD_SETS, "_source": False})
+    try:
+        hits = current_search_client.search(index=index, body=body)["hits"]["hits"]
+    except search_engine.NotFoundError:
+        # no set was created yet
+        hits = []
+
+    for hit in hits:
+        if not hit["_id"].startswith(PERCOLATOR_PREFIX):
+            continue
+        spec = hit["_id"][len(PERCOLATOR_PREFIX) :]
+        slots = hit.get("fields", {}).get("_percolator_document_slot", [0])
+        for slot in slots:
+            record_sets[slot].add(spec)
+    return [sorted(specs) for specs in record_sets]
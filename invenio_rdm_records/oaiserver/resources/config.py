@@ -47,6 +47,7 @@ class OAIPMHServerSearchRequestArgsSchema(SearchRequestArgsSchema):
 
     managed = ma.fields.Boolean()
     sort_direction = ma.fields.Str()
+    after = ma.fields.Str()
 
 
 class OAIPMHServerResourceConfig(ResourceConfig, ConfiguratorMixin):
@@ -11,10 +11,9 @@ from invenio_i18n import lazy_gettext as _
 from invenio_oaiserver.models import OAISet
 from invenio_records_resources.services import ServiceConfig
 from invenio_records_resources.services.base import Link
-from invenio_records_resources.services.records.links import pagination_links
 from sqlalchemy import asc, desc
 
-from ..services.links import OAIPMHSetLink
+from ..services.links import OAIPMHSetLink, keyset_pagination_links
 from ..services.permissions import OAIPMHServerPermissionPolicy
 from ..services.results import (
     OAIMetadataFormatItem,
@@ -100,7 +99,7 @@ class OAIPMHServerServiceConfig(ServiceConfig):
     }
 
     links_search = {
-        **pagination_links("{+api}/oaipmh/sets{?args*}"),
+        **keyset_pagination_links("{+api}/oaipmh/sets{?args*}"),
         "oai-listsets": Link("{+ui}/oai2d?verb=ListSets"),
         "oai-listrecords": Link("{+ui}/oai2d?verb=ListRecords&metadataPrefix=oai_dc"),
         "oai-listidentifiers": Link(
@@ -22,3 +22,35 @@ class OAIPMHSetLink(Link):
                 "spec": set.spec,
             }
         )
+
+
+def keyset_pagination_links(tpl):
+    """Create pagination links (prev/self/next) from the same template.
+
+    The next page is resumed after the last item of the current page, and the
+    previous pages are reached by their page number.
+    """
+
+    def prev_vars(pagination, vars):
+        vars["args"].pop("after", None)
+        vars["args"].update({"page": pagination.prev_page.page})
+
+    def next_vars(pagination, vars):
+        vars["args"].pop("after", None)
+        vars["args"].update({"page": pagination.next_page.page})
+        if pagination.after:
+            vars["args"]["after"] = pagination.after
+
+    return {
+        "prev": Link(
+            tpl,
+            when=lambda pagination, ctx: pagination.has_prev,
+            vars=prev_vars,
+        ),
+        "self": Link(tpl),
+        "next": Link(
+            tpl,
+            when=lambda pagination, ctx: pagination.has_next,
+            vars=next_vars,
+        ),
+    }
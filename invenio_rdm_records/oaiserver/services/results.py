@@ -14,6 +14,33 @@ from invenio_records_resources.services.base.results import (
 )
 
 
+class KeysetPagination(Pagination):
+    """Pagination with the cursor of the next page."""
+
+    def __init__(self, size, page, max_results, after=None):
+        """Constructor.
+
+        :param after: cursor of the page after this one, if any.
+        """
+        super().__init__(size, page, max_results)
+        self.after = after
+
+
+class OAISetsPage:
+    """Page of OAI-PMH sets."""
+
+    def __init__(self, items, total, after=None):
+        """Constructor.
+
+        :param items: the sets of the page.
+        :param total: the number of sets matching the search.
+        :param after: cursor of the next page, if any.
+        """
+        self.items = items
+        self.total = total
+        self.after = after
+
+
 class BaseServiceItemResult(ServiceItemResult):
     """Single result item."""
 
@@ -113,10 +140,11 @@ class BaseServiceListResult(ServiceListResult):
     @property
     def pagination(self):
         """Create a pagination object."""
-        return Pagination(
+        return KeysetPagination(
             self._params["size"],
             self._params["page"],
             self.total,
+            after=getattr(self._results, "after", None),
         )
 
     def to_dict(self):
@@ -7,29 +7,35 @@
 
 """OAI-PMH service."""
 
+import base64
+import json
 import re
+from datetime import datetime
 
 from flask import current_app
 from invenio_db import db
 from invenio_i18n import lazy_gettext as _
 from invenio_oaiserver.models import OAISet
-from invenio_oaiserver.percolator import _new_percolator
 from invenio_records_resources.services import Service
 from invenio_records_resources.services.base import LinksTemplate
 from invenio_records_resources.services.base.utils import map_search_params
 from invenio_records_resources.services.records.schema import ServiceSchemaWrapper
-from invenio_records_resources.services.uow import unit_of_work
+from invenio_records_resources.services.uow import TaskOp, unit_of_work
+from invenio_search import current_search_client
+from invenio_search.engine import search as search_engine
 from marshmallow import ValidationError
-from sqlalchemy import or_
+from sqlalchemy import desc, func, or_, tuple_
 from sqlalchemy.orm.exc import NoResultFound
-from sqlalchemy.sql import text
 
+from ...services.tasks import reindex_oai_set_records
+from ..percolator import PERCOLATOR_PREFIX, percolator_indices, set_query
 from .errors import (
     OAIPMHSetDoesNotExistError,
     OAIPMHSetNotEditable,
     OAIPMHSetSpecAlreadyExistsError,
 )
-from .uow import OAISetCommitOp, OAISetDeleteOp
+from .results import OAISetsPage
+from .uow import OAISetCommitOp, OAISetDeleteOp, OAISetPercolatorDeleteOp
 
 try:
     # flask_sqlalchemy<3.0.0
@@ -38,6 +44,46 @@ except ImportError:
     # flask_sqlalchemy>=3.0.0
     from flask_sqlalchemy.pagination import Pagination
 
+SORT_COLUMNS = {
+    # unnamed sets are sorted and compared as named "", as in their cursors
+    "name": func.coalesce(OAISet.name, ""),
+    "spec": OAISet.spec,
+    "created": OAISet.created,
+    "updated": OAISet.updated,
+    "id": OAISet.id,
+}
+"""Columns of the sort fields of the sets."""
+
+
+def _encode_after(oai_set, fields):
+    """Cursor of the page after a set, from its sort values."""
+    values = []
+    for field in fields:
+        value = getattr(oai_set, field)
+        if field == "name":
+            # coalesced as the sort column, a NULL would compare as unknown
+            value = value or ""
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        values.append(value)
+    after = base64.urlsafe_b64encode(json.dumps(values).encode("utf-8"))
+    return after.decode("ascii").rstrip("=")
+
+
+def _decode_after(after, fields):
+    """Sort values of a cursor."""
+    try:
+        padding = "=" * (-len(after) % 4)
+        values = json.loads(base64.urlsafe_b64decode(after + padding))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise ValueError(after)
+        return [
+            datetime.fromisoformat(value) if field in ("created", "updated") else value
+            for field, value in zip(fields, values)
+        ]
+    except (TypeError, ValueError):
+        raise ValidationError(_("Invalid cursor."), field_name="after")
+
 
 class OAIPMHServerService(Service):
     """OAI-PMH service."""
@@ -121,6 +167,7 @@ class OAIPMHServerService(Service):
             raise OAIPMHSetSpecAlreadyExistsError(new_set.spec)
 
         uow.register(OAISetCommitOp(new_set))
+        self._reindex_records(uow, [new_set.spec], [new_set.search_pattern])
         return self.result_item(
             service=self,
             identity=identity,
@@ -141,33 +188,50 @@ class OAIPMHServerService(Service):
         )
 
     def search(self, identity, params):
-        """Perform search over OAI sets."""
+        """Perform search over OAI sets.
+
+        The next page of the results is resumed after the last set of the
+        current page, with the ``after`` cursor of the ``next`` link, instead
+        of skipping all the sets of the previous pages.
+        """
         self.require_permission(identity, "read")
 
         search_params = map_search_params(self.config.search, params)
 
         query_param = search_params["q"]
-        filters = []
-
+        query = OAISet.query
         if query_param:
-            filters.extend(
-                [
+            query = query.filter(
+                or_(
                     OAISet.name.ilike(f"%{query_param}%"),
                     OAISet.spec.ilike(f"%{query_param}%"),
-                ]
+                )
             )
-
-        oai_sets = (
-            OAISet.query.filter(or_(*filters))
-            .order_by(
-                search_params["sort_direction"](text(",".join(search_params["sort"])))
-            )
-            .paginate(
-                page=search_params["page"],
-                per_page=search_params["size"],
-                error_out=False,
+        total = query.count()
+
+        # the id makes the order total, so that pages can be resumed after a set
+        fields = list(search_params["sort"]) + ["id"]
+        columns = [SORT_COLUMNS[field] for field in fields]
+        descending = search_params["sort_direction"] is desc
+        after = params.get("after")
+        if after:
+            values = _decode_after(after, fields)
+            position = tuple_(*columns)
+            query = query.filter(
+                position < tuple_(*values) if descending else position > tuple_(*values)
             )
-        )
+        query = query.order_by(*[search_params["sort_direction"](c) for c in columns])
+        if not after:
+            query = query.offset((search_params["page"] - 1) * search_params["size"])
+        items = query.limit(search_params["size"]).all()
+
+        next_after = None
+        if (
+            len(items) == search_params["size"]
+            and search_params["page"] * search_params["size"] < total
+        ):
+            next_after = _encode_after(items[-1], fields)
+        oai_sets = OAISetsPage(items, total, after=next_after)
 
         return self.result_list(
             self,
@@ -192,10 +256,21 @@ class OAIPMHServerService(Service):
             raise_errors=True,
         )
 
+        old_spec, old_search_pattern = oai_set.spec, oai_set.search_pattern
         for key, value in valid_data.items():
             setattr(oai_set, key, value)
         uow.register(OAISetCommitOp(oai_set))
 
+        if oai_set.spec != old_spec:
+            # the percolator of the set is only updated for its new spec
+            uow.register(OAISetPercolatorDeleteOp(old_spec, old_search_pattern))
+        if (oai_set.spec, oai_set.search_pattern) != (old_spec, old_search_pattern):
+            self._reindex_records(
+                uow,
+                [old_spec, oai_set.spec],
+                [old_search_pattern, oai_set.search_pattern],
+            )
+
         return self.result_item(
             service=self,
             identity=identity,
@@ -211,6 +286,7 @@ class OAIPMHServerService(Service):
         if oai_set.system_created:
             raise OAIPMHSetNotEditable(oai_set.id)
         uow.register(OAISetDeleteOp(oai_set))
+        self._reindex_records(uow, [oai_set.spec], [])
 
         return True
 
@@ -243,10 +319,58 @@ class OAIPMHServerService(Service):
             ),
         )
 
+    def _reindex_records(self, uow, specs, search_patterns):
+        """Reindex the records of changed sets, with precomputed set membership."""
+        if current_app.config["RDM_OAI_PRECOMPUTED_SETS"]:
+            uow.register(
+                TaskOp(
+                    reindex_oai_set_records,
+                    sorted(set(filter(None, specs))),
+                    sorted(set(filter(None, search_patterns))),
+                )
+            )
+
     def rebuild_index(self, identity):
-        """Rebuild OAI sets percolator index."""
+        """Rebuild OAI sets percolator index.
+
+        The percolators are updated in bulk, and only for the sets which were
+        created, changed or removed since the last rebuild. With precomputed
+        set membership, the records of these sets are reindexed in the
+        background.
+        """
+        queries = {}
         entries = db.session.query(OAISet.spec, OAISet.search_pattern).yield_per(1000)
         for spec, search_pattern in entries:
-            # Creates or updates the OAI set
-            _new_percolator(spec, search_pattern)
+            if spec and search_pattern:
+                queries[PERCOLATOR_PREFIX + spec] = (
+                    search_pattern,
+                    set_query(search_pattern),
+                )
+
+        changed = set()
+        for index in percolator_indices():
+            existing = {
+                hit["_id"]: hit["_source"]["query"]
+                for hit in search_engine.helpers.scan(
+                    current_search_client, index=index
+                )
+                if hit["_id"].startswith(PERCOLATOR_PREFIX)
+            }
+            actions = []
+            for id_, (search_pattern, query) in queries.items():
+                if existing.pop(id_, None) != query:
+                    actions.append(
+                        {"_index": index, "_id": id_, "_source": {"query": query}}
+                    )
+                    changed.add((id_, search_pattern))
+            for id_ in existing:
+                actions.append({"_op_type": "delete", "_index": index, "_id": id_})
+                changed.add((id_, None))
+            search_engine.helpers.bulk(current_search_client, actions)
+
+        if changed and current_app.config["RDM_OAI_PRECOMPUTED_SETS"]:
+            reindex_oai_set_records.delay(
+                sorted(set(id_[len(PERCOLATOR_PREFIX) :] for id_, _ in changed)),
+                sorted(set(pattern for _, pattern in changed if pattern)),
+            )
         return True
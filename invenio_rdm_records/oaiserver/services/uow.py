@@ -9,6 +9,7 @@
 """Unit of work operations for OAI-PMH services."""
 
 from invenio_db import db
+from invenio_oaiserver.percolator import _delete_percolator
 from invenio_records_resources.services.uow import Operation
 
 
@@ -36,3 +37,17 @@ class OAISetDeleteOp(Operation):
     def on_register(self, uow):
         """Hard delete set."""
         db.session.delete(self._oai_set)
+
+
+class OAISetPercolatorDeleteOp(Operation):
+    """OAI-PMH set percolator delete operation."""
+
+    def __init__(self, spec, search_pattern):
+        """Initialize the set percolator delete operation."""
+        super().__init__()
+        self._spec = spec
+        self._search_pattern = search_pattern
+
+    def on_commit(self, uow):
+        """Delete the percolator of the set spec."""
+        _delete_percolator(self._spec, self._search_pattern)
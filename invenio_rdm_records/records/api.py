@@ -51,6 +51,7 @@ from .dumpers import (
     EDTFDumperExt,
     EDTFListDumperExt,
     GrantTokensDumperExt,
+    OAISetsDumperExt,
     StatisticsDumperExt,
     SubjectHierarchyDumperExt,
 )
@@ -122,6 +123,8 @@ class CommonFieldsMixin:
             CustomFieldsDumperExt(fields_var="RDM_CUSTOM_FIELDS"),
             StatisticsDumperExt("stats"),
             SubjectHierarchyDumperExt(),
+            # removes the set specs stored by the records indexer on load
+            OAISetsDumperExt("oai_sets"),
         ]
     )
 
@@ -11,6 +11,7 @@ from .access import GrantTokensDumperExt
 from .combined_subjects import CombinedSubjectsDumperExt
 from .edtf import EDTFDumperExt, EDTFListDumperExt
 from .locations import LocationsDumper
+from .oai_sets import OAISetsDumperExt
 from .pids import PIDsDumperExt
 from .statistics import StatisticsDumperExt
 from .subject_hierarchy import SubjectHierarchyDumperExt
@@ -22,6 +23,7 @@ __all__ = (
     "PIDsDumperExt",
     "GrantTokensDumperExt",
     "LocationsDumper",
+    "OAISetsDumperExt",
     "StatisticsDumperExt",
     "SubjectHierarchyDumperExt",
 )
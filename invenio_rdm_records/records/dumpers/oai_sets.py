@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search dumper for the OAI-PMH sets of the records."""
+
+from invenio_records.dumpers import SearchDumperExt
+
+
+class OAISetsDumperExt(SearchDumperExt):
+    """Search dumper extension for the OAI-PMH set membership of records.
+
+    The specs of the sets of a published record are stored in its search dump
+    by the records indexer (see
+    ``invenio_rdm_records.oaiserver.indexer.OAISetsRecordIndexer``), so that
+    they are only percolated when the record is indexed. On load, it removes
+    the field.
+    """
+
+    def __init__(self, target_field="oai_sets"):
+        """Constructor.
+
+        :param target_field: top-level field where the set specs are dumped.
+        """
+        super().__init__()
+        self.key = target_field
+
+    def load(self, data, record_cls):
+        """Remove the set specs from the data dictionary."""
+        data.pop(self.key, None)
@@ -7,7 +7,9 @@
 
 """Record and draft database models."""
 
+import random
 import uuid
+from datetime import datetime, timedelta
 
 from invenio_accounts.models import User
 from invenio_communities.records.records.models import CommunityRelationMixin
@@ -18,8 +20,11 @@ from invenio_drafts_resources.records import (
     ParentRecordStateMixin,
 )
 from invenio_files_rest.models import Bucket
+from invenio_pidstore.models import PersistentIdentifier
 from invenio_records.models import RecordMetadataBase
 from invenio_records_resources.records import FileRecordModelMixin
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy_utils import Timestamp
 from sqlalchemy_utils.types import ChoiceType, UUIDType
@@ -52,6 +57,11 @@ class RDMRecordMetadata(db.Model, RecordMetadataBase, ParentRecordMixin):
     __tablename__ = "rdm_records_metadata"
     __parent_record_model__ = RDMParentMetadata
 
+    # Lookup of the versions of a parent record (e.g. for the parent DOI)
+    __table_args__ = (
+        db.Index("ix_rdm_records_metadata_parent_id_index", "parent_id", "index"),
+    )
+
     # Enable versioning
     __versioned__ = {}
 
@@ -225,3 +235,304 @@ class RDMUserQuota(db.Model, Timestamp):
 
     notes = db.Column(db.Text, nullable=False, default="")
     """Notes related to setting the quota."""
+
+
+#
+# Materialized exports
+#
+class RDMRecordExport(db.Model, Timestamp):
+    """Export format of a published record, rendered ahead of the requests."""
+
+    __tablename__ = "rdm_records_exports"
+
+    record_pid = db.Column(db.String(255), primary_key=True)
+    """PID value of the record (i.e. its ``recid``)."""
+
+    format = db.Column(db.String(255), primary_key=True)
+    """Mimetype of the export format."""
+
+    revision_id = db.Column(db.Integer, nullable=False)
+    """Revision of the record that was rendered."""
+
+    parent_revision_id = db.Column(db.Integer, nullable=False)
+    """Revision of the parent record that was rendered."""
+
+    data = db.Column(db.LargeBinary, nullable=False)
+    """Rendered export."""
+
+
+#
+# PIDs outbox
+#
+class RDMPIDOutbox(db.Model, Timestamp):
+    """Pending remote registrations/updates of record PIDs.
+
+    There is at most one entry per (record, scheme, parent) so that a burst of
+    operations on the same record results in a single push of its latest state.
+    """
+
+    __tablename__ = "rdm_pids_outbox"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "record_pid",
+            "scheme",
+            "parent",
+            name="uq_rdm_pids_outbox_record_pid_scheme_parent",
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    """Outbox entry ID."""
+
+    record_pid = db.Column(db.String(255), nullable=False)
+    """PID value of the record (i.e. its ``recid``)."""
+
+    scheme = db.Column(db.String(255), nullable=False)
+    """PID scheme to register or update (e.g. ``doi``)."""
+
+    parent = db.Column(db.Boolean, nullable=False, default=False)
+    """Whether the operation is for the parent PID of the record."""
+
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    """Number of failed dispatch attempts."""
+
+    next_attempt = db.Column(db.DateTime, nullable=True)
+    """Time before which a failed entry is not dispatched again."""
+
+    @classmethod
+    def _get_or_add(cls, record_pid, scheme, parent):
+        """Add an entry or mark the existing pending one as changed."""
+        entry = cls.query.filter_by(
+            record_pid=record_pid, scheme=scheme, parent=parent
+        ).one_or_none()
+        if entry is not None:
+            entry.updated = datetime.utcnow()
+            return entry
+
+        try:
+            with db.session.begin_nested():
+                entry = cls(record_pid=record_pid, scheme=scheme, parent=parent)
+                db.session.add(entry)
+        except IntegrityError:
+            # a concurrent transaction enqueued the same operation
+            entry = cls.query.filter_by(
+                record_pid=record_pid, scheme=scheme, parent=parent
+            ).one()
+            entry.updated = datetime.utcnow()
+        return entry
+
+    @classmethod
+    def enqueue(cls, record_pid, scheme, parent=False):
+        """Add an entry or mark the existing pending one as changed.
+
+        A new operation is due right away, even if the previous one was
+        waiting for a retry, and its failed attempts are counted afresh.
+        """
+        entry = cls._get_or_add(record_pid, scheme, parent)
+        entry.attempts = 0
+        entry.next_attempt = None
+        return entry
+
+    @classmethod
+    def retry(
+        cls,
+        record_pid,
+        scheme,
+        parent=False,
+        max_attempts=None,
+        delay=60,
+        max_delay=3600,
+    ):
+        """Schedule a new attempt, with exponential backoff and jitter.
+
+        The delay (in seconds) doubles with each failed attempt up to
+        ``max_delay``, and is randomized to spread the retries over time.
+
+        :returns: The entry, or ``None`` if it was dropped after reaching
+            ``max_attempts``.
+        """
+        entry = cls._get_or_add(record_pid, scheme, parent)
+        entry.attempts = (entry.attempts or 0) + 1
+        if max_attempts and entry.attempts >= max_attempts:
+            db.session.delete(entry)
+            return None
+
+        delay = min(max_delay, delay * 2 ** (entry.attempts - 1))
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        entry.next_attempt = datetime.utcnow() + timedelta(seconds=delay)
+        return entry
+
+    @classmethod
+    def claim(cls, limit=None, timeout=600):
+        """Claim the entries due for dispatch, least recently changed first.
+
+        The claimed entries are not due again for ``timeout`` seconds, so that
+        concurrent dispatches skip them, and entries locked by a concurrent
+        claim are skipped. The claim has to be committed before the entries
+        are pushed. If the dispatch is interrupted, the entries are claimed
+        again once the timeout has passed.
+        """
+        now = datetime.utcnow()
+        query = (
+            cls.query.filter(
+                db.or_(cls.next_attempt.is_(None), cls.next_attempt <= now)
+            )
+            .order_by(cls.updated, cls.id)
+            .with_for_update(skip_locked=True)
+        )
+        if limit:
+            query = query.limit(limit)
+        entries = query.all()
+        if entries:
+            # a bulk update, which does not change the ``updated`` timestamp
+            cls.query.filter(cls.id.in_([entry.id for entry in entries])).update(
+                {cls.next_attempt: now + timedelta(seconds=timeout)},
+                synchronize_session=False,
+            )
+        return entries
+
+    @classmethod
+    def release(cls, entry_id, attempts):
+        """Make a claimed entry due for dispatch again.
+
+        An entry retried since it was claimed (i.e. with another number of
+        ``attempts``) keeps the time of its next attempt.
+
+        :returns: ``True`` if the entry was released.
+        """
+        released = cls.query.filter_by(id=entry_id, attempts=attempts).update(
+            {cls.next_attempt: None}, synchronize_session=False
+        )
+        return bool(released)
+
+    @classmethod
+    def next_retry(cls, since):
+        """Get the earliest next attempt of the entries retried since a time."""
+        return (
+            db.session.query(db.func.min(cls.next_attempt))
+            .filter(cls.attempts > 0, cls.updated >= since)
+            .scalar()
+        )
+
+    @classmethod
+    def acknowledge(cls, entry_id, updated):
+        """Remove an entry, unless it was enqueued again since ``updated``.
+
+        :returns: ``True`` if the entry was removed.
+        """
+        deleted = cls.query.filter_by(id=entry_id, updated=updated).delete(
+            synchronize_session=False
+        )
+        return bool(deleted)
+
+
+class RDMPIDRemoteState(db.Model, Timestamp):
+    """Last metadata document successfully sent to the remote provider of a PID."""
+
+    __tablename__ = "rdm_pids_remote_state"
+
+    pid_id = db.Column(
+        db.Integer,
+        db.ForeignKey(PersistentIdentifier.id, ondelete="CASCADE"),
+        primary_key=True,
+    )
+    """Persistent identifier ID."""
+
+    payload_hash = db.Column(db.String(64), nullable=False)
+    """SHA-256 hash of the last sent payload."""
+
+    @classmethod
+    def get_hash(cls, pid_id):
+        """Get the hash of the last sent payload (if any)."""
+        state = db.session.get(cls, pid_id)
+        return state.payload_hash if state else None
+
+    @classmethod
+    def set_hash(cls, pid_id, payload_hash):
+        """Store the hash of the last sent payload."""
+        state = db.session.get(cls, pid_id)
+        if state is None:
+            state = cls(pid_id=pid_id)
+            db.session.add(state)
+        state.payload_hash = payload_hash
+        return state
+
+    @classmethod
+    def clear(cls, pid_id):
+        """Forget the last sent payload (e.g. when the remote state changed)."""
+        cls.query.filter_by(pid_id=pid_id).delete(synchronize_session=False)
+
+
+class RDMPIDJournal(db.Model, Timestamp):
+    """Remote PID operations deferred while the provider is unavailable.
+
+    There is at most one entry per PID, holding its latest pending operation.
+    Operations on a record (``record_pid`` is set) are replayed by registering
+    or updating the PID with the latest state of the record.
+    """
+
+    __tablename__ = "rdm_pids_journal"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    """Journal entry ID."""
+
+    pid_id = db.Column(
+        db.Integer,
+        db.ForeignKey(PersistentIdentifier.id, ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    """Persistent identifier ID."""
+
+    provider = db.Column(db.String(255), nullable=False)
+    """Name of the PID provider."""
+
+    operation = db.Column(db.String(16), nullable=False)
+    """Deferred operation (``register``, ``update``, ``hide`` or ``delete``)."""
+
+    record_pid = db.Column(db.String(255), nullable=True)
+    """PID value of the record (i.e. its ``recid``), if any."""
+
+    parent = db.Column(db.Boolean, nullable=False, default=False)
+    """Whether the PID is the parent PID of the record."""
+
+    @classmethod
+    def add(cls, pid_id, provider, operation, record_pid=None, parent=False):
+        """Journal an operation, replacing the pending one of the PID."""
+        entry = cls.query.filter_by(pid_id=pid_id).one_or_none()
+        if entry is None:
+            try:
+                with db.session.begin_nested():
+                    entry = cls(pid_id=pid_id, provider=provider, operation="")
+                    db.session.add(entry)
+            except IntegrityError:
+                # a concurrent transaction journaled an operation on the PID
+                entry = cls.query.filter_by(pid_id=pid_id).one()
+        entry.provider = provider
+        entry.operation = operation
+        entry.record_pid = record_pid
+        entry.parent = parent
+        entry.updated = datetime.utcnow()
+        return entry
+
+    @classmethod
+    def pending(cls, ids=None, limit=None):
+        """Get the journaled entries, oldest first."""
+        query = cls.query.order_by(cls.updated, cls.id)
+        if ids is not None:
+            query = query.filter(cls.id.in_(ids))
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    @classmethod
+    def remove(cls, entry_id, updated):
+        """Remove a replayed entry, unless it was journaled again since ``updated``.
+
+        :returns: ``True`` if the entry was removed.
+        """
+        deleted = cls.query.filter_by(id=entry_id, updated=updated).delete(
+            synchronize_session=False
+        )
+        return bool(deleted)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Registry of the configured identifier schemes."""
+
+
+def always_valid(identifier):
+    """Accept any identifier."""
+    return True
+
+
+class SchemeRegistry:
+    """Lookup tables of the identifier schemes, compiled once per application.
+
+    The tables are built from ``RDM_RECORDS_IDENTIFIERS_SCHEMES``,
+    ``RDM_RECORDS_PERSONORG_SCHEMES``, ``VOCABULARIES_AFFILIATION_SCHEMES`` and
+    ``RDM_PERSISTENT_IDENTIFIERS``, so that serializers and the PID manager
+    don't need to walk the nested configuration for every identifier. They
+    are plain dicts and tuples which must not be modified.
+    """
+
+    datacite_config_names = (
+        "RDM_RECORDS_IDENTIFIERS_SCHEMES",
+        "RDM_RECORDS_PERSONORG_SCHEMES",
+        "VOCABULARIES_AFFILIATION_SCHEMES",
+    )
+
+    def __init__(self, config):
+        """Constructor."""
+        self.datacite = {
+            name: {
+                scheme: attrs["datacite"]
+                for scheme, attrs in (config.get(name) or {}).items()
+                if "datacite" in attrs
+            }
+            for name in self.datacite_config_names
+        }
+        self.pids = {
+            scheme: (
+                attrs.get("validator", always_valid),
+                attrs.get("normalizer"),
+                attrs.get("label", scheme),
+            )
+            for scheme, attrs in config.get("RDM_PERSISTENT_IDENTIFIERS", {}).items()
+        }
+
+    def datacite_scheme(self, scheme, config_name, default=None):
+        """Get the DataCite equivalent of a scheme."""
+        return self.datacite[config_name].get(scheme, default)
+
+    def pid_scheme(self, scheme):
+        """Get the validator, normalizer and label of a PID scheme."""
+        return self.pids.get(scheme) or (always_valid, None, scheme)
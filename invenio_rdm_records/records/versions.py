@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Database-backed index of the persistent identifiers of record versions."""
+
+from flask import current_app
+from invenio_cache import current_cache
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+
+from .models import RDMRecordMetadata
+from .systemfields.deletion_status import RecordDeletionStatusEnum
+
+
+class VersionsIndex:
+    """Registered PIDs of all the published versions of a parent record.
+
+    The identifiers are read with a single query on the records and PIDs
+    tables, instead of searching the index, and cached per parent until a
+    version is published, deleted or restored (see :meth:`invalidate`).
+    """
+
+    cache_prefix = "rdm-versions-pids"
+
+    @classmethod
+    def _cache_key(cls, parent_id, pid_type):
+        return f"{cls.cache_prefix}:{parent_id}:{pid_type}"
+
+    @classmethod
+    def query(cls, parent_id, pid_type="doi"):
+        """Query the registered PIDs of the published versions, latest first.
+
+        PIDs that are only reserved (e.g. on the edit draft of a version, which
+        has the same id) or that were deleted are left out.
+        """
+        model_cls = RDMRecordMetadata
+        return (
+            db.session.query(PersistentIdentifier.pid_value)
+            .join(model_cls, PersistentIdentifier.object_uuid == model_cls.id)
+            .filter(
+                PersistentIdentifier.pid_type == pid_type,
+                PersistentIdentifier.object_type == "rec",
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+                model_cls.parent_id == parent_id,
+                model_cls.is_deleted == False,  # noqa
+                model_cls.deletion_status == RecordDeletionStatusEnum.PUBLISHED.value,
+            )
+            .order_by(model_cls.index.desc())
+        )
+
+    @classmethod
+    def pids(cls, parent_id, pid_type="doi"):
+        """Get the PID values of the published versions, latest version first."""
+        key = cls._cache_key(parent_id, pid_type)
+        values = current_cache.get(key)
+        if values is None:
+            values = [row.pid_value for row in cls.query(parent_id, pid_type)]
+            current_cache.set(
+                key,
+                values,
+                timeout=current_app.config.get("RDM_VERSIONS_INDEX_CACHE_TIMEOUT"),
+            )
+        return values
+
+    @classmethod
+    def invalidate(cls, parent_id, pid_type="doi"):
+        """Forget the cached PIDs of a parent record."""
+        current_cache.delete(cls._cache_key(parent_id, pid_type))
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Cache of the serialized records returned by the REST API."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, make_response, request
+from flask_login import current_user
+from flask_resources import ResponseHandler, resource_requestctx
+from invenio_i18n import get_locale
+from werkzeug.utils import import_string
+
+from ..proxies import current_rdm_records
+from .exports import parent_revision_id
+
+
+class LRUSerializationCache:
+    """In-process cache of serialized records, evicting the least recently used."""
+
+    def __init__(self, app, clock=time.monotonic, maxsize=None, timeout=None):
+        """Constructor."""
+        self.maxsize = maxsize or app.config["RDM_RECORDS_SERIALIZATION_CACHE_SIZE"]
+        self.timeout = timeout or app.config["RDM_RECORDS_SERIALIZATION_CACHE_TIMEOUT"]
+        self.clock = clock
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get a serialized record, or ``None``."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires <= self.clock():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store a serialized record."""
+        with self._lock:
+            self._items[key] = (self.clock() + self.timeout, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """Remove all the serialized records."""
+        with self._lock:
+            self._items.clear()
+
+
+class RedisSerializationCache:
+    """Cache of serialized records shared by all processes through Redis."""
+
+    prefix = "rdm:serialized"
+
+    def __init__(self, app):
+        """Constructor."""
+        # redis is only required by this backend
+        from redis import StrictRedis
+
+        self.redis = StrictRedis.from_url(app.config["CACHE_REDIS_URL"])
+        self.timeout = app.config["RDM_RECORDS_SERIALIZATION_CACHE_TIMEOUT"]
+
+    def get(self, key):
+        """Get a serialized record, or ``None``."""
+        return self.redis.get(f"{self.prefix}:{key}")
+
+    def set(self, key, value):
+        """Store a serialized record."""
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self.redis.set(f"{self.prefix}:{key}", value, ex=self.timeout)
+
+    def clear(self):
+        """Remove all the serialized records."""
+        for key in self.redis.scan_iter(f"{self.prefix}:*"):
+            self.redis.delete(key)
+
+
+def get_serialization_cache(app):
+    """Build the serialization cache configured for an application."""
+    cache_cls = app.config.get("RDM_RECORDS_SERIALIZATION_CACHE")
+    if not cache_cls:
+        return None
+    if isinstance(cache_cls, str):
+        cache_cls = import_string(cache_cls)
+    return cache_cls(app)
+
+
+class CachedResponseHandler(ResponseHandler):
+    """Response handler reusing the serialized revisions of a record.
+
+    The body of a single record response is cached under the record id, its
+    revision id, the response mimetype, the locale of the request and the
+    query string (which holds the serializer arguments, e.g. the CSL style).
+    Any change of the record creates a new revision and thus a new key, while
+    the outdated entries are evicted by the cache backend. The parent and the
+    versions of the record (e.g. its communities, or whether it is the latest
+    version) change without a new revision of the record, so they are part
+    of the key as well. The materialized exports of the record and parent
+    revisions, if any, are served before looking up the cache, for the
+    configured export formats and the requests in the default locale, without
+    query arguments.
+
+    Only the responses to anonymous users are cached, since the serialized
+    record can depend on the permissions of the user.
+    """
+
+    def cache_key(self, obj):
+        """Key of a serialized record, ``None`` if it should not be cached."""
+        if not current_user.is_anonymous:
+            return None
+        id_ = obj.get("id")
+        revision_id = obj.get("revision_id")
+        if id_ is None or revision_id is None:
+            return None
+        state = json.dumps(
+            [obj.get("parent"), obj.get("versions")], sort_keys=True, default=str
+        )
+        digest = hashlib.sha1(request.query_string)
+        digest.update(state.encode("utf-8"))
+        draft = "draft" if obj.get("is_draft") else "record"
+        mimetype = resource_requestctx.accept_mimetype
+        locale = get_locale()
+        return f"{id_}:{revision_id}:{draft}:{mimetype}:{locale}:{digest.hexdigest()}"
+
+    def materialized_export(self, obj):
+        """Materialized export of the record and parent revisions, or ``None``."""
+        store = current_rdm_records.exports_store
+        if store is None or obj.get("is_draft") or not current_user.is_anonymous:
+            return None
+        # the exports are rendered in the default locale, without the
+        # serializer arguments of a query string
+        mimetype = resource_requestctx.accept_mimetype
+        if (
+            mimetype not in current_rdm_records.exports_serializers
+            or request.args
+            or str(get_locale()) != current_app.config.get("BABEL_DEFAULT_LOCALE", "en")
+        ):
+            return None
+        id_ = obj.get("id")
+        revision_id = obj.get("revision_id")
+        parent_id = (obj.get("parent") or {}).get("id")
+        if id_ is None or revision_id is None or parent_id is None:
+            return None
+        return store.get(
+            id_,
+            mimetype,
+            revision_id,
+            parent_revision_id(parent_id),
+        )
+
+    def make_response(self, obj_or_list, code, many=False):
+        """Builds a response, serializing a record only once per revision."""
+        if many or not isinstance(obj_or_list, dict):
+            return super().make_response(obj_or_list, code, many=many)
+
+        body = self.materialized_export(obj_or_list)
+        if body is None:
+            cache = current_rdm_records.serialization_cache
+            key = self.cache_key(obj_or_list) if cache is not None else None
+            if key is None:
+                return super().make_response(obj_or_list, code, many=many)
+
+            body = cache.get(key)
+            if body is None:
+                body = self.serializer.serialize_object(obj_or_list)
+                cache.set(key, body)
+
+        return make_response(
+            body, code, self.make_headers(obj_or_list, code, many=many)
+        )
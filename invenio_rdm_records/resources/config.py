@@ -16,7 +16,6 @@ import marshmallow as ma
 from citeproc_styles import StyleNotFoundError
 from flask_resources import (
     JSONDeserializer,
-    JSONSerializer,
     RequestBodyParser,
     ResourceConfig,
     ResponseHandler,
@@ -37,6 +36,7 @@ from invenio_requests.resources.requests.config import RequestSearchRequestArgsS
 from ..services.errors import (
     AccessRequestExistsError,
     CommunityRequiredError,
+    ExportLimitError,
     GrantExistsError,
     InvalidAccessRestrictions,
     RecordDeletedException,
@@ -47,6 +47,7 @@ from ..services.errors import (
     ValidationErrorWithMessageAsList,
 )
 from .args import RDMSearchRequestArgsSchema
+from .cache import CachedResponseHandler
 from .deserializers import ROCrateJSONDeserializer
 from .deserializers.errors import DeserializerError
 from .errors import HTTPJSONException, HTTPJSONValidationWithMessageAsListException
@@ -59,12 +60,14 @@ from .serializers import (
     DCATSerializer,
     DublinCoreXMLSerializer,
     FAIRSignpostingProfileLvl2Serializer,
+    FastJSONSerializer,
     GeoJSONSerializer,
     MARCXMLSerializer,
     SchemaorgJSONLDSerializer,
     StringCitationSerializer,
     UIJSONSerializer,
 )
+from .serializers.streaming import CSVStreamSerializer, StreamSerializer
 
 
 def csl_url_args_retriever():
@@ -85,10 +88,14 @@ def _bibliography_headers(obj_or_list, code, many=False):
 
 
 record_serializers = {
-    "application/json": ResponseHandler(JSONSerializer(), headers=etag_headers),
-    "application/ld+json": ResponseHandler(SchemaorgJSONLDSerializer()),
-    "application/vnd.inveniordm.v1.full+csv": ResponseHandler(CSVRecordSerializer()),
-    "application/vnd.inveniordm.v1.simple+csv": ResponseHandler(
+    "application/json": CachedResponseHandler(
+        FastJSONSerializer(), headers=etag_headers
+    ),
+    "application/ld+json": CachedResponseHandler(SchemaorgJSONLDSerializer()),
+    "application/vnd.inveniordm.v1.full+csv": CachedResponseHandler(
+        CSVRecordSerializer()
+    ),
+    "application/vnd.inveniordm.v1.simple+csv": CachedResponseHandler(
         CSVRecordSerializer(
             csv_included_fields=[
                 "id",
@@ -105,35 +112,58 @@ record_serializers = {
             collapse_lists=True,
         )
     ),
-    "application/marcxml+xml": ResponseHandler(
+    "application/marcxml+xml": CachedResponseHandler(
         MARCXMLSerializer(), headers=etag_headers
     ),
-    "application/vnd.inveniordm.v1+json": ResponseHandler(
+    "application/vnd.inveniordm.v1+json": CachedResponseHandler(
         UIJSONSerializer(), headers=etag_headers
     ),
-    "application/vnd.citationstyles.csl+json": ResponseHandler(
+    "application/vnd.citationstyles.csl+json": CachedResponseHandler(
         CSLJSONSerializer(), headers=etag_headers
     ),
-    "application/vnd.datacite.datacite+json": ResponseHandler(
+    "application/vnd.datacite.datacite+json": CachedResponseHandler(
         DataCite43JSONSerializer(), headers=etag_headers
     ),
-    "application/vnd.geo+json": ResponseHandler(
+    "application/vnd.geo+json": CachedResponseHandler(
         GeoJSONSerializer(), headers=etag_headers
     ),
-    "application/vnd.datacite.datacite+xml": ResponseHandler(
+    "application/vnd.datacite.datacite+xml": CachedResponseHandler(
         DataCite43XMLSerializer(), headers=etag_headers
     ),
-    "application/x-dc+xml": ResponseHandler(
+    "application/x-dc+xml": CachedResponseHandler(
         DublinCoreXMLSerializer(), headers=etag_headers
     ),
-    "text/x-bibliography": ResponseHandler(
+    "text/x-bibliography": CachedResponseHandler(
         StringCitationSerializer(url_args_retriever=csl_url_args_retriever),
         headers=_bibliography_headers,
     ),
-    "application/x-bibtex": ResponseHandler(BibtexSerializer(), headers=etag_headers),
-    "application/dcat+xml": ResponseHandler(DCATSerializer(), headers=etag_headers),
-    "application/linkset+json": ResponseHandler(FAIRSignpostingProfileLvl2Serializer()),
+    "application/x-bibtex": CachedResponseHandler(
+        BibtexSerializer(), headers=etag_headers
+    ),
+    "application/dcat+xml": CachedResponseHandler(
+        DCATSerializer(), headers=etag_headers
+    ),
+    "application/linkset+json": CachedResponseHandler(
+        FAIRSignpostingProfileLvl2Serializer()
+    ),
+}
+
+record_export_serializers = {
+    "application/json": StreamSerializer(
+        FastJSONSerializer(), prefix="[", separator=",", suffix="]"
+    ),
+    "application/vnd.inveniordm.v1.full+csv": CSVStreamSerializer(
+        record_serializers["application/vnd.inveniordm.v1.full+csv"].serializer
+    ),
+    "application/vnd.inveniordm.v1.simple+csv": CSVStreamSerializer(
+        record_serializers["application/vnd.inveniordm.v1.simple+csv"].serializer
+    ),
+    "application/x-bibtex": StreamSerializer(BibtexSerializer()),
+    "text/x-bibliography": StreamSerializer(
+        record_serializers["text/x-bibliography"].serializer, mimetype="text/plain"
+    ),
 }
+"""Serializers of the streamed search exports."""
 
 error_handlers = {
     **ErrorHandlersMixin.error_handlers,
@@ -143,6 +173,9 @@ error_handlers = {
             description=exc.args[0],
         )
     ),
+    ExportLimitError: create_error_handler(
+        lambda e: HTTPJSONException(code=400, description=e.description)
+    ),
     StyleNotFoundError: create_error_handler(
         HTTPJSONException(
             code=400,
@@ -237,6 +270,8 @@ class RDMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
     routes["restore-record"] = "/<pid_value>/restore"
     routes["set-record-quota"] = "/<pid_value>/quota"
     routes["set-user-quota"] = "/users/<pid_value>/quota"
+    routes["export"] = "/export"
+    routes["citations"] = "/citations"
 
     request_view_args = {
         "pid_value": ma.fields.Str(),
@@ -265,6 +300,11 @@ class RDMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
         default=record_serializers,
     )
 
+    export_serializers = FromConfig(
+        "RDM_RECORDS_EXPORT_SERIALIZERS",
+        default=record_export_serializers,
+    )
+
     error_handlers = FromConfig(
         "RDM_RECORDS_ERROR_HANDLERS",
         default=error_handlers,
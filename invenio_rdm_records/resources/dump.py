@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Parallel dumps of all the public records in an export format."""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+
+from flask import current_app
+from flask_principal import AnonymousIdentity
+from invenio_access.permissions import any_user, system_identity
+from invenio_db import db
+from invenio_search.engine import dsl
+
+from ..proxies import current_rdm_records
+from ..records.systemfields.deletion_status import RecordDeletionStatusEnum
+from .serializers.streaming import encode_stream
+
+RECID_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+"""Characters of the generated record ids, in sort order."""
+
+XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>\s*")
+
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst", None: ""}
+
+
+def id_ranges(shards):
+    """Split the record ids in ``shards`` contiguous ranges.
+
+    The boundaries are spread over the two first characters of the generated
+    record ids. The first and last ranges are open, so that any other id
+    (e.g. of migrated records) belongs to a range as well.
+    """
+    size = len(RECID_ALPHABET)
+    shards = max(1, min(shards, size * size))
+    bounds = []
+    for i in range(1, shards):
+        position = i * size * size // shards
+        bounds.append(
+            RECID_ALPHABET[position // size] + RECID_ALPHABET[position % size]
+        )
+    edges = [None] + bounds + [None]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _framing(mimetype):
+    """Prefix, separator and suffix of the records in a dump file."""
+    if mimetype.endswith("xml"):
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<records>\n',
+            "\n",
+            "\n</records>\n",
+        )
+    # JSON lines, and one record per line(s) for the text formats
+    return "", "\n", "\n"
+
+
+def write_dump_files(
+    records,
+    serializer,
+    mimetype,
+    path_prefix,
+    records_per_file=10000,
+    compression="gzip",
+):
+    """Write serialized records in compressed files of at most N records.
+
+    Each file can be decompressed and parsed on its own, so that the dump can
+    be processed in parallel.
+
+    :param records: iterator over the records to serialize.
+    :param path_prefix: path of the files, without their number and extension.
+    :param records_per_file: maximum number of records in a file.
+    :param compression: ``"gzip"``, ``"zstd"`` or ``None``.
+    :returns: the list of written files, with their number of records, size
+              and SHA-256 checksum.
+    """
+    prefix, separator, suffix = _framing(mimetype)
+    is_xml = mimetype.endswith("xml")
+    extension = ("xml" if is_xml else "jsonl" if "json" in mimetype else "txt") + (
+        COMPRESSION_EXTENSIONS[compression]
+    )
+
+    files = []
+    records = iter(records)
+    while True:
+        part = list(islice(records, records_per_file))
+        if not part:
+            break
+
+        def chunks():
+            yield prefix
+            for index, record in enumerate(part):
+                data = serializer.serialize_object(record)
+                if is_xml:
+                    data = XML_DECLARATION.sub("", data)
+                yield (separator if index else "") + data
+            yield suffix
+
+        path = f"{path_prefix}-{len(files):04d}.{extension}"
+        checksum = hashlib.sha256()
+        size = 0
+        with open(path, "wb") as fp:
+            for data in encode_stream(chunks(), compression):
+                fp.write(data)
+                checksum.update(data)
+                size += len(data)
+        files.append(
+            {
+                "name": os.path.basename(path),
+                "records": len(part),
+                "size": size,
+                "sha256": checksum.hexdigest(),
+            }
+        )
+    return files
+
+
+#
+# Workers
+#
+_worker_app = None
+
+
+def _init_worker():
+    """Set up a forked worker with its own database and search connections."""
+    ctx = _worker_app.test_request_context()
+    ctx.push()
+    db.engine.dispose(close=False)
+    current_app.extensions["invenio-search"]._client = None
+
+
+def _dump_shard(dump, shard, id_range):
+    """Dump the records of an id range, in a worker."""
+    return dump.dump_shard(shard, id_range)
+
+
+class RecordsDump:
+    """Dump all the public records in an export format, in parallel.
+
+    The records are split in ``shards`` id ranges, which are searched and
+    serialized by a pool of ``workers`` processes. Each shard is written in
+    compressed files of at most ``records_per_file`` records, and a
+    ``manifest.json`` lists the files of the dump.
+
+    An incremental dump (``since``) only holds the records updated since the
+    given date, and its manifest lists the ids of the records deleted or
+    restricted since then (``deletions``), to be removed from the previous
+    dumps.
+    """
+
+    def __init__(
+        self,
+        output,
+        mimetype="application/json",
+        shards=8,
+        workers=None,
+        records_per_file=10000,
+        compression="gzip",
+        since=None,
+    ):
+        """Constructor."""
+        self.output = output
+        self.mimetype = mimetype
+        self.shards = shards
+        self.workers = workers or os.cpu_count()
+        self.records_per_file = records_per_file
+        self.compression = compression
+        self.since = since
+
+    @property
+    def serializer(self):
+        """Serializer of the export format."""
+        handlers = current_rdm_records.records_resource.config.response_handlers
+        return handlers[self.mimetype].serializer
+
+    def records(self, id_range):
+        """Published records of an id range, as anonymous users see them."""
+        identity = AnonymousIdentity()
+        identity.provides.add(any_user)
+
+        lower, upper = id_range
+        bounds = {}
+        if lower is not None:
+            bounds["gte"] = lower
+        if upper is not None:
+            bounds["lt"] = upper
+        extra_filter = dsl.Q("range", id=bounds) if bounds else None
+        if self.since:
+            updated = dsl.Q("range", updated={"gte": self.since})
+            extra_filter = updated & extra_filter if extra_filter else updated
+
+        return current_rdm_records.records_service.scan(
+            identity, params={"allversions": True}, extra_filter=extra_filter
+        ).hits
+
+    def deletions(self):
+        """Ids of the records deleted or restricted since the last dump.
+
+        The records which were already hidden in the last dump may be listed
+        as well, if they were updated since then.
+        """
+        if not self.since:
+            return []
+        hidden = dsl.Q(
+            "bool",
+            should=[
+                ~dsl.Q(
+                    "term", deletion_status=RecordDeletionStatusEnum.PUBLISHED.value
+                ),
+                ~dsl.Q("term", **{"access.record": "public"}),
+            ],
+            minimum_should_match=1,
+        )
+        extra_filter = dsl.Q("range", updated={"gte": self.since}) & hidden
+        hits = current_rdm_records.records_service.scan(
+            system_identity,
+            params={"allversions": True, "include_deleted": True},
+            extra_filter=extra_filter,
+        ).hits
+        return sorted(hit["id"] for hit in hits)
+
+    def dump_shard(self, shard, id_range):
+        """Write the files of a shard."""
+        return write_dump_files(
+            self.records(id_range),
+            self.serializer,
+            self.mimetype,
+            os.path.join(self.output, f"records-{shard:04d}"),
+            records_per_file=self.records_per_file,
+            compression=self.compression,
+        )
+
+    def run(self):
+        """Dump the records and write the manifest.
+
+        :returns: the manifest.
+        """
+        global _worker_app
+
+        os.makedirs(self.output, exist_ok=True)
+        created = datetime.utcnow().isoformat()
+        ranges = id_ranges(self.shards)
+
+        if self.workers > 1 and len(ranges) > 1:
+            _worker_app = current_app._get_current_object()
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _dump_shard,
+                        [self] * len(ranges),
+                        range(len(ranges)),
+                        ranges,
+                    )
+                )
+        else:
+            # serializers may read the request arguments
+            with current_app.test_request_context():
+                results = [self.dump_shard(i, r) for i, r in enumerate(ranges)]
+
+        files = [entry for shard_files in results for entry in shard_files]
+        manifest = {
+            "format": self.mimetype,
+            "created": created,
+            "since": self.since,
+            "compression": self.compression,
+            "records": sum(entry["records"] for entry in files),
+            "files": files,
+            "deletions": self.deletions(),
+        }
+        with open(os.path.join(self.output, "manifest.json"), "w") as fp:
+            json.dump(manifest, fp, indent=2)
+        return manifest
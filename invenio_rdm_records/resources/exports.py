@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Materialized export formats of the published records.
+
+The configured export formats (``RDM_RECORDS_EXPORTS_FORMATS``) of a record
+are rendered in the background when the record is published, and stored
+together with the revisions of the record and of its parent they were rendered
+from, as the exports hold parts of the parent (e.g. its communities and PIDs).
+The record resource and the OAI-PMH server serve the stored exports as long as
+they match the current revisions of the record and of its parent, and
+serialize the record otherwise.
+"""
+
+import os
+import shutil
+import tempfile
+from urllib.parse import quote
+
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier
+from werkzeug.utils import import_string
+
+from ..records.models import RDMParentMetadata, RDMRecordExport
+
+
+class DBExportsStore:
+    """Store of the rendered exports in the database."""
+
+    def __init__(self, app):
+        """Constructor."""
+
+    def get(self, record_pid, mimetype, revision_id, parent_revision_id):
+        """Get the export of a record and parent revision, or ``None``."""
+        export = db.session.get(RDMRecordExport, (record_pid, mimetype))
+        if (
+            export is None
+            or export.revision_id != revision_id
+            or export.parent_revision_id != parent_revision_id
+        ):
+            return None
+        return export.data
+
+    def set(self, record_pid, mimetype, revision_id, parent_revision_id, data):
+        """Store the export of a record and parent revision, replacing others."""
+        export = db.session.get(RDMRecordExport, (record_pid, mimetype))
+        if export is None:
+            export = RDMRecordExport(record_pid=record_pid, format=mimetype)
+            db.session.add(export)
+        export.revision_id = revision_id
+        export.parent_revision_id = parent_revision_id
+        export.data = data
+
+    def delete(self, record_pid):
+        """Remove all the exports of a record."""
+        RDMRecordExport.query.filter_by(record_pid=record_pid).delete(
+            synchronize_session=False
+        )
+
+
+class FileSystemExportsStore:
+    """Store of the rendered exports on the filesystem.
+
+    Each export is a file named after its format and the revisions of the
+    record and of its parent, in a directory per record under
+    ``RDM_RECORDS_EXPORTS_PATH``.
+    """
+
+    def __init__(self, app):
+        """Constructor."""
+        self.path = app.config.get("RDM_RECORDS_EXPORTS_PATH") or os.path.join(
+            app.instance_path, "exports"
+        )
+
+    def _record_path(self, record_pid):
+        return os.path.join(self.path, record_pid[:2], record_pid)
+
+    def _filename(self, mimetype, revision_id, parent_revision_id):
+        return f"{quote(mimetype, safe='')}.{revision_id}.{parent_revision_id}"
+
+    def get(self, record_pid, mimetype, revision_id, parent_revision_id):
+        """Get the export of a record and parent revision, or ``None``."""
+        path = os.path.join(
+            self._record_path(record_pid),
+            self._filename(mimetype, revision_id, parent_revision_id),
+        )
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def set(self, record_pid, mimetype, revision_id, parent_revision_id, data):
+        """Store the export of a record and parent revision, replacing others."""
+        record_path = self._record_path(record_pid)
+        os.makedirs(record_path, exist_ok=True)
+        filename = self._filename(mimetype, revision_id, parent_revision_id)
+
+        # write to a temporary file first, so that readers never see a partial
+        # export
+        fd, tmp_path = tempfile.mkstemp(dir=record_path, prefix=".")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, os.path.join(record_path, filename))
+
+        prefix = f"{quote(mimetype, safe='')}."
+        for name in os.listdir(record_path):
+            if name.startswith(prefix) and name != filename:
+                try:
+                    os.remove(os.path.join(record_path, name))
+                except FileNotFoundError:
+                    pass
+
+    def delete(self, record_pid):
+        """Remove all the exports of a record."""
+        shutil.rmtree(self._record_path(record_pid), ignore_errors=True)
+
+
+def get_exports_store(app):
+    """Build the store of the materialized exports configured for an application."""
+    store_cls = app.config.get("RDM_RECORDS_EXPORTS_STORE")
+    if not store_cls:
+        return None
+    if isinstance(store_cls, str):
+        store_cls = import_string(store_cls)
+    return store_cls(app)
+
+
+def get_exports_serializers(app):
+    """Build the serializers of the configured export formats, by mimetype."""
+    return {
+        mimetype: (
+            import_string(serializer)() if isinstance(serializer, str) else serializer
+        )
+        for mimetype, serializer in app.config["RDM_RECORDS_EXPORTS_FORMATS"].items()
+    }
+
+
+def parent_revision_id(parent_pid):
+    """Current revision of a parent record, or ``None``."""
+    version_id = (
+        db.session.query(RDMParentMetadata.version_id)
+        .join(
+            PersistentIdentifier,
+            PersistentIdentifier.object_uuid == RDMParentMetadata.id,
+        )
+        .filter(
+            PersistentIdentifier.pid_type == "recid",
+            PersistentIdentifier.pid_value == parent_pid,
+        )
+        .scalar()
+    )
+    # the version id of the model is one more than the revision id
+    return version_id - 1 if version_id is not None else None
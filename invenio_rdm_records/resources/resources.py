@@ -13,7 +13,16 @@
 
 from functools import wraps
 
-from flask import abort, current_app, g, redirect, url_for
+from flask import (
+    Response,
+    abort,
+    current_app,
+    g,
+    redirect,
+    request,
+    stream_with_context,
+    url_for,
+)
 from flask_resources import Resource, resource_requestctx, response_handler, route
 from invenio_drafts_resources.resources import RecordResource
 from invenio_records_resources.resources.errors import ErrorHandlersMixin
@@ -29,12 +38,23 @@ from invenio_records_resources.resources.records.utils import search_preference
 from invenio_stats import current_stats
 from sqlalchemy.exc import NoResultFound
 
+from .serializers.csl import (
+    CSLJSONSerializer,
+    get_citation_strings,
+    get_csl_locale,
+    get_style_location,
+)
+from .serializers.streaming import available_encodings, encode_stream
 from .urls import record_url_for
 
 
 def response_header_signposting(f):
     """Add signposting link to view's reponse headers.
 
+    The header is only added to successful responses, unless disabled with
+    ``RDM_SIGNPOSTING_LINK_HEADER`` or by the client with the
+    ``Prefer: return=minimal`` request header.
+
     :param headers: response headers
     :type headers: dict
     :return: updated response headers
@@ -43,12 +63,19 @@ def response_header_signposting(f):
 
     @wraps(f)
     def inner(*args, **kwargs):
-        pid_value = resource_requestctx.view_args["pid_value"]
-        signposting_link = record_url_for(_app="api", pid_value=pid_value)
-
         response = f(*args, **kwargs)
-        if response.status_code != 200:
+        if response.status_code != 200 or not current_app.config.get(
+            "RDM_SIGNPOSTING_LINK_HEADER", True
+        ):
             return response
+
+        response.vary.add("Prefer")
+        if "return=minimal" in request.headers.get("Prefer", ""):
+            response.headers["Preference-Applied"] = "return=minimal"
+            return response
+
+        pid_value = resource_requestctx.view_args["pid_value"]
+        signposting_link = record_url_for(_app="api", pid_value=pid_value)
         response.headers.update(
             {
                 "Link": f'<{signposting_link}> ; rel="linkset" ; type="application/linkset+json"',  # noqa
@@ -73,6 +100,8 @@ class RDMRecordResource(RecordResource):
         routes = self.config.routes
         url_rules = super().create_url_rules()
         url_rules += [
+            route("GET", p(routes["export"]), self.export),
+            route("POST", p(routes["citations"]), self.citations),
             route("POST", p(routes["item-pids-reserve"]), self.pids_reserve),
             route("DELETE", p(routes["item-pids-reserve"]), self.pids_discard),
             route("GET", p(routes["item-review"]), self.review_read),
@@ -98,6 +127,68 @@ class RDMRecordResource(RecordResource):
 
         return url_rules
 
+    @request_extra_args
+    @request_search_args
+    def export(self):
+        """Stream all the records matching a search, in a single response."""
+        mimetype = resource_requestctx.accept_mimetype
+        serializer = self.config.export_serializers.get(mimetype)
+        if serializer is None:
+            abort(406)
+
+        identity = g.identity
+        params = resource_requestctx.args
+        preference = search_preference()
+
+        def scan():
+            return self.service.scan_export(
+                identity, params=params, search_preference=preference
+            )
+
+        # the scan is lazy, this checks the permission and the number of
+        # records before streaming, the first pass reuses it
+        scans = [scan()]
+
+        def records():
+            return scans.pop() if scans else scan()
+
+        encoding = request.accept_encodings.best_match(available_encodings())
+        headers = {"content-type": serializer.mimetype or mimetype}
+        if encoding:
+            headers["content-encoding"] = encoding
+            headers["vary"] = "Accept-Encoding"
+
+        chunks = encode_stream(serializer.serialize_object_stream(records), encoding)
+        return Response(stream_with_context(chunks), headers=headers)
+
+    @request_data
+    def citations(self):
+        """Format the citations of several records in a single response."""
+        result = self.service.citations(
+            g.identity,
+            resource_requestctx.data or {},
+            search_preference=search_preference(),
+        )
+        style = result["style"]
+        # e.g. "de" for the current language, rendered with "de-DE"
+        locale = get_csl_locale(result["locale"])
+        style_filepath = get_style_location(style)
+
+        serializer = CSLJSONSerializer()
+        jsons = [serializer.dump_obj(hit) for hit in result["hits"]]
+        citations = get_citation_strings(jsons, style_filepath, locale) if jsons else []
+        return {
+            "style": style,
+            "locale": locale,
+            "hits": {
+                "hits": [
+                    {"id": json["id"], "citation": citation}
+                    for json, citation in zip(jsons, citations)
+                ],
+                "total": len(citations),
+            },
+        }, 200
+
     @request_extra_args
     @request_read_args
     @request_view_args
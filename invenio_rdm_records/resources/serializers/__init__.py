@@ -11,7 +11,8 @@
 
 ATTENTION: Serializers MUST NOT query for data (e.g. use a service)!
 
-The only allowed data querying is "get_vocabulary_props()" which is cached.
+The only allowed data querying is "get_vocabulary_props()", which reads the
+vocabulary props from in-memory tables (see "VocabularyPropsCache").
 Querying for data in a serializer will most likely result in very bad
 performance for the OAI-PMH server and search results serialzations.
 """
@@ -25,6 +26,7 @@ from .datacite import DataCite43JSONSerializer, DataCite43XMLSerializer
 from .datapackage import DataPackageSerializer
 from .dcat import DCATSerializer
 from .dublincore import DublinCoreJSONSerializer, DublinCoreXMLSerializer
+from .fastjson import FastJSONSerializer
 from .geojson import GeoJSONSerializer
 from .iiif import (
     IIIFCanvasV2JSONSerializer,
@@ -48,6 +50,7 @@ __all__ = (
     "DublinCoreJSONSerializer",
     "DublinCoreXMLSerializer",
     "FAIRSignpostingProfileLvl2Serializer",
+    "FastJSONSerializer",
     "GeoJSONSerializer",
     "IIIFCanvasV2JSONSerializer",
     "IIIFInfoV2JSONSerializer",
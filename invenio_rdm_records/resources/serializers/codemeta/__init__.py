@@ -7,10 +7,10 @@
 """Codemeta serializer."""
 
 from flask_resources import BaseListSchema, MarshmallowSerializer
-from flask_resources.serializers import JSONSerializer
 
 from invenio_rdm_records.contrib.codemeta.processors import CodemetaDumper
 
+from ..fastjson import FastJSONSerializer
 from .schema import CodemetaSchema
 
 
@@ -20,7 +20,7 @@ class CodemetaSerializer(MarshmallowSerializer):
     def __init__(self, **options):
         """Constructor."""
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=CodemetaSchema,
             list_schema_cls=BaseListSchema,
             schema_kwargs={"dumpers": [CodemetaDumper()]},  # Order matters
@@ -7,9 +7,13 @@
 
 """CSL JSON and  citation string serializers for Invenio RDM Records."""
 
+import copy
 import re
+import threading
+from collections import OrderedDict
 
 from citeproc import (
+    PRIMARY_DIALECTS,
     Citation,
     CitationItem,
     CitationStylesBibliography,
@@ -21,12 +25,13 @@ from citeproc_styles import get_style_filepath
 from citeproc_styles.errors import StyleNotFoundError
 from flask import current_app
 from flask_resources import BaseListSchema, MarshmallowSerializer
-from flask_resources.serializers import JSONSerializer
 from webargs import fields
 
 from ....contrib.imprint.processors import ImprintCSLDumper
 from ....contrib.journal.processors import JournalCSLDumper
 from ....contrib.meeting.processors import MeetingCSLDumper
+from ....proxies import current_rdm_records
+from ..fastjson import FastJSONSerializer
 from .schema import CSLJSONSchema
 
 
@@ -36,7 +41,7 @@ class CSLJSONSerializer(MarshmallowSerializer):
     def __init__(self, **options):
         """Constructor."""
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=CSLJSONSchema,
             list_schema_cls=BaseListSchema,
             schema_kwargs={
@@ -46,22 +51,177 @@ class CSLJSONSerializer(MarshmallowSerializer):
         )
 
 
-def get_citation_string(json, id, style, locale):
-    """Get the citation string from CiteProc library."""
+class CitationStylesCache:
+    """Bounded LRU cache of the parsed CSL styles, keyed by style and locale.
+
+    Parsing the style and locale files is the slowest part of rendering a
+    citation. The parsed styles are shared by the threads of the process, and
+    can be parsed ahead of the requests (see ``warm_up``). A parsed style also
+    holds rendering state and can't be used by several threads at the same
+    time, so each thread renders with its own copies, kept in a per-thread LRU
+    cache of the same size.
+    """
+
+    def __init__(self, maxsize=32):
+        """Constructor."""
+        self.maxsize = maxsize
+        self._parsed = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._warm_up_started = False
+
+    @property
+    def _styles(self):
+        """Copies of the parsed styles used by the current thread."""
+        styles = getattr(self._local, "styles", None)
+        if styles is None:
+            styles = self._local.styles = OrderedDict()
+        return styles
+
+    @staticmethod
+    def _put(cache, key, value, maxsize):
+        """Add an entry to a LRU cache, evicting the least recently used."""
+        cache[key] = value
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _copy(citation_style):
+        """Copy a parsed style, along with its locales."""
+        style_copy = CitationStylesStyle.__new__(CitationStylesStyle)
+        style_copy.parser = citation_style.parser
+        style_copy.xml = copy.deepcopy(citation_style.xml)
+        style_copy.root = style_copy.xml.getroot()
+
+        locales = []
+        for locale in citation_style.root.locales:
+            if locale.getroottree().getroot() is citation_style.root:
+                # a locale of the style itself, at the same place in the copy
+                path = citation_style.xml.getpath(locale)
+                locales.append(style_copy.xml.xpath(path)[0])
+            else:
+                locales.append(copy.deepcopy(locale))
+        style_copy.root.locales = locales
+        for locale in locales:
+            locale.style = style_copy.root
+        return style_copy
+
+    def parse(self, style, locale):
+        """Get the shared parsed style, parsing it if needed.
+
+        The shared parsed style must not be used for rendering.
+        """
+        key = (style, locale)
+        with self._lock:
+            citation_style = self._parsed.get(key)
+            if citation_style is not None:
+                self._parsed.move_to_end(key)
+                return citation_style
+
+        citation_style = CitationStylesStyle(validate=False, style=style, locale=locale)
+        with self._lock:
+            # another thread may have parsed it meanwhile
+            citation_style = self._parsed.setdefault(key, citation_style)
+            self._parsed.move_to_end(key)
+            while len(self._parsed) > self.maxsize:
+                self._parsed.popitem(last=False)
+        return citation_style
+
+    def get(self, style, locale):
+        """Get the current thread's copy of a parsed style file and locale."""
+        styles = self._styles
+        key = (style, locale)
+        citation_style = styles.get(key)
+        if citation_style is None:
+            parsed = self.parse(style, locale)
+            with self._lock:
+                citation_style = self._copy(parsed)
+            self._put(styles, key, citation_style, self.maxsize)
+        else:
+            styles.move_to_end(key)
+        return citation_style
+
+    def warm_up(self, styles, locales):
+        """Parse the given styles in the given locales, up to the cache size.
+
+        Unknown styles and locales are skipped, they fail when requested.
+        """
+        keys = []
+        for style in styles:
+            try:
+                style_filepath = get_style_filepath(style.lower())
+            except StyleNotFoundError:
+                continue
+            keys += [(style_filepath, locale) for locale in locales]
+
+        for style_filepath, locale in keys[: self.maxsize]:
+            try:
+                self.parse(style_filepath, locale)
+            except ValueError:
+                current_app.logger.warning(f"CSL locale {locale} not found.")
+
+    def start_warm_up(self, app, styles, locales):
+        """Warm up the cache in a background thread, once per process."""
+        with self._lock:
+            if self._warm_up_started:
+                return
+            self._warm_up_started = True
+
+        def warm_up():
+            with app.app_context():
+                self.warm_up(styles, locales)
 
-    def _clean_result(text):
-        """Remove double spaces, punctuation."""
-        text = re.sub(r"\s\s+", " ", text)
-        text = re.sub(r"\.\.+", ".", text)
-        return text
+        threading.Thread(target=warm_up, daemon=True).start()
 
+    def clear(self):
+        """Forget the parsed styles and the copies of the current thread."""
+        with self._lock:
+            self._parsed.clear()
+        self._styles.clear()
+
+
+def get_csl_locale(language, default="en-US"):
+    """Get the CSL locale of a language, e.g. ``de-DE`` for ``de``."""
+    if not language:
+        return default
+    language = str(language).replace("_", "-")
+    if "-" in language:
+        return language
+    return PRIMARY_DIALECTS.get(language, default)
+
+
+def _clean_citation(text):
+    """Remove double spaces, punctuation."""
+    text = re.sub(r"\s\s+", " ", text)
+    text = re.sub(r"\.\.+", ".", text)
+    return text
+
+
+def get_citation_string(json, id, style, locale):
+    """Get the citation string from CiteProc library."""
     source = CiteProcJSON([json])
-    citation_style = CitationStylesStyle(validate=False, style=style, locale=locale)
+    citation_style = current_rdm_records.citation_styles.get(style, locale)
     bib = CitationStylesBibliography(citation_style, source, formatter.plain)
     citation = Citation([CitationItem(id)])
     bib.register(citation)
 
-    return _clean_result(str(bib.bibliography()[0]))
+    return _clean_citation(str(bib.bibliography()[0]))
+
+
+def get_citation_strings(jsons, style, locale):
+    """Get the citation strings of several records with a single bibliography.
+
+    The citations are rendered in the order of the records. Note that styles
+    relying on the other entries of a bibliography (e.g. to substitute the
+    authors of consecutive entries) render them accordingly.
+    """
+    source = CiteProcJSON(jsons)
+    citation_style = current_rdm_records.citation_styles.get(style, locale)
+    bib = CitationStylesBibliography(citation_style, source, formatter.plain)
+    for json in jsons:
+        bib.register(Citation([CitationItem(json["id"])]))
+
+    return [_clean_citation(str(item)) for item in bib.bibliography()]
 
 
 def get_style_location(style):
@@ -102,7 +262,7 @@ class StringCitationSerializer(MarshmallowSerializer):
                                    style and locale URL args
         """
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=CSLJSONSchema,
             list_schema_cls=BaseListSchema,
             schema_kwargs={
@@ -138,6 +298,16 @@ class StringCitationSerializer(MarshmallowSerializer):
 
         :param records: List of records instance.
         """
+        style, locale = (
+            self.url_args_retriever()
+            if callable(self.url_args_retriever)
+            else self.url_args_retriever
+        )
+        style_filepath = get_style_location(style or self._default_style)
+
+        jsons = [self.dump_obj(rec) for rec in records["hits"]["hits"]]
+        if not jsons:
+            return ""
         return "\n".join(
-            [self.serialize_object(rec) for rec in records["hits"]["hits"]]
+            get_citation_strings(jsons, style_filepath, locale or self._default_locale)
         )
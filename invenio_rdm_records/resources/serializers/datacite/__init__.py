@@ -9,9 +9,10 @@
 
 from datacite import schema43
 from flask_resources import BaseListSchema, MarshmallowSerializer
-from flask_resources.serializers import JSONSerializer, SimpleSerializer
+from flask_resources.serializers import SimpleSerializer
 
 from ....contrib.journal.processors import JournalDataciteDumper
+from ..fastjson import FastJSONSerializer
 from .schema import DataCite43Schema
 
 
@@ -21,7 +22,7 @@ class DataCite43JSONSerializer(MarshmallowSerializer):
     def __init__(self, **options):
         """Constructor."""
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=DataCite43Schema,
             list_schema_cls=BaseListSchema,
             schema_kwargs={"dumpers": [JournalDataciteDumper()]},  # Order matters
@@ -42,3 +43,7 @@ class DataCite43XMLSerializer(MarshmallowSerializer):
             schema_kwargs={"dumpers": [JournalDataciteDumper()]},  # Order matters
             encoder=encoder,
         )
+
+    def serialize_object_etree(self, obj):
+        """Serialize a single record as an lxml element."""
+        return schema43.dump_etree(self.dump_obj(obj))
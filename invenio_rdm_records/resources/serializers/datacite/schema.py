@@ -14,14 +14,14 @@ from babel_edtf import parse_edtf
 from edtf.parser.grammar import ParseException
 from flask import current_app
 from flask_resources.serializers import BaseSerializerSchema
-from invenio_access.permissions import system_identity
 from invenio_i18n import lazy_gettext as _
 from marshmallow import Schema, ValidationError, fields, missing, post_dump, validate
 from marshmallow_utils.fields import SanitizedUnicode
 from marshmallow_utils.html import strip_html
 from pydash import py_
 
-from ....proxies import current_rdm_records_service
+from ....proxies import current_rdm_records
+from ....records.versions import VersionsIndex
 from ...serializers.ui.schema import current_default_locale
 from ..utils import get_preferred_identifier, get_vocabulary_props
 
@@ -51,8 +51,7 @@ RELATED_IDENTIFIER_SCHEMES = {
 
 def get_scheme_datacite(scheme, config_name, default=None):
     """Returns the datacite equivalent of a scheme."""
-    config_item = current_app.config[config_name]
-    return config_item.get(scheme, {}).get("datacite", default)
+    return current_rdm_records.schemes.datacite_scheme(scheme, config_name, default)
 
 
 class PersonOrOrgSchema43(Schema):
@@ -409,29 +408,19 @@ class DataCite43Schema(BaseSerializerSchema):
         # Generate parent/child versioning relationships
         if self.context.get("is_parent"):
             # Fetch DOIs for all versions
-            # NOTE: The refresh is safe to do here since we'll be in Celery task
-            current_rdm_records_service.indexer.refresh()
-            record_versions = current_rdm_records_service.scan_versions(
-                system_identity,
-                obj._child["id"],
-                params={"_source_includes": "pids.doi"},
+            id_scheme = get_scheme_datacite(
+                "doi",
+                "RDM_RECORDS_IDENTIFIERS_SCHEMES",
+                default="DOI",
             )
-            for version in record_versions:
-                version_doi = version.get("pids", {}).get("doi")
-                id_scheme = get_scheme_datacite(
-                    "doi",
-                    "RDM_RECORDS_IDENTIFIERS_SCHEMES",
-                    default="DOI",
+            for version_doi in VersionsIndex.pids(obj._parent.id, "doi"):
+                serialized_identifiers.append(
+                    {
+                        "relatedIdentifier": version_doi,
+                        "relationType": "HasVersion",
+                        "relatedIdentifierType": id_scheme,
+                    }
                 )
-
-                if version_doi:
-                    serialized_identifiers.append(
-                        {
-                            "relatedIdentifier": version_doi["identifier"],
-                            "relationType": "HasVersion",
-                            "relatedIdentifierType": id_scheme,
-                        }
-                    )
         else:
             if hasattr(obj, "parent"):
                 parent_record = obj.parent
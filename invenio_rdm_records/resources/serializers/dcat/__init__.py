@@ -8,6 +8,8 @@
 """Datacite to DCAT serializer."""
 
 import mimetypes
+import threading
+from copy import copy
 
 from datacite import schema43
 from flask_resources import BaseListSchema, MarshmallowSerializer
@@ -15,11 +17,35 @@ from flask_resources.serializers import SimpleSerializer
 from idutils import detect_identifier_schemes, to_url
 from lxml import etree as ET
 from pkg_resources import resource_stream
-from werkzeug.utils import cached_property
 
 from ....contrib.journal.processors import JournalDataciteDumper
 from ....resources.serializers.dcat.schema import DcatSchema
 
+_xslt = None
+_xslt_lock = threading.Lock()
+_xslt_local = threading.local()
+
+
+def get_xslt_transform():
+    """Return the DCAT XSLT transformation function of the current thread.
+
+    The stylesheet is read and compiled once per process. An XSLT object can't
+    be used by several threads at the same time, so each thread gets its own
+    copy of the compiled stylesheet.
+    """
+    global _xslt
+    transform = getattr(_xslt_local, "transform", None)
+    if transform is None:
+        with _xslt_lock:
+            if _xslt is None:
+                with resource_stream(
+                    "invenio_rdm_records.resources.serializers",
+                    "dcat/datacite-to-dcat-ap.xsl",
+                ) as f:
+                    _xslt = ET.XSLT(ET.XML(f.read()))
+            transform = _xslt_local.transform = copy(_xslt)
+    return transform
+
 
 class DCATSerializer(MarshmallowSerializer):
     """DCAT serializer for records."""
@@ -35,6 +61,10 @@ class DCATSerializer(MarshmallowSerializer):
             **options,
         )
 
+    def serialize_object_etree(self, obj):
+        """Serialize a single record as an lxml element."""
+        return self.transform_with_xslt(self.dump_obj(obj))
+
     def _etree_tostring(self, record, **kwargs):
         root = self.transform_with_xslt(record, **kwargs)
         return ET.tostring(
@@ -44,15 +74,10 @@ class DCATSerializer(MarshmallowSerializer):
             encoding="utf-8",
         ).decode("utf-8")
 
-    @cached_property
+    @property
     def xslt_transform_func(self):
         """Return the DCAT XSLT transformation function."""
-        with resource_stream(
-            "invenio_rdm_records.resources.serializers", "dcat/datacite-to-dcat-ap.xsl"
-        ) as f:
-            xsl = ET.XML(f.read())
-        transform = ET.XSLT(xsl)
-        return transform
+        return get_xslt_transform()
 
     def _add_files(self, root, files):
         """Add files information via distribution elements."""
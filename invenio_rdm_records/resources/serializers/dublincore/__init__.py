@@ -9,10 +9,11 @@
 
 from dcxml import simpledc
 from flask_resources import BaseListSchema, MarshmallowSerializer
-from flask_resources.serializers import JSONSerializer, SimpleSerializer
+from flask_resources.serializers import SimpleSerializer
 
 from ....contrib.journal.processors import JournalDublinCoreDumper
 from ....contrib.meeting.processors import MeetingDublinCoreDumper
+from ..fastjson import FastJSONSerializer
 from .schema import DublinCoreSchema
 
 
@@ -22,7 +23,7 @@ class DublinCoreJSONSerializer(MarshmallowSerializer):
     def __init__(self, **options):
         """Constructor."""
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=DublinCoreSchema,
             list_schema_cls=BaseListSchema,
             schema_kwargs={
@@ -52,3 +53,7 @@ class DublinCoreXMLSerializer(MarshmallowSerializer):
             encoder=simpledc.tostring,
             **options,
         )
+
+    def serialize_object_etree(self, obj):
+        """Serialize a single record as an lxml element."""
+        return simpledc.dump_etree(self.dump_obj(obj))
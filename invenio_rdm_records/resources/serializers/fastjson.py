@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Fast JSON encoding of the serialized records.
+
+Encoding large records and search pages with the standard library ``json``
+module takes a large share of the response time. ``orjson`` is used instead
+when it is installed, unless another encoder is configured in
+``RDM_RECORDS_JSON_ENCODER``. Both encoders produce equivalent JSON: lazy
+strings are translated and dates are formatted as Flask does.
+"""
+
+import json
+
+from flask import has_app_context
+from flask.json.provider import _default as flask_default
+from flask_resources.serializers import JSONSerializer
+from flask_resources.serializers.json import JSONEncoder
+from speaklater import is_lazy_string
+from werkzeug.utils import import_string
+
+from ...proxies import current_rdm_records
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    """Encode the values unknown to orjson."""
+    if is_lazy_string(obj):
+        return str(obj)
+    return flask_default(obj)
+
+
+def json_dumps(obj, **options):
+    """Encode an object with the standard library."""
+    return json.dumps(obj, cls=JSONEncoder, **options)
+
+
+def orjson_dumps(obj, indent=None, sort_keys=False, **options):
+    """Encode an object with orjson.
+
+    Falls back to the standard library for the options and values orjson does
+    not support (e.g. integers of more than 64 bits).
+    """
+    if options:
+        return json_dumps(obj, indent=indent, sort_keys=sort_keys, **options)
+
+    # dates are passed to the default function, to be formatted as by Flask
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+    except orjson.JSONEncodeError:
+        return json_dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+def get_json_encoder(app):
+    """Get the JSON encoder configured for an application."""
+    encoder = app.config.get("RDM_RECORDS_JSON_ENCODER")
+    if not encoder:
+        return orjson_dumps if orjson else json_dumps
+    if isinstance(encoder, str):
+        encoder = import_string(encoder)
+    return encoder
+
+
+class FastJSONSerializer(JSONSerializer):
+    """JSON serializer using the configured encoder."""
+
+    def _dumps(self, obj):
+        """Encode an object with the encoder of the application."""
+        if not has_app_context():
+            return json.dumps(obj, cls=self.encoder, **self.dumps_options)
+        return current_rdm_records.json_encoder(obj, **self.dumps_options)
+
+    def serialize_object(self, obj):
+        """Dump the object into a json string."""
+        return self._dumps(obj)
+
+    def serialize_object_list(self, obj_list):
+        """Dump the object list into a json string."""
+        return self._dumps(obj_list)
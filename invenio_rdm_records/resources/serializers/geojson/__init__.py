@@ -8,8 +8,8 @@
 """GeoJSON Serializers for Invenio RDM Records."""
 
 from flask_resources import BaseListSchema, MarshmallowSerializer
-from flask_resources.serializers import JSONSerializer
 
+from ..fastjson import FastJSONSerializer
 from .schema import GeoJSONSchema
 
 
@@ -19,7 +19,7 @@ class GeoJSONSerializer(MarshmallowSerializer):
     def __init__(self, **options):
         """Constructor."""
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=GeoJSONSchema,
             list_schema_cls=BaseListSchema,
             **options,
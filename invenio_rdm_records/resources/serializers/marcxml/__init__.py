@@ -36,6 +36,10 @@ class MARCXMLSerializer(MarshmallowSerializer):
             encoder=self.marcxml_tostring,
         )
 
+    def serialize_object_etree(self, obj):
+        """Serialize a single record as an lxml element."""
+        return dumps_etree(self.dump_obj(obj))
+
     @classmethod
     def marcxml_tostring(cls, record):
         """Stringify a MarcXML record."""
@@ -8,9 +8,9 @@
 """Schemaorg Serializers for Invenio RDM Records."""
 
 from flask_resources import BaseListSchema, MarshmallowSerializer
-from flask_resources.serializers import JSONSerializer
 
 from ....contrib.journal.processors import JournalSchemaorgDumper
+from ..fastjson import FastJSONSerializer
 from .schema import SchemaorgSchema
 
 
@@ -20,7 +20,7 @@ class SchemaorgJSONLDSerializer(MarshmallowSerializer):
     def __init__(self, **options):
         """Constructor."""
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=SchemaorgSchema,
             list_schema_cls=BaseListSchema,
             schema_kwargs={"dumpers": [JournalSchemaorgDumper()]},  # Order matters
@@ -8,8 +8,9 @@
 """Signposting serializers."""
 
 from flask_resources import BaseListSchema, MarshmallowSerializer
-from flask_resources.serializers import JSONSerializer
 
+from ....proxies import current_rdm_records
+from ..fastjson import FastJSONSerializer
 from .schema import FAIRSignpostingProfileLvl2Schema
 
 
@@ -19,7 +20,35 @@ class FAIRSignpostingProfileLvl2Serializer(MarshmallowSerializer):
     def __init__(self):
         """Initialise Serializer."""
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=FAIRSignpostingProfileLvl2Schema,
             list_schema_cls=BaseListSchema,
         )
+
+    def cache_key(self, obj):
+        """Key of the linkset of a record, ``None`` if it should not be cached.
+
+        Only the linksets of the public records with public files are cached,
+        since they are the same for every user.
+        """
+        access = obj.get("access", {})
+        if access.get("record") != "public" or access.get("files") != "public":
+            return None
+        id_ = obj.get("id")
+        revision_id = obj.get("revision_id")
+        if id_ is None or revision_id is None or obj.get("is_draft"):
+            return None
+        return f"{id_}:{revision_id}"
+
+    def dump_obj(self, obj):
+        """Dump the linkset of a record, once per revision."""
+        cache = current_rdm_records.signposting_cache
+        key = self.cache_key(obj) if cache is not None else None
+        if key is None:
+            return super().dump_obj(obj)
+
+        linkset = cache.get(key)
+        if linkset is None:
+            linkset = super().dump_obj(obj)
+            cache.set(key, linkset)
+        return linkset
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Streaming serializers for large exports of search results.
+
+Instead of building the serialized list of records in memory, the stream
+serializers yield the records one by one as they are read from a search scan,
+so that the memory used does not depend on the number of exported records.
+"""
+
+import csv
+import zlib
+
+from flask_resources.serializers.csv import Line
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class StreamSerializer:
+    """Serialize records one by one, joined by a separator.
+
+    :param serializer: serializer of a single record.
+    :param mimetype: content type of the stream, if different from the
+                     negotiated one.
+    """
+
+    def __init__(self, serializer, prefix="", separator="\n", suffix="", mimetype=None):
+        """Constructor."""
+        self.serializer = serializer
+        self.prefix = prefix
+        self.separator = separator
+        self.suffix = suffix
+        self.mimetype = mimetype
+
+    def serialize_object_stream(self, records):
+        """Yield the serialized records as chunks of text.
+
+        :param records: callable returning a new iterator over the records.
+        """
+        yield self.prefix
+        for index, record in enumerate(records()):
+            if index:
+                yield self.separator
+            yield self.serializer.serialize_object(record)
+        yield self.suffix
+
+
+class CSVStreamSerializer(StreamSerializer):
+    """Serialize records as CSV rows.
+
+    If the serializer does not define the included fields, the columns are
+    only known once all the records are flattened: the records are then read
+    twice, first to collect the columns and then to write the rows.
+    """
+
+    def serialize_object_stream(self, records):
+        """Yield the CSV header and rows."""
+        serializer = self.serializer
+        headers = serializer.csv_included_fields
+        if not headers:
+            headers = set()
+            for record in records():
+                headers.update(serializer.process_dict(record))
+            headers = sorted(headers)
+
+        line = Line()
+        writer = csv.DictWriter(line, fieldnames=headers)
+        writer.writeheader()
+        yield line.read()
+        for record in records():
+            writer.writerow(serializer.process_dict(record))
+            yield line.read()
+
+
+def available_encodings():
+    """Content encodings supported for the streamed exports."""
+    return ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+
+def encode_stream(chunks, encoding=None, buffer_size=64 * 1024):
+    """Encode chunks of text, optionally compressing them.
+
+    Chunks are buffered up to ``buffer_size`` bytes, so that the response is
+    not written in many small pieces.
+
+    :param encoding: ``"gzip"``, ``"zstd"`` or ``None``.
+    """
+    if encoding == "gzip":
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    elif encoding == "zstd":
+        compressor = zstandard.ZstdCompressor().compressobj()
+    else:
+        compressor = None
+
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            buffer.append(data)
+            size += len(data)
+        if size >= buffer_size:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+
+    if compressor is not None:
+        buffer.append(compressor.flush())
+    if buffer:
+        yield b"".join(buffer)
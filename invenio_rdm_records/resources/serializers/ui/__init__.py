@@ -9,8 +9,8 @@
 """Record response serializers."""
 
 from flask_resources import BaseListSchema, MarshmallowSerializer
-from flask_resources.serializers import JSONSerializer
 
+from ..fastjson import FastJSONSerializer
 from .schema import UIRecordSchema
 
 
@@ -20,7 +20,7 @@ class UIJSONSerializer(MarshmallowSerializer):
     def __init__(self):
         """Initialise Serializer."""
         super().__init__(
-            format_serializer_cls=JSONSerializer,
+            format_serializer_cls=FastJSONSerializer,
             object_schema_cls=UIRecordSchema,
             list_schema_cls=BaseListSchema,
             schema_context={"object_key": "ui"},
@@ -168,7 +168,8 @@ class GeometrySchema(Schema):
     """Schema for geometry in the UI."""
 
     type = fields.Str()
-    coordinates = fields.List(fields.Float())
+    # nested lists of positions for the other geometries than points
+    coordinates = fields.Raw()
 
 
 class IdentifierSchema(Schema):
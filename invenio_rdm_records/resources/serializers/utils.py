@@ -9,31 +9,146 @@
 """Helpers for serializers."""
 
 import math
+import threading
+import time
 
-from invenio_access.permissions import system_identity
-from invenio_search.engine import dsl
-from invenio_vocabularies.proxies import current_service as vocabulary_service
+from flask import current_app
+from invenio_db import db
+from invenio_vocabularies.records.models import VocabularyMetadata
+from sqlalchemy import func
 
+from ...proxies import current_rdm_records
 from .errors import VocabularyItemNotFoundError
 
 
+class VocabularyPropsCache:
+    """In-memory lookup tables of the props of vocabulary items.
+
+    Each table maps the ids of the items of a vocabulary to their ``props``,
+    read from the database in a single query. The tables are shared by all the
+    serializers of the application, so serializing a record does not query
+    the search engine. A table is reloaded when its vocabulary items were
+    created, updated or deleted, which is checked at most every
+    ``RDM_VOCABULARY_PROPS_CACHE_TTL`` seconds, or when an item is missing.
+    Items that are still missing after that are not looked up again before
+    the next check.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        """Constructor."""
+        self.clock = clock
+        self._tables = {}
+        self._versions = {}
+        self._checked = {}
+        self._misses = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _type_id():
+        return VocabularyMetadata.json["type"]["id"].as_string()
+
+    def versions(self, vocabularies):
+        """Get the number of items and last update time of vocabularies."""
+        type_id = self._type_id()
+        rows = (
+            db.session.query(
+                type_id,
+                func.count(VocabularyMetadata.id),
+                func.max(VocabularyMetadata.updated),
+            )
+            .filter(type_id.in_(vocabularies))
+            .group_by(type_id)
+        )
+        versions = dict.fromkeys(vocabularies, (0, None))
+        versions.update({type_: (count, updated) for type_, count, updated in rows})
+        return versions
+
+    def load(self, vocabularies):
+        """Load the tables of the given vocabularies."""
+        vocabularies = list(vocabularies)
+        versions = self.versions(vocabularies)
+        tables = {vocabulary: {} for vocabulary in vocabularies}
+        rows = db.session.query(VocabularyMetadata.json).filter(
+            self._type_id().in_(vocabularies)
+        )
+        for (data,) in rows:
+            tables[data["type"]["id"]][data["id"]] = data.get("props", {})
+
+        now = self.clock()
+        with self._lock:
+            self._tables.update(tables)
+            self._versions.update(versions)
+            self._checked.update(dict.fromkeys(vocabularies, now))
+            for vocabulary in vocabularies:
+                self._misses[vocabulary] = set()
+
+    def refresh(self, vocabularies):
+        """Reload the tables of the vocabularies that changed."""
+        versions = self.versions(vocabularies)
+        changed = [v for v in vocabularies if versions[v] != self._versions.get(v)]
+        if changed:
+            self.load(changed)
+        now = self.clock()
+        with self._lock:
+            self._checked.update(dict.fromkeys(vocabularies, now))
+
+    def warm_up(self, vocabularies=None):
+        """Load the tables of the configured vocabularies at once."""
+        if vocabularies is None:
+            vocabularies = current_app.config["RDM_VOCABULARY_PROPS_CACHE_VOCABULARIES"]
+        self.load(vocabularies)
+
+    def clear(self):
+        """Forget all the tables."""
+        with self._lock:
+            self._tables.clear()
+            self._versions.clear()
+            self._checked.clear()
+            self._misses.clear()
+
+    def table(self, vocabulary):
+        """Get the table of a vocabulary, loading or refreshing it if needed."""
+        if not self._tables:
+            self.warm_up(
+                {vocabulary}
+                | set(current_app.config["RDM_VOCABULARY_PROPS_CACHE_VOCABULARIES"])
+            )
+        elif vocabulary not in self._tables:
+            self.load([vocabulary])
+        else:
+            ttl = current_app.config["RDM_VOCABULARY_PROPS_CACHE_TTL"]
+            if self.clock() - self._checked[vocabulary] >= ttl:
+                with self._lock:
+                    self._misses[vocabulary] = set()
+                self.refresh([vocabulary])
+        return self._tables[vocabulary]
+
+    def get(self, vocabulary, id_):
+        """Get the props of a vocabulary item.
+
+        :returns: the props, which must not be modified, or ``None``.
+        """
+        props = self.table(vocabulary).get(id_)
+        if props is None and id_ not in self._misses[vocabulary]:
+            # the item might have been created since the last check
+            self.refresh([vocabulary])
+            props = self._tables[vocabulary].get(id_)
+            if props is None:
+                with self._lock:
+                    self._misses[vocabulary].add(id_)
+        return props
+
+
 def get_vocabulary_props(vocabulary, fields, id_):
     """Returns props associated with a vocabulary, id_."""
-    # This is ok given that read_all is cached per vocabulary+fields and
-    # is reused overtime
-    results = vocabulary_service.read_all(
-        system_identity,
-        ["id"] + fields,
-        vocabulary,
-        extra_filter=dsl.Q("term", id=id_),
-    )
-
-    for h in results.hits:
-        return h.get("props", {})
-
-    raise VocabularyItemNotFoundError(
-        f"The '{vocabulary}' vocabulary item '{id_}' was not found."
-    )
+    props = current_rdm_records.vocabulary_props_cache.get(vocabulary, id_)
+    if props is None:
+        raise VocabularyItemNotFoundError(
+            f"The '{vocabulary}' vocabulary item '{id_}' was not found."
+        )
+
+    names = [f[len("props.") :] for f in fields if f.startswith("props.")]
+    return {name: props[name] for name in names if name in props}
 
 
 def get_preferred_identifier(priority, identifiers):
@@ -16,6 +16,7 @@ from invenio_drafts_resources.services.records.components import (
 
 from .access import AccessComponent
 from .custom_fields import CustomFieldsComponent
+from .exports import ExportsComponent
 from .internal_notes import InternalNotesComponent
 from .metadata import MetadataComponent
 from .pids import ParentPIDsComponent, PIDsComponent
@@ -49,6 +50,7 @@ __all__ = (
     "AccessComponent",
     "ContentModerationComponent",
     "CustomFieldsComponent",
+    "ExportsComponent",
     "MetadataComponent",
     "PIDsComponent",
     "ParentPIDsComponent",
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""RDM service component for the materialized export formats."""
+
+from invenio_drafts_resources.services.records.components import ServiceComponent
+from invenio_records_resources.services.uow import TaskOp
+
+from ..tasks import render_record_exports
+
+
+class ExportsComponent(ServiceComponent):
+    """Service component rendering the export formats of the published records.
+
+    The formats are rendered after commit, whenever the published record
+    changes. The exports are stored with the revisions of the record and of
+    its parent, and are only served while both are current: after a change
+    of the parent alone (e.g. a community inclusion), the record is
+    serialized on request until the record changes and its exports are
+    rendered again.
+    """
+
+    def _render(self, record):
+        """Render the exports of a record after commit."""
+        self.uow.register(TaskOp(render_record_exports, record["id"]))
+
+    def publish(self, identity, draft=None, record=None):
+        """Publish handler."""
+        self._render(record)
+
+    def lift_embargo(self, identity, draft=None, record=None):
+        """Lift embargo handler."""
+        self._render(record)
+
+    def delete_record(self, identity, data=None, record=None, **kwargs):
+        """Delete record handler."""
+        self._render(record)
+
+    def restore_record(self, identity, record=None, **kwargs):
+        """Restore record handler."""
+        self._render(record)
@@ -16,10 +16,9 @@ from flask import current_app
 from invenio_drafts_resources.services.records.components import ServiceComponent
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
-from invenio_records_resources.services.uow import TaskOp
 
 from ..errors import ValidationErrorWithMessageAsList
-from ..pids.tasks import register_or_update_pid
+from ..pids.uow import PIDOutboxOp, VersionsIndexInvalidateOp
 
 
 class PIDsComponent(ServiceComponent):
@@ -213,7 +212,7 @@ class PIDsComponent(ServiceComponent):
 
         # Async register/update tasks after transaction commit.
         for scheme in pids.keys():
-            self.uow.register(TaskOp(register_or_update_pid, record["id"], scheme))
+            self.uow.register(PIDOutboxOp(record["id"], scheme))
 
     def new_version(self, identity, draft=None, record=None):
         """A new draft should not have any pids from the previous record."""
@@ -289,11 +288,11 @@ class ParentPIDsComponent(ServiceComponent):
             )
         )
 
+        # The published version changes the versions of the parent DOI
+        self.uow.register(VersionsIndexInvalidateOp(record.parent.id))
         # Async register/update tasks after transaction commit.
         for scheme in pids.keys():
-            self.uow.register(
-                TaskOp(register_or_update_pid, record["id"], scheme, parent=True)
-            )
+            self.uow.register(PIDOutboxOp(record["id"], scheme, parent=True))
 
     def delete_record(self, identity, data=None, record=None, uow=None):
         """Process pids on delete record."""
@@ -304,19 +303,17 @@ class ParentPIDsComponent(ServiceComponent):
                 parent_pids, soft_delete=True
             )
 
+        self.uow.register(VersionsIndexInvalidateOp(record.parent.id))
         # Async register/update tasks after transaction commit.
         for scheme in parent_pids.keys():
-            self.uow.register(
-                TaskOp(register_or_update_pid, record["id"], scheme, parent=True)
-            )
+            self.uow.register(PIDOutboxOp(record["id"], scheme, parent=True))
 
     def restore_record(self, identity, record=None, uow=None):
         """Restore previously invalidated pids."""
         parent_pids = copy(record.parent.get("pids", {}))
         self.service.pids.parent_pid_manager.restore_all(parent_pids)
 
+        self.uow.register(VersionsIndexInvalidateOp(record.parent.id))
         # Async register/update tasks after transaction commit.
         for scheme in parent_pids.keys():
-            self.uow.register(
-                TaskOp(register_or_update_pid, record["id"], scheme, parent=True)
-            )
+            self.uow.register(PIDOutboxOp(record["id"], scheme, parent=True))
@@ -32,7 +32,6 @@ from invenio_drafts_resources.services.records.config import (
     is_record,
 )
 from invenio_drafts_resources.services.records.search_params import AllVersionsParam
-from invenio_indexer.api import RecordIndexer
 from invenio_records_resources.services import (
     ConditionalLink,
     FileServiceConfig,
@@ -72,6 +71,7 @@ from werkzeug.local import LocalProxy
 
 from invenio_rdm_records.records.processors.tiles import TilesProcessor
 
+from ..oaiserver.indexer import OAISetsRecordIndexer
 from ..records import RDMDraft, RDMRecord
 from ..records.api import RDMDraftMediaFiles, RDMRecordMediaFiles
 from . import facets
@@ -85,6 +85,7 @@ from .permissions import RDMRecordPermissionPolicy
 from .result_items import GrantItem, GrantList, SecretLinkItem, SecretLinkList
 from .results import RDMRecordList
 from .schemas import RDMParentSchema, RDMRecordSchema
+from .schemas.citations import CitationsSchema
 from .schemas.community_records import CommunityRecordsSchema
 from .schemas.parent.access import AccessSettingsSchema
 from .schemas.parent.access import Grant as GrantSchema
@@ -269,7 +270,7 @@ class RDMRecordCommunitiesConfig(ServiceConfig, ConfiguratorMixin):
     schema = RecordCommunitiesSchema
     communities_schema = CommunitiesSchema
 
-    indexer_cls = RecordIndexer
+    indexer_cls = OAISetsRecordIndexer
     indexer_queue_name = service_id
     index_dumper = None
 
@@ -400,6 +401,9 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     record_cls = FromConfig("RDM_RECORD_CLS", default=RDMRecord)
     draft_cls = FromConfig("RDM_DRAFT_CLS", default=RDMDraft)
 
+    # Indexer of the published records, with their OAI-PMH sets
+    indexer_cls = OAISetsRecordIndexer
+
     # Schemas
     schema = FromConfig("RDM_RECORD_SCHEMA", default=RDMRecordSchema)
     schema_parent = RDMParentSchema
@@ -410,6 +414,7 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     schema_request_access = RequestAccessSchema
     schema_tombstone = TombstoneSchema
     schema_quota = QuotaSchema
+    schema_citations = CitationsSchema
 
     # Permission policy
     permission_policy_cls = FromConfig(
@@ -56,6 +56,25 @@ class EmbargoNotLiftedError(RDMRecordsException):
         )
 
 
+class ExportLimitError(RDMRecordsException):
+    """Too many records match a search export."""
+
+    def __init__(self, total, limit):
+        """Initialise error."""
+        self.total = total
+        self.limit = limit
+
+    @property
+    def description(self):
+        """Exception's description."""
+        return _(
+            "The search matches %(total)s records, but at most %(limit)s records "
+            "can be exported at once. Please narrow down the search.",
+            total=self.total,
+            limit=self.limit,
+        )
+
+
 class ReviewException(RDMRecordsException):
     """Base class for review errors."""
 
@@ -107,6 +107,9 @@ class RDMRecordPermissionPolicy(RecordPermissionPolicy):
     # Allow searching of records
     can_search = can_all
 
+    # Allow exporting all the records matching a search in a single response
+    can_search_export = can_authenticated
+
     # Allow reading metadata of a record
     can_read = [
         IfRestricted("record", then_=can_view, else_=can_all),
@@ -8,12 +8,12 @@
 
 """RDM PIDs Service."""
 
-from flask.globals import current_app
 from invenio_i18n import lazy_gettext as _
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PIDStatus
 from marshmallow import ValidationError
 
+from ...proxies import current_rdm_records
 from ..errors import ValidationErrorWithMessageAsList
 from .errors import PIDSchemeNotSupportedError, ProviderNotSupportedError
 
@@ -68,15 +68,13 @@ class PIDManager:
     def _validate_identifiers(self, pids, errors):
         """Validate and normalize identifiers."""
         # TODO: Refactor to get it injected instead.
-        conf = current_app.config["RDM_PERSISTENT_IDENTIFIERS"]
+        schemes = current_rdm_records.schemes
 
         identifiers = []
         for scheme, pids_attrs in pids.items():
             identifier = pids_attrs.get("identifier")
 
-            validator = conf.get(scheme, {}).get("validator", lambda x: True)
-            normalizer = conf.get(scheme, {}).get("normalizer")
-            label = conf.get(scheme, {}).get("label", scheme)
+            validator, normalizer, label = schemes.pid_scheme(scheme)
 
             if identifier:
                 if not validator(identifier):
@@ -196,7 +194,7 @@ class PIDManager:
 
         return result
 
-    def update(self, record, scheme, url=None):
+    def update(self, record, scheme, url=None, **kwargs):
         """Update a registered PID on a remote provider."""
         pid_attrs = record.pids.get(scheme, None)
         if not pid_attrs:
@@ -208,7 +206,7 @@ class PIDManager:
         provider = self._get_provider(scheme, pid_attrs["provider"])
         pid = provider.get(pid_attrs["identifier"])
 
-        provider.update(pid, record=record, url=url)
+        provider.update(pid, record=record, url=url, **kwargs)
 
     def reserve(self, draft, scheme, identifier, provider_name):
         """Reserve a PID."""
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Circuit breaker for the requests to remote PID providers."""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """Stop calling a remote service after consecutive failures.
+
+    The circuit opens after ``threshold`` consecutive failures. While it is
+    open no request should be sent; after ``reset_timeout`` seconds it becomes
+    half-open and lets a single trial request through, which closes the
+    circuit if it succeeds or opens it again otherwise. If the trial request
+    neither succeeds nor fails within ``reset_timeout`` seconds, another one is
+    let through.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, name, threshold=5, reset_timeout=60, clock=time.monotonic):
+        """Constructor."""
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trial_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Current state of the circuit."""
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self):
+        """Whether a request can be sent, claiming the trial if half-open."""
+        with self._lock:
+            state = self.state
+            if state != self.HALF_OPEN:
+                return state == self.CLOSED
+            now = self.clock()
+            if self.trial_at is not None and now - self.trial_at < self.reset_timeout:
+                return False
+            self.trial_at = now
+            return True
+
+    def record_success(self):
+        """Record a successful request, closing the circuit.
+
+        :returns: ``True`` if the circuit was closed by this success.
+        """
+        with self._lock:
+            closed = self.opened_at is not None
+            self.failures = 0
+            self.opened_at = None
+            self.trial_at = None
+            return closed
+
+    def record_failure(self):
+        """Record a failed request, possibly opening the circuit.
+
+        :returns: ``True`` if the circuit was opened by this failure.
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.opened_at is None and self.failures >= self.threshold
+            ):
+                self.opened_at = self.clock()
+                self.trial_at = None
+                return True
+            return False
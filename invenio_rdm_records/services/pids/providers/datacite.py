@@ -9,9 +9,11 @@
 
 """DataCite DOI Provider."""
 
+import hashlib
 import json
+import threading
 import warnings
-from collections import ChainMap
+from collections import ChainMap, Counter
 from json import JSONDecodeError
 
 from datacite import DataCiteRESTClient
@@ -20,14 +22,21 @@ from datacite.errors import (
     DataCiteNoContentError,
     DataCiteNotFoundError,
     DataCiteServerError,
+    HttpError,
 )
 from flask import current_app
 from invenio_i18n import lazy_gettext as _
 from invenio_pidstore.models import PIDStatus
+from werkzeug.utils import import_string
 
+from ....records.models import RDMPIDJournal, RDMPIDOutbox, RDMPIDRemoteState
 from ....resources.serializers import DataCite43JSONSerializer
 from ....utils import ChainObject
+from ..tasks import replay_pid_journal
 from .base import PIDProvider
+from .circuitbreaker import CircuitBreaker
+from .ratelimit import LocalRateLimiter
+from .sessions import PooledDataCiteRESTClient
 
 
 class DataCiteClient:
@@ -39,6 +48,8 @@ class DataCiteClient:
         self._config_prefix = config_prefix or "DATACITE"
         self._config_overrides = config_overrides or {}
         self._api = None
+        self._limiter = None
+        self._breaker = None
 
     def cfgkey(self, key):
         """Generate a configuration key."""
@@ -79,14 +90,49 @@ class DataCiteClient:
         """DataCite REST API client instance."""
         if self._api is None:
             self.check_credentials()
-            self._api = DataCiteRESTClient(
+            args = (
                 self.cfg("username"),
                 self.cfg("password"),
                 self.cfg("prefix"),
                 self.cfg("test_mode", True),
             )
+            kwargs = dict(timeout=self.cfg("http_timeout"))
+            pool_size = self.cfg("http_pool_size", 0)
+            if pool_size:
+                self._api = PooledDataCiteRESTClient(
+                    *args, pool_size=pool_size, **kwargs
+                )
+            else:
+                self._api = DataCiteRESTClient(*args, **kwargs)
         return self._api
 
+    @property
+    def limiter(self):
+        """Rate limiter of the requests to DataCite (``None`` if disabled)."""
+        if self._limiter is None:
+            rate = self.cfg("rate_limit")
+            if not rate:
+                return None
+            limiter_cls = self.cfg("rate_limiter", LocalRateLimiter)
+            if isinstance(limiter_cls, str):
+                limiter_cls = import_string(limiter_cls)
+            self._limiter = limiter_cls(self.name, rate)
+        return self._limiter
+
+    @property
+    def breaker(self):
+        """Circuit breaker of the requests to DataCite (``None`` if disabled)."""
+        if self._breaker is None:
+            threshold = self.cfg("circuit_breaker_threshold")
+            if not threshold:
+                return None
+            self._breaker = CircuitBreaker(
+                self.name,
+                threshold=threshold,
+                reset_timeout=self.cfg("circuit_breaker_reset_timeout", 60),
+            )
+        return self._breaker
+
 
 class DataCitePIDProvider(PIDProvider):
     """DataCite Provider class.
@@ -113,6 +159,117 @@ class DataCitePIDProvider(PIDProvider):
             default_status=default_status,
         )
         self.serializer = serializer or DataCite43JSONSerializer()
+        # per-process counters of the remote operations (e.g. skipped updates)
+        self.counters = Counter()
+        self._counters_lock = threading.Lock()
+
+    def _count(self, key):
+        """Increment a counter, which can be shared by concurrent threads."""
+        with self._counters_lock:
+            self.counters[key] += 1
+
+    @staticmethod
+    def _payload_hash(doc, url=None):
+        """Compute the hash of a DOI payload.
+
+        The ``event`` of the payload is left out, as it is only set on updates,
+        so that an update is compared with the registration as well.
+        """
+        doc = {key: value for key, value in doc.items() if key != "event"}
+        payload = json.dumps(
+            {"metadata": doc, "url": url},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _api_call(self, method, *args, rate_limit=True, **kwargs):
+        """Call the DataCite REST API within the rate limit of the client.
+
+        :param rate_limit: whether to wait for the rate limiter of the client,
+            ``False`` for callers which limit the rate of their requests.
+        """
+        limiter = self.client.limiter if rate_limit else None
+        breaker = self.client.breaker
+        if limiter:
+            limiter.acquire()
+        try:
+            result = getattr(self.client.api, method)(*args, **kwargs)
+        except DataCiteServerError:
+            # 429 (too many requests) and 5xx responses
+            self._count("throttled")
+            if limiter:
+                limiter.penalize()
+            if breaker and breaker.record_failure():
+                self._circuit_opened()
+            raise
+        except HttpError:
+            # DataCite is unreachable
+            if breaker and breaker.record_failure():
+                self._circuit_opened()
+            raise
+        if limiter:
+            limiter.reward()
+        if breaker and breaker.record_success():
+            self._circuit_closed()
+        return result
+
+    def _circuit_opened(self):
+        """Report the opening of the circuit breaker."""
+        self._count("circuit_opened")
+        current_app.logger.warning(
+            "Too many failed requests to DataCite, operations are journaled for "
+            f"{self.client.breaker.reset_timeout}s."
+        )
+
+    def _circuit_closed(self):
+        """Replay the operations journaled while the circuit breaker was open."""
+        self._count("circuit_closed")
+        current_app.logger.info(
+            "DataCite is available again, replaying the journaled operations."
+        )
+        replay_pid_journal.delay()
+
+    def _is_unavailable(self):
+        """Whether the circuit breaker prevents requests to DataCite."""
+        breaker = self.client.breaker
+        return breaker is not None and not breaker.allow()
+
+    def _journal(self, pid, operation, record=None):
+        """Defer an operation until DataCite is available again."""
+        recid, parent = None, False
+        if record is not None:
+            recid, parent = self._record_ref(record)
+        RDMPIDJournal.add(pid.id, self.name, operation, record_pid=recid, parent=parent)
+        self._count("journaled")
+
+    @staticmethod
+    def _record_ref(record):
+        """Get the ``recid`` of a record and whether the PID is of its parent."""
+        if isinstance(record, ChainObject):
+            return record._child["id"], True
+        return record["id"], False
+
+    def _retry_later(self, pid, record):
+        """Re-queue the registration/update of a throttled PID in the outbox."""
+        recid, parent = self._record_ref(record)
+        config = current_app.config
+        entry = RDMPIDOutbox.retry(
+            recid,
+            self.pid_type,
+            parent=parent,
+            max_attempts=config.get("RDM_PIDS_OUTBOX_MAX_ATTEMPTS"),
+            delay=config.get("RDM_PIDS_OUTBOX_RETRY_DELAY", 60),
+            max_delay=config.get("RDM_PIDS_OUTBOX_RETRY_MAX_DELAY", 3600),
+        )
+        if entry is None:
+            self._count("dropped")
+            current_app.logger.error(
+                f"Giving up on DataCite operation for {pid.pid_value}."
+            )
+        else:
+            self._count("requeued")
 
     @staticmethod
     def _log_errors(exception):
@@ -168,6 +325,10 @@ class DataCitePIDProvider(PIDProvider):
         elif record["access"]["record"] == "restricted":
             return False
 
+        if self._is_unavailable():
+            self._journal(pid, "register", record)
+            return False
+
         local_success = super().register(pid)
         if not local_success:
             return False
@@ -175,22 +336,27 @@ class DataCitePIDProvider(PIDProvider):
         try:
             doc = self.serializer.dump_obj(record)
             url = kwargs["url"]
-            self.client.api.public_doi(metadata=doc, url=url, doi=pid.pid_value)
+            self._api_call("public_doi", metadata=doc, url=url, doi=pid.pid_value)
+            RDMPIDRemoteState.set_hash(pid.id, self._payload_hash(doc, url))
             return True
         except DataCiteError as e:
             current_app.logger.warning(
                 f"DataCite provider error when registering DOI for {pid.pid_value}"
             )
             self._log_errors(e)
+            if isinstance(e, DataCiteServerError):
+                self._retry_later(pid, record)
 
             return False
 
-    def update(self, pid, record, url=None, **kwargs):
+    def update(self, pid, record, url=None, force=False, **kwargs):
         """Update metadata associated with a DOI.
 
-        This can be called before/after a DOI is registered.
+        This can be called before/after a DOI is registered. The remote call is
+        skipped if the payload is the same as the last one successfully sent.
         :param pid: the PID to register.
         :param record: the record metadata for the DOI.
+        :param force: send the update even if the payload has not changed.
         :returns: `True` if is updated successfully.
         """
         hide = False
@@ -200,20 +366,40 @@ class DataCitePIDProvider(PIDProvider):
         elif record["access"]["record"] == "restricted":
             hide = True
 
+        if self._is_unavailable():
+            self._journal(pid, "hide" if hide else "update", record)
+            return False
+
         try:
             if hide:
-                self.client.api.hide_doi(doi=pid.pid_value)
+                self._api_call("hide_doi", doi=pid.pid_value)
+                RDMPIDRemoteState.clear(pid.id)
             else:
                 doc = self.serializer.dump_obj(record)
                 doc["event"] = (
                     "publish"  # Required for DataCite to make the DOI findable in the case it was hidden before. See https://support.datacite.org/docs/how-do-i-make-a-findable-doi-with-the-rest-api
                 )
-                self.client.api.update_doi(metadata=doc, doi=pid.pid_value, url=url)
+                payload_hash = self._payload_hash(doc, url)
+                skip_unchanged = self.client.cfg("skip_unchanged_updates", True)
+                if (
+                    skip_unchanged
+                    and not force
+                    and not pid.is_deleted()
+                    and RDMPIDRemoteState.get_hash(pid.id) == payload_hash
+                ):
+                    self._count("updates_skipped")
+                    return True
+
+                self._api_call("update_doi", metadata=doc, doi=pid.pid_value, url=url)
+                RDMPIDRemoteState.set_hash(pid.id, payload_hash)
+                self._count("updates_sent")
         except DataCiteError as e:
             current_app.logger.warning(
                 f"DataCite provider error when updating DOI for {pid.pid_value}"
             )
             self._log_errors(e)
+            if isinstance(e, DataCiteServerError):
+                self._retry_later(pid, record)
 
             return False
 
@@ -237,11 +423,17 @@ class DataCitePIDProvider(PIDProvider):
         Otherwise, also it's deleted also remotely.
         :returns: `True` if is deleted successfully.
         """
+        if self._is_unavailable() and (pid.is_reserved() or pid.is_registered()):
+            self._journal(pid, "delete" if pid.is_reserved() else "hide")
+            RDMPIDRemoteState.clear(pid.id)
+            return super().delete(pid, **kwargs)
+
         try:
             if pid.is_reserved():  # Delete only works for draft DOIs
-                self.client.api.delete_doi(pid.pid_value)
+                self._api_call("delete_doi", pid.pid_value)
             elif pid.is_registered():
-                self.client.api.hide_doi(pid.pid_value)
+                self._api_call("hide_doi", pid.pid_value)
+            RDMPIDRemoteState.clear(pid.id)
         except DataCiteError as e:
             current_app.logger.warning(
                 f"DataCite provider error when deleting DOI for {pid.pid_value}"
@@ -252,6 +444,19 @@ class DataCitePIDProvider(PIDProvider):
 
         return super().delete(pid, **kwargs)
 
+    def replay(self, pid, operation):
+        """Send a journaled operation that is not bound to a record.
+
+        :returns: `True` if the operation was sent.
+        """
+        if self._is_unavailable():
+            return False
+        if operation == "delete":
+            self._api_call("delete_doi", pid.pid_value)
+        elif operation == "hide":
+            self._api_call("hide_doi", pid.pid_value)
+        return True
+
     def validate(self, record, identifier=None, provider=None, **kwargs):
         """Validate the attributes of the identifier.
 
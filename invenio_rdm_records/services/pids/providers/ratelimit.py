@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Adaptive rate limiters for the requests to remote PID providers.
+
+The limiters follow an additive-increase/multiplicative-decrease policy: every
+successful request raises the allowed rate by a small step up to the maximum,
+while every throttled request (HTTP 429 or 5xx) divides it and pauses all the
+requests for a cool-down period.
+"""
+
+import threading
+import time
+
+from flask import current_app
+
+
+class LocalRateLimiter:
+    """Adaptive rate limiter shared by the threads of a process.
+
+    :param rate: maximum (and initial) number of requests per second.
+    :param min_rate: lower bound of the rate when throttled.
+    :param increase: rate added after each successful request.
+    :param decrease: factor applied to the rate when throttled.
+    """
+
+    def __init__(self, name, rate, min_rate=0.5, increase=0.1, decrease=0.5):
+        """Constructor."""
+        self.name = name
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self._rate = rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """Current number of allowed requests per second."""
+        return self._rate
+
+    def reserve(self, now):
+        """Reserve the next request slot, returns the time to wait for it."""
+        with self._lock:
+            slot = max(now, self._next)
+            self._next = slot + 1.0 / self._rate
+            return slot - now
+
+    def acquire(self):
+        """Block until the next request is allowed."""
+        delay = self.reserve(time.time())
+        if delay > 0:
+            time.sleep(delay)
+
+    def reward(self):
+        """Record a successful request."""
+        with self._lock:
+            self._rate = min(self.max_rate, self._rate + self.increase)
+
+    def penalize(self, cooldown=None):
+        """Record a throttled request."""
+        with self._lock:
+            self._rate = max(self.min_rate, self._rate * self.decrease)
+            cooldown = cooldown if cooldown is not None else 1.0 / self._rate
+            self._next = max(self._next, time.time() + cooldown)
+
+
+class RedisRateLimiter(LocalRateLimiter):
+    """Adaptive rate limiter shared by all processes through Redis.
+
+    The state is stored in a Redis hash and updated by Lua scripts, so that all
+    the workers using the same client share the same request schedule.
+    """
+
+    RESERVE = """
+        local rate = tonumber(redis.call('HGET', KEYS[1], 'rate') or ARGV[2])
+        local next = tonumber(redis.call('HGET', KEYS[1], 'next') or 0)
+        local now = tonumber(ARGV[1])
+        local slot = math.max(now, next)
+        redis.call('HSET', KEYS[1], 'rate', rate, 'next', slot + 1 / rate)
+        redis.call('EXPIRE', KEYS[1], 3600)
+        return tostring(slot - now)
+    """
+
+    UPDATE_RATE = """
+        local rate = tonumber(redis.call('HGET', KEYS[1], 'rate') or ARGV[1])
+        rate = rate * tonumber(ARGV[2]) + tonumber(ARGV[3])
+        rate = math.max(tonumber(ARGV[4]), math.min(tonumber(ARGV[1]), rate))
+        redis.call('HSET', KEYS[1], 'rate', rate)
+        if ARGV[5] ~= '' then
+            local next = tonumber(redis.call('HGET', KEYS[1], 'next') or 0)
+            local cooldown = ARGV[5] == 'auto' and 1 / rate or tonumber(ARGV[5])
+            local until_ = tonumber(ARGV[6]) + cooldown
+            redis.call('HSET', KEYS[1], 'next', math.max(next, until_))
+        end
+        redis.call('EXPIRE', KEYS[1], 3600)
+        return tostring(rate)
+    """
+
+    def __init__(self, name, rate, redis_url=None, **kwargs):
+        """Constructor."""
+        # redis is only required by this limiter
+        from redis import StrictRedis
+
+        super().__init__(name, rate, **kwargs)
+        redis_url = redis_url or current_app.config["CACHE_REDIS_URL"]
+        self.redis = StrictRedis.from_url(redis_url)
+        self.key = f"rdm:pids:ratelimit:{name}"
+        self._reserve = self.redis.register_script(self.RESERVE)
+        self._update_rate = self.redis.register_script(self.UPDATE_RATE)
+
+    @property
+    def rate(self):
+        """Current number of allowed requests per second."""
+        rate = self.redis.hget(self.key, "rate")
+        return float(rate) if rate is not None else self.max_rate
+
+    def reserve(self, now):
+        """Reserve the next request slot, returns the time to wait for it."""
+        return float(self._reserve(keys=[self.key], args=[now, self.max_rate]))
+
+    def reward(self):
+        """Record a successful request."""
+        self._update_rate(
+            keys=[self.key],
+            args=[self.max_rate, 1, self.increase, self.min_rate, "", 0],
+        )
+
+    def penalize(self, cooldown=None):
+        """Record a throttled request."""
+        self._update_rate(
+            keys=[self.key],
+            args=[
+                self.max_rate,
+                self.decrease,
+                0,
+                self.min_rate,
+                "auto" if cooldown is None else cooldown,
+                time.time(),
+            ],
+        )
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Pooled, keep-alive HTTP sessions for the DataCite REST API."""
+
+import os
+import ssl
+import threading
+
+import requests
+from datacite import DataCiteRESTClient
+from datacite.errors import HttpError
+from datacite.request import DataCiteRequest
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from requests.exceptions import RequestException
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _reset_sessions():
+    """Drop all sessions (their connections must not be shared across processes)."""
+    global _sessions_lock
+    _sessions.clear()
+    _sessions_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sessions)
+
+
+def get_session(base_url, pool_size):
+    """Get the process-wide session for a base URL.
+
+    The session keeps up to ``pool_size`` connections alive, so that subsequent
+    requests do not pay for a new TCP connection and TLS handshake.
+    """
+    key = (base_url, pool_size)
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount(base_url, adapter)
+                _sessions[key] = session
+    return session
+
+
+def close_sessions():
+    """Close all the sessions of the current process."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+class PooledDataCiteRequest(DataCiteRequest):
+    """DataCite request sent through a pooled session."""
+
+    def __init__(self, session, **kwargs):
+        """Constructor."""
+        super().__init__(**kwargs)
+        self.session = session
+
+    def request(self, url, method="GET", body=None, params=None, headers=None):
+        """Make a request."""
+        params = params or {}
+        headers = headers or {}
+
+        self.data = None
+        self.code = None
+
+        if self.default_params:
+            params.update(self.default_params)
+
+        if self.base_url:
+            url = self.base_url + url
+
+        if body and isinstance(body, str):
+            body = body.encode("utf-8")
+
+        kwargs = dict(
+            auth=HTTPBasicAuth(self.username, self.password),
+            params=params,
+            headers=headers,
+        )
+        if method in ("POST", "PUT"):
+            kwargs["data"] = body
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+
+        try:
+            return self.session.request(method, url, **kwargs)
+        except RequestException as e:
+            raise HttpError(e)
+        except ssl.SSLError as e:
+            raise HttpError(e)
+
+
+class PooledDataCiteRESTClient(DataCiteRESTClient):
+    """DataCite REST API client reusing the connections of a per-process pool."""
+
+    def __init__(self, *args, pool_size=10, **kwargs):
+        """Constructor."""
+        super().__init__(*args, **kwargs)
+        self.pool_size = pool_size
+
+    def _create_request(self):
+        """Create a new Request object."""
+        return PooledDataCiteRequest(
+            get_session(self.api_url, self.pool_size),
+            base_url=self.api_url,
+            username=self.username,
+            password=self.password,
+            timeout=self.timeout,
+        )
@@ -7,6 +7,8 @@
 
 """RDM PIDs Service."""
 
+from flask import current_app
+from invenio_db import db
 from invenio_drafts_resources.services.records import RecordService
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PersistentIdentifier
@@ -18,8 +20,11 @@ from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
 from invenio_requests.services.results import EntityResolverExpandableField
 from sqlalchemy.orm.exc import NoResultFound
 
+from ...records.models import RDMPIDJournal, RDMPIDOutbox
 from ...utils import ChainObject
 from ..results import ParentCommunitiesExpandableField
+from .sync import BulkPIDSync
+from .uow import PIDOutboxOp, VersionsIndexInvalidateOp
 
 
 class PIDsService(RecordService):
@@ -156,22 +161,8 @@ class PIDsService(RecordService):
             expand=expand,
         )
 
-    @unit_of_work()
-    def register_or_update(
-        self,
-        identity,
-        id_,
-        scheme,
-        parent=False,
-        uow=None,
-        expand=False,
-    ):
-        """Register or update a PID of a record.
-
-        If the PID has already been register it updates the remote.
-        """
-        record = self.record_cls.pid.resolve(id_, registered_only=False)
-
+    def _pid_record(self, record, parent=False):
+        """Get the record holding the PIDs and its PID manager."""
         if parent:
             # We need the latest record version for the metadata of the parent
             if not record.versions.is_latest:
@@ -187,16 +178,11 @@ class PIDsService(RecordService):
                     "_child": record,
                 },
             )
-            pid_manager = self.parent_pid_manager
-        else:
-            pid_record = record
-            pid_manager = self.pid_manager
+            return pid_record, self.parent_pid_manager
+        return record, self.pid_manager
 
-        # no need to validate since the record class was already published
-        pid_attrs = pid_record.pids.get(scheme)
-        pid = pid_manager.read(scheme, pid_attrs["identifier"], pid_attrs["provider"])
-
-        # Determine landing page (use scheme specific if available)
+    def _pid_landing_url(self, identity, record, scheme, parent=False):
+        """Determine landing page (use scheme specific if available)."""
         links = self.links_item_tpl.expand(identity, record)
         link_prefix = "parent" if parent else "self"
         link_choices = [
@@ -205,8 +191,31 @@ class PIDsService(RecordService):
         ]
         for link_id in link_choices:
             if link_id in links:
-                url = links[link_id]
-                break
+                return links[link_id]
+
+    @unit_of_work()
+    def register_or_update(
+        self,
+        identity,
+        id_,
+        scheme,
+        parent=False,
+        uow=None,
+        expand=False,
+    ):
+        """Register or update a PID of a record.
+
+        If the PID has already been register it updates the remote.
+        """
+        record = self.record_cls.pid.resolve(id_, registered_only=False)
+
+        pid_record, pid_manager = self._pid_record(record, parent)
+
+        # no need to validate since the record class was already published
+        pid_attrs = pid_record.pids.get(scheme)
+        pid = pid_manager.read(scheme, pid_attrs["identifier"], pid_attrs["provider"])
+
+        url = self._pid_landing_url(identity, record, scheme, parent)
 
         # NOTE: This is not the best place to do this, since we shouldn't be aware of
         #       the fact that the record has a `RelationsField``. However, without
@@ -228,6 +237,11 @@ class PIDsService(RecordService):
         else:
             self.require_permission(identity, "pid_register", record=record)
             pid_manager.register(pid_record, scheme, url=url)
+            if not parent:
+                # only registered PIDs are listed in the versions of the parent
+                uow.register(VersionsIndexInvalidateOp(record.parent.id, scheme))
+                if scheme in record.parent.get("pids", {}):
+                    uow.register(PIDOutboxOp(record["id"], scheme, parent=True))
 
         # draft and index do not need commit/refresh
 
@@ -240,6 +254,133 @@ class PIDsService(RecordService):
             expand=expand,
         )
 
+    def dispatch_outbox(self, identity, limit=None):
+        """Register or update the PIDs with pending operations in the outbox.
+
+        All the operations enqueued for the same record, scheme and parent are
+        pushed at once, with the latest state of the record. Failed operations
+        are kept in the outbox and retried with exponential backoff, up to
+        ``RDM_PIDS_OUTBOX_MAX_ATTEMPTS`` times.
+
+        :returns: The number of pushed PIDs.
+        """
+        config = current_app.config
+        limit = limit or config.get("RDM_PIDS_OUTBOX_BATCH_SIZE")
+        retry_kwargs = dict(
+            max_attempts=config.get("RDM_PIDS_OUTBOX_MAX_ATTEMPTS", 5),
+            delay=config.get("RDM_PIDS_OUTBOX_RETRY_DELAY", 60),
+            max_delay=config.get("RDM_PIDS_OUTBOX_RETRY_MAX_DELAY", 3600),
+        )
+
+        # the entries are claimed first, so that a concurrent dispatch does not
+        # push them again
+        pending = [
+            (
+                entry.id,
+                entry.updated,
+                entry.attempts,
+                entry.record_pid,
+                entry.scheme,
+                entry.parent,
+            )
+            for entry in RDMPIDOutbox.claim(
+                limit=limit, timeout=config.get("RDM_PIDS_OUTBOX_CLAIM_TIMEOUT", 600)
+            )
+        ]
+        db.session.commit()
+        pushed = 0
+        for entry_id, updated, attempts, record_pid, scheme, parent in pending:
+            try:
+                self.register_or_update(identity, record_pid, scheme, parent=parent)
+            except Exception:
+                current_app.logger.exception(
+                    f"Failed to register or update PID {scheme} of {record_pid} "
+                    f"(parent: {parent})."
+                )
+                entry = RDMPIDOutbox.retry(
+                    record_pid, scheme, parent=parent, **retry_kwargs
+                )
+                if entry is None:
+                    current_app.logger.error(
+                        f"Dropping PID {scheme} of {record_pid} (parent: "
+                        f"{parent}) from the outbox after "
+                        f"{retry_kwargs['max_attempts']} attempts."
+                    )
+                db.session.commit()
+                continue
+
+            # entries enqueued again during the push stay in the outbox
+            if not RDMPIDOutbox.acknowledge(entry_id, updated):
+                RDMPIDOutbox.release(entry_id, attempts)
+            db.session.commit()
+            pushed += 1
+
+        return pushed
+
+    def replay_journal(self, identity, entry_ids=None):
+        """Replay the operations journaled while the provider was unavailable.
+
+        Entries that fail, or that are journaled again because the provider is
+        still unavailable, are kept for a later replay.
+
+        :returns: The number of replayed operations.
+        """
+        self.require_permission(identity, "pid_manage")
+        pending = [
+            (
+                entry.id,
+                entry.updated,
+                entry.pid_id,
+                entry.provider,
+                entry.operation,
+                entry.record_pid,
+                entry.parent,
+            )
+            for entry in RDMPIDJournal.pending(ids=entry_ids)
+        ]
+        replayed = 0
+        for entry_id, updated, pid_id, provider, operation, recid, parent in pending:
+            pid = db.session.get(PersistentIdentifier, pid_id)
+            if pid is None:
+                # the PID was removed since its operation was journaled
+                RDMPIDJournal.remove(entry_id, updated)
+                db.session.commit()
+                continue
+            try:
+                if recid:
+                    self.register_or_update(
+                        identity, recid, pid.pid_type, parent=parent
+                    )
+                else:
+                    manager = self.parent_pid_manager if parent else self.pid_manager
+                    pid_provider = manager._get_provider(pid.pid_type, provider)
+                    if not pid_provider.replay(pid, operation):
+                        continue
+            except Exception:
+                current_app.logger.exception(
+                    f"Failed to replay {operation} of PID {pid_id}."
+                )
+                continue
+
+            if RDMPIDJournal.remove(entry_id, updated):
+                replayed += 1
+            db.session.commit()
+
+        return replayed
+
+    def bulk_sync(self, identity, scheme="doi", parent=False, limit=None, **kwargs):
+        """Push the metadata of all the registered PIDs of a scheme.
+
+        Meant for mass updates (e.g. after a change of the serializer), see
+        :class:`~invenio_rdm_records.services.pids.sync.BulkPIDSync` for the
+        accepted keyword arguments.
+
+        :returns: A :class:`~invenio_rdm_records.services.pids.sync.SyncSummary`.
+        """
+        self.require_permission(identity, "pid_manage")
+        sync = BulkPIDSync(self, identity, scheme=scheme, parent=parent, **kwargs)
+        return sync.run(limit=limit)
+
     @unit_of_work()
     def discard(self, identity, id_, scheme, provider=None, uow=None, expand=False):
         """Discard a PID for a given draft.
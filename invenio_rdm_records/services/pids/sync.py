@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Bulk synchronization of registered PIDs with their remote provider."""
+
+import asyncio
+import json
+import os
+import statistics
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+from invenio_db import db
+
+from ...records.models import RDMPIDOutbox, RDMPIDRemoteState
+from ...records.systemfields.deletion_status import RecordDeletionStatusEnum
+from .providers import DataCitePIDProvider
+
+SyncItem = namedtuple(
+    "SyncItem", ["recid", "pid_id", "doi", "provider", "doc", "url", "hash"]
+)
+
+
+class TokenBucket:
+    """Asynchronous token bucket rate limiter.
+
+    :param rate: tokens added per second (``None`` or ``0`` disables the limit).
+    :param capacity: maximum number of tokens, i.e. the allowed burst.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        """Constructor."""
+        self.rate = rate
+        self.capacity = capacity or max(1, rate or 1)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.timestamp = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.timestamp) * self.rate
+        )
+        self.timestamp = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        if not self.rate:
+            return
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class SyncCheckpoint:
+    """Progress of a bulk synchronization, persisted as a JSON file.
+
+    The checkpoint is saved after each batch, so that an interrupted
+    synchronization resumes after the last fully processed record.
+    """
+
+    def __init__(self, path=None):
+        """Constructor."""
+        self.path = path
+        self.last_id = None
+        if path and os.path.exists(path):
+            with open(path) as fp:
+                self.last_id = json.load(fp).get("last_id")
+
+    def save(self, last_id):
+        """Store the id of the last processed record."""
+        self.last_id = str(last_id)
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump({"last_id": self.last_id}, fp)
+        os.replace(tmp_path, self.path)
+
+
+class SyncSummary:
+    """Counters and latencies of a bulk synchronization.
+
+    The records are skipped for different reasons, which are counted
+    separately in ``skips``.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.sent = 0
+        self.failed = 0
+        self.skips = Counter()
+        self.latencies = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def skipped(self):
+        """Number of skipped records."""
+        return sum(self.skips.values())
+
+    def add(self, outcome):
+        """Count a ``sent`` or ``failed`` record."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def skip(self, reason):
+        """Count a record skipped for the given reason."""
+        with self._lock:
+            self.skips[reason] += 1
+
+    def add_latency(self, latency):
+        """Record the latency of a request, in seconds."""
+        with self._lock:
+            self.latencies.append(latency)
+
+    def stop(self):
+        """Stop the clock."""
+        self.elapsed = time.perf_counter() - self.started
+
+    @property
+    def throughput(self):
+        """Sent PIDs per second."""
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct):
+        """Request latency in seconds at the given percentile."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+    def __str__(self):
+        """Human readable summary."""
+        p50 = statistics.median(self.latencies) if self.latencies else 0.0
+        skips = ", ".join(f"{reason}: {n}" for reason, n in sorted(self.skips.items()))
+        skipped = f"{self.skipped} ({skips})" if skips else "0"
+        return (
+            f"sent: {self.sent}, skipped: {skipped}, failed: {self.failed} "
+            f"in {self.elapsed:.1f}s ({self.throughput:.1f}/s); latency p50: "
+            f"{p50 * 1000:.0f}ms, p95: {self.percentile(95) * 1000:.0f}ms, "
+            f"p99: {self.percentile(99) * 1000:.0f}ms"
+        )
+
+
+class BulkPIDSync:
+    """Push the metadata of all registered DataCite PIDs of a scheme.
+
+    Record ids are streamed from the database in batches. Each batch is
+    serialized in the application context and its payloads are sent
+    concurrently, with at most ``concurrency`` requests in flight and at most
+    ``rate`` requests per second. The requests themselves are blocking calls
+    through the provider, within its circuit breaker, run in a thread pool.
+    They wait for the rate limiter of the provider only if no ``rate`` is
+    given.
+    """
+
+    def __init__(
+        self,
+        service,
+        identity,
+        scheme="doi",
+        parent=False,
+        batch_size=100,
+        concurrency=8,
+        rate=None,
+        checkpoint=None,
+        force=False,
+    ):
+        """Constructor."""
+        self.service = service
+        self.identity = identity
+        self.scheme = scheme
+        self.parent = parent
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate)
+        # the bucket replaces the rate limiter of the provider
+        self.rate_limit = not rate
+        self.checkpoint = SyncCheckpoint(checkpoint)
+        self.force = force
+        self.summary = SyncSummary()
+
+    def record_ids(self):
+        """Stream the ids of the published records, after the checkpoint."""
+        model_cls = self.service.record_cls.model_cls
+        last_id = self.checkpoint.last_id
+        while True:
+            query = db.session.query(model_cls.id).filter(
+                model_cls.is_deleted == False,  # noqa
+                model_cls.deletion_status == RecordDeletionStatusEnum.PUBLISHED.value,
+            )
+            if last_id is not None:
+                query = query.filter(model_cls.id > last_id)
+            ids = [
+                row.id for row in query.order_by(model_cls.id).limit(self.batch_size)
+            ]
+            if not ids:
+                return
+            yield ids
+            last_id = ids[-1]
+
+    def prepare(self, record):
+        """Serialize the payload of a record, or return ``None`` to skip it.
+
+        The reason of a skip is counted in the summary.
+        """
+        if self.parent and not record.versions.is_latest:
+            self.summary.skip("not latest version")
+            return None
+        pid_record, pid_manager = self.service._pid_record(record, self.parent)
+        pid_attrs = pid_record.pids.get(self.scheme)
+        if not pid_attrs:
+            self.summary.skip("no PID")
+            return None
+        if record["access"]["record"] == "restricted":
+            self.summary.skip("restricted")
+            return None
+
+        provider = pid_manager._get_provider(self.scheme, pid_attrs["provider"])
+        if not isinstance(provider, DataCitePIDProvider):
+            self.summary.skip("other provider")
+            return None
+        pid = provider.get(pid_attrs["identifier"])
+        if not pid.is_registered():
+            self.summary.skip("not registered")
+            return None
+
+        relations = getattr(pid_record, "relations", None)
+        if relations:
+            relations.dereference()
+        url = self.service._pid_landing_url(
+            self.identity, record, self.scheme, self.parent
+        )
+        doc = provider.serializer.dump_obj(pid_record)
+        doc["event"] = "publish"
+        payload_hash = provider._payload_hash(doc, url)
+        if not self.force and RDMPIDRemoteState.get_hash(pid.id) == payload_hash:
+            self.summary.skip("unchanged")
+            return None
+        # the client, its rate limiter and its circuit breaker are lazily
+        # created, before the concurrent requests
+        for attr in ("api", "limiter", "breaker"):
+            getattr(provider.client, attr)
+        return SyncItem(
+            record.pid.pid_value,
+            pid.id,
+            pid.pid_value,
+            provider,
+            doc,
+            url,
+            payload_hash,
+        )
+
+    @staticmethod
+    def _update(app, item, rate_limit=True):
+        """Send one payload through its provider, in a worker thread.
+
+        :returns: ``False`` if the circuit breaker prevents the request.
+        """
+        with app.app_context():
+            if item.provider._is_unavailable():
+                return False
+            item.provider._api_call(
+                "update_doi",
+                metadata=item.doc,
+                doi=item.doi,
+                url=item.url,
+                rate_limit=rate_limit,
+            )
+        return True
+
+    async def _send(self, loop, executor, semaphore, item):
+        """Send one payload, returns whether it succeeded."""
+        app = current_app._get_current_object()
+        async with semaphore:
+            await self.bucket.acquire()
+            start = time.perf_counter()
+            try:
+                sent = await loop.run_in_executor(
+                    executor, self._update, app, item, self.rate_limit
+                )
+                if not sent:
+                    return False
+            except Exception:
+                current_app.logger.exception(f"Failed to update DOI {item.doi}.")
+                return False
+            finally:
+                self.summary.add_latency(time.perf_counter() - start)
+        return True
+
+    async def _send_batch(self, executor, items):
+        """Send the payloads of a batch concurrently."""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(
+            *(self._send(loop, executor, semaphore, item) for item in items)
+        )
+
+    def run(self, limit=None):
+        """Synchronize all the PIDs, or at most ``limit`` records.
+
+        :returns: A :class:`SyncSummary`.
+        """
+        processed = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for ids in self.record_ids():
+                if limit is not None:
+                    ids = ids[: limit - processed]
+                items = []
+                for record in self.service.record_cls.get_records(ids):
+                    item = self.prepare(record)
+                    if item is not None:
+                        items.append(item)
+
+                if items:
+                    results = asyncio.run(self._send_batch(executor, items))
+                    for item, success in zip(items, results):
+                        if success:
+                            RDMPIDRemoteState.set_hash(item.pid_id, item.hash)
+                            item.provider._count("updates_sent")
+                            self.summary.add("sent")
+                        else:
+                            # failures are retried through the outbox, which
+                            # journals them while DataCite is unavailable
+                            RDMPIDOutbox.enqueue(
+                                item.recid, self.scheme, parent=self.parent
+                            )
+                            self.summary.add("failed")
+                    db.session.commit()
+
+                self.checkpoint.save(ids[-1])
+                processed += len(ids)
+                if limit is not None and processed >= limit:
+                    break
+
+        self.summary.stop()
+        return self.summary
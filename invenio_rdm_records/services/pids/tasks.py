@@ -1,16 +1,33 @@
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2021 CERN.
+# Copyright (C) 2021-2024 CERN.
 #
 # Invenio-RDM-Records is free software; you can redistribute it and/or modify
 # it under the terms of the MIT License; see LICENSE file for more details.
 
 """RDM PIDs Service tasks."""
 
+from datetime import datetime, timedelta
+
 from celery import shared_task
+from flask import current_app
 from invenio_access.permissions import system_identity
 
 from ...proxies import current_rdm_records
+from ...records.models import RDMPIDJournal, RDMPIDOutbox
+
+# drains operations left over in the outbox (e.g. of interrupted dispatches or
+# re-queued outside of a dispatch), it has to be added to the beat schedule
+DispatchPIDOutboxTask = {
+    "task": "invenio_rdm_records.services.pids.tasks.dispatch_pid_outbox",
+    "schedule": timedelta(minutes=5),
+}
+
+# replays the operations journaled while the remote provider was unavailable
+ReplayPIDJournalTask = {
+    "task": "invenio_rdm_records.services.pids.tasks.replay_pid_journal",
+    "schedule": timedelta(minutes=1),
+}
 
 
 @shared_task(ignore_result=True)
@@ -22,3 +39,43 @@ def register_or_update_pid(recid, scheme, parent=False):
         scheme=scheme,
         parent=parent,
     )
+
+
+@shared_task(ignore_result=True)
+def dispatch_pid_outbox(limit=None):
+    """Register or update the PIDs with pending operations in the outbox.
+
+    If operations failed or were throttled during the dispatch, another
+    dispatch is scheduled at their next attempt.
+    """
+    started = datetime.utcnow()
+    current_rdm_records.records_service.pids.dispatch_outbox(
+        system_identity, limit=limit
+    )
+    retry_at = RDMPIDOutbox.next_retry(started)
+    if retry_at is not None:
+        countdown = (retry_at - datetime.utcnow()).total_seconds()
+        dispatch_pid_outbox.apply_async(
+            kwargs={"limit": limit}, countdown=max(0, countdown)
+        )
+
+
+@shared_task(ignore_result=True)
+def replay_pid_journal(parallelism=None):
+    """Replay the journaled PID operations, split between parallel tasks."""
+    parallelism = parallelism or current_app.config.get(
+        "RDM_PIDS_JOURNAL_REPLAY_PARALLELISM", 1
+    )
+    entry_ids = [entry.id for entry in RDMPIDJournal.pending()]
+    for i in range(parallelism):
+        chunk = entry_ids[i::parallelism]
+        if chunk:
+            replay_pid_journal_entries.delay(chunk)
+
+
+@shared_task(ignore_result=True)
+def replay_pid_journal_entries(entry_ids):
+    """Replay the given journaled PID operations."""
+    current_rdm_records.records_service.pids.replay_journal(
+        system_identity, entry_ids=entry_ids
+    )
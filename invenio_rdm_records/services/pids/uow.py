@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Unit of work operations for PIDs."""
+
+import weakref
+
+from flask import current_app
+from invenio_records_resources.services.uow import Operation
+
+from ...records.models import RDMPIDOutbox
+from ...records.versions import VersionsIndex
+from .tasks import dispatch_pid_outbox
+
+
+class PIDOutboxOp(Operation):
+    """Enqueue the registration/update of a PID on the remote provider.
+
+    The operation is stored in the PIDs outbox as part of the transaction, and
+    coalesced with any other pending operation for the same record, scheme and
+    parent. After commit, the outbox is dispatched once per unit of work.
+    """
+
+    _dispatching = weakref.WeakSet()
+    """Units of work whose first outbox operation dispatches the outbox."""
+
+    def __init__(self, recid, scheme, parent=False):
+        """Initialize the outbox operation."""
+        super().__init__()
+        self._recid = recid
+        self._scheme = scheme
+        self._parent = parent
+        self._dispatch = False
+
+    def on_register(self, uow):
+        """Add the operation to the outbox."""
+        RDMPIDOutbox.enqueue(self._recid, self._scheme, parent=self._parent)
+        # only the first outbox operation of the unit of work sends the task
+        if uow not in self._dispatching:
+            self._dispatching.add(uow)
+            self._dispatch = True
+
+    def on_post_commit(self, uow):
+        """Dispatch the outbox."""
+        if not self._dispatch:
+            return
+        if not current_app.config.get("RDM_PIDS_OUTBOX_DISPATCH_ON_COMMIT", True):
+            return
+
+        dispatch_pid_outbox.apply_async(
+            countdown=current_app.config.get("RDM_PIDS_OUTBOX_DISPATCH_COUNTDOWN")
+        )
+
+
+class VersionsIndexInvalidateOp(Operation):
+    """Invalidate the cached version PIDs of a parent record.
+
+    The cache is cleared before and after the commit, so that a concurrent read
+    cannot cache the state of the parent before the transaction.
+    """
+
+    def __init__(self, parent_id, pid_type="doi"):
+        """Initialize the invalidate operation."""
+        super().__init__()
+        self._parent_id = parent_id
+        self._pid_type = pid_type
+
+    def on_commit(self, uow):
+        """Invalidate the cache before commit."""
+        VersionsIndex.invalidate(self._parent_id, self._pid_type)
+
+    def on_post_commit(self, uow):
+        """Invalidate the cache after commit."""
+        VersionsIndex.invalidate(self._parent_id, self._pid_type)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Schema of the bulk citations requests."""
+
+from flask import current_app
+from invenio_i18n import lazy_gettext as _
+from marshmallow import Schema, ValidationError, fields, validates, validates_schema
+from marshmallow_utils.fields import SanitizedUnicode
+
+
+class CitationsSchema(Schema):
+    """Records to cite, either by id or by a search query, and the citation style."""
+
+    ids = fields.List(SanitizedUnicode())
+    q = SanitizedUnicode()
+    sort = SanitizedUnicode()
+    size = fields.Integer()
+    style = SanitizedUnicode()
+    locale = SanitizedUnicode()
+
+    def _validate_max_records(self, count, field_name):
+        """Validate the number of records to cite."""
+        max_records = current_app.config["RDM_CITATIONS_MAX_RECORDS"]
+        if count > max_records:
+            raise ValidationError(
+                _("At most {max_records} records can be cited at once.").format(
+                    max_records=max_records
+                ),
+                field_name=field_name,
+            )
+
+    @validates("ids")
+    def validate_ids(self, value):
+        """Validate the number of record ids."""
+        self._validate_max_records(len(value), "ids")
+
+    @validates("size")
+    def validate_size(self, value):
+        """Validate the number of searched records."""
+        if value < 1:
+            raise ValidationError(_("Must be a positive number."), field_name="size")
+        self._validate_max_records(value, "size")
+
+    @validates_schema
+    def validate_ids_or_query(self, data, **kwargs):
+        """Validate that the records are given either by id or by a query."""
+        if "ids" in data and ("q" in data or "sort" in data or "size" in data):
+            raise ValidationError(
+                _("Records can be cited either by id or by query, not both."),
+                field_name="ids",
+            )
@@ -19,13 +19,13 @@ from invenio_accounts.models import User
 from invenio_db import db
 from invenio_drafts_resources.services.records import RecordService
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
+from invenio_i18n.proxies import current_i18n
 from invenio_records_resources.services import LinksTemplate, ServiceSchemaWrapper
 from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_records_resources.services.uow import (
     RecordCommitOp,
     RecordIndexDeleteOp,
     RecordIndexOp,
-    TaskOp,
     unit_of_work,
 )
 from invenio_requests.services.results import EntityResolverExpandableField
@@ -34,13 +34,14 @@ from marshmallow import ValidationError
 from sqlalchemy.exc import NoResultFound
 
 from invenio_rdm_records.records.models import RDMRecordQuota, RDMUserQuota
-from invenio_rdm_records.services.pids.tasks import register_or_update_pid
+from invenio_rdm_records.services.pids.uow import PIDOutboxOp
 
 from ..records.systemfields.deletion_status import RecordDeletionStatusEnum
 from .errors import (
     CommunityRequiredError,
     DeletionStatusException,
     EmbargoNotLiftedError,
+    ExportLimitError,
     RecordDeletedException,
 )
 from .results import ParentCommunitiesExpandableField
@@ -107,6 +108,11 @@ class RDMRecordService(RecordService):
         """Returns the featured data schema instance."""
         return ServiceSchemaWrapper(self, schema=self.config.schema_quota)
 
+    @property
+    def schema_citations(self):
+        """Schema for the bulk citations requests."""
+        return ServiceSchemaWrapper(self, schema=self.config.schema_citations)
+
     #
     # Service methods
     #
@@ -142,7 +148,7 @@ class RDMRecordService(RecordService):
 
         self._pids.pid_manager.create_and_reserve(record)
         uow.register(RecordCommitOp(record, indexer=self.indexer))
-        uow.register(TaskOp(register_or_update_pid, record["id"], "doi", parent=False))
+        uow.register(PIDOutboxOp(record["id"], "doi", parent=False))
         # If the record was previously public it will still keep the parent PID
         if not record.parent.pids:
             self._pids.parent_pid_manager.create_and_reserve(record.parent)
@@ -151,9 +157,7 @@ class RDMRecordService(RecordService):
                     record.parent,
                 )
             )
-            uow.register(
-                TaskOp(register_or_update_pid, record["id"], "doi", parent=True)
-            )
+            uow.register(PIDOutboxOp(record["id"], "doi", parent=True))
 
     def scan_expired_embargos(self, identity):
         """Scan for records with an expired embargo."""
@@ -183,6 +187,26 @@ class RDMRecordService(RecordService):
             links_tpl=self.links_item_tpl,
         )
 
+    def oai_result_items(self, identity, oai_record_sources):
+        """Get the projections of a page of record sources in the OAI server.
+
+        Same as ``oai_result_item`` for a whole page of search hits, hydrated
+        at once: the links of the records are expanded by a single template,
+        sharing its context.
+
+        :returns: the projections of the records, in the order of the sources.
+        """
+        links_tpl = self.links_item_tpl
+        projections = []
+        for source in oai_record_sources:
+            record = self.record_cls.loads(source)
+            projection = self.schema.dump(
+                record, context={"identity": identity, "record": record}
+            )
+            projection["links"] = links_tpl.expand(identity, record)
+            projections.append(projection)
+        return projections
+
     #
     # Deletion workflows
     #
@@ -562,6 +586,71 @@ class RDMRecordService(RecordService):
             expand=expand,
         )
 
+    def scan_export(self, identity, params=None, search_preference=None, **kwargs):
+        """Scan the published records matching a search, for a bulk export.
+
+        Searches matching more than ``RDM_RECORDS_EXPORT_MAX_RESULTS`` records
+        are rejected rather than truncated, as the records of a scan come in
+        no particular order.
+        """
+        self.require_permission(identity, "search_export")
+        limit = current_app.config.get("RDM_RECORDS_EXPORT_MAX_RESULTS")
+        if limit:
+            total = self.search(
+                identity,
+                params={**(params or {}), "page": 1, "size": 1},
+                search_preference=search_preference,
+                **kwargs,
+            ).total
+            if total > limit:
+                raise ExportLimitError(total, limit)
+        return self.scan(
+            identity, params=params, search_preference=search_preference, **kwargs
+        ).hits
+
+    def citations(self, identity, data, search_preference=None):
+        """Read the published records to cite at once.
+
+        The records are given either by id (``ids``, from any version) or by
+        a search query (``q``, ``sort`` and ``size``). They are read with a
+        single search, so that the records that the identity can't read are
+        left out. The hits are returned in the order of the requested ids,
+        along with the citation style and locale, for the resource to render
+        their citations with a single bibliography.
+        """
+        data, errors = self.schema_citations.load(
+            data, context={"identity": identity}, raise_errors=True
+        )
+        style = data.get("style") or current_app.config.get(
+            "RDM_CITATION_STYLES_DEFAULT", "apa"
+        )
+        locale = data.get("locale") or current_i18n.language
+
+        ids = data.get("ids")
+        if ids is not None:
+            params = {"size": len(ids), "allversions": True}
+            extra_filter = dsl.Q("terms", id=ids)
+        else:
+            params = {key: data[key] for key in ("q", "sort", "size") if key in data}
+            extra_filter = None
+
+        hits = []
+        if ids != []:
+            hits = list(
+                self.search(
+                    identity,
+                    params=params,
+                    search_preference=search_preference,
+                    extra_filter=extra_filter,
+                ).hits
+            )
+        if ids:
+            # keep the order of the requested ids
+            order = {id_: index for index, id_ in enumerate(ids)}
+            hits.sort(key=lambda hit: order[hit["id"]])
+
+        return {"style": style, "locale": locale, "hits": hits}
+
     #
     # Base methods, extended with handling of deleted records
     #
@@ -13,7 +13,12 @@ from datetime import datetime, timedelta
 from celery import shared_task
 from celery.schedules import crontab
 from flask import current_app
-from invenio_access.permissions import system_identity
+from flask_principal import AnonymousIdentity
+from invenio_access.permissions import any_user, system_identity
+from invenio_db import db
+from invenio_indexer.tasks import process_bulk_queue
+from invenio_pidstore.errors import PIDDeletedError, PIDDoesNotExistError
+from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_search.engine import dsl
 from invenio_search.proxies import current_search_client
 from invenio_search.utils import prefix_index
@@ -21,8 +26,9 @@ from invenio_stats.bookmark import BookmarkAPI
 
 from invenio_rdm_records.services.signals import post_publish_signal
 
+from ..oaiserver.percolator import percolator_indices, records_query
 from ..proxies import current_rdm_records
-from .errors import EmbargoNotLiftedError
+from .errors import EmbargoNotLiftedError, RecordDeletedException
 
 # runs every hour at minute 10 for a consistent offset from process and aggregate
 # event statistics.
@@ -37,6 +43,9 @@ StatsRDMReindexTask = {
     ],
 }
 
+MAX_OAI_SETS_CLAUSES = 500
+"""Maximum number of sets whose records are reindexed with a query."""
+
 
 @shared_task(ignore_result=True)
 def update_expired_embargos():
@@ -92,3 +101,73 @@ def reindex_stats(stats_indices):
 def send_post_published_signal(pid):
     """Sends a signal for a published record."""
     post_publish_signal.send(current_app._get_current_object(), pid=pid)
+
+
+@shared_task(ignore_result=True)
+def render_record_exports(recid):
+    """Render the configured export formats of a published record.
+
+    The record is read as an anonymous user, so that the exports never hold
+    more than what is publicly visible. The exports of a record that can't be
+    read anymore are removed.
+    """
+    store = current_rdm_records.exports_store
+    if store is None:
+        return
+
+    identity = AnonymousIdentity()
+    identity.provides.add(any_user)
+    try:
+        item = current_rdm_records.records_service.read(identity, recid)
+    except (
+        PermissionDeniedError,
+        RecordDeletedException,
+        PIDDoesNotExistError,
+        PIDDeletedError,
+    ):
+        store.delete(recid)
+    else:
+        record = item.to_dict()
+        parent_revision_id = item._record.parent.revision_id
+        serializers = current_rdm_records.exports_serializers
+        for mimetype, serializer in serializers.items():
+            data = serializer.serialize_object(record)
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            store.set(
+                record["id"],
+                mimetype,
+                record["revision_id"],
+                parent_revision_id,
+                data,
+            )
+    db.session.commit()
+
+
+@shared_task(ignore_result=True)
+def reindex_oai_set_records(specs, search_patterns):
+    """Reindex the records whose OAI-PMH sets may have changed.
+
+    The records which were in the sets and the records matching their search
+    patterns are queued for bulk indexing, and the queue is consumed by
+    ``RDM_OAI_SETS_REINDEX_CONSUMERS`` tasks in parallel.
+    """
+    if not current_app.config["RDM_OAI_PRECOMPUTED_SETS"]:
+        return
+
+    # the set percolators were updated, make them visible to the indexing
+    current_search_client.indices.refresh(index=",".join(percolator_indices()))
+
+    # too many clauses for one query, reindex all the records instead
+    search_query = None
+    if len(specs) + len(search_patterns) <= MAX_OAI_SETS_CLAUSES:
+        search_query = records_query(specs, search_patterns)
+
+    service = current_rdm_records.records_service
+    service.reindex(
+        system_identity,
+        params={"allversions": True},
+        search_query=search_query,
+    )
+    for _ in range(current_app.config["RDM_OAI_SETS_REINDEX_CONSUMERS"]):
+        process_bulk_queue.delay(indexer_name="records")
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks.
+
+Benchmarks are skipped unless the ``RDM_BENCHMARKS`` environment variable is
+set, e.g. ``RDM_BENCHMARKS=1 pytest tests/benchmarks -s``.
+
+To catch regressions in CI, the serializer benchmarks compare their timings
+against a baseline file, see :func:`tests.benchmarks.utils.check_baseline`::
+
+    # on the main branch
+    export RDM_BENCHMARKS=1 RDM_BENCHMARKS_BASELINE=baseline.json
+    RDM_BENCHMARKS_BASELINE_UPDATE=1 pytest tests/benchmarks
+    # on the pull request, fails if 25% slower than the baseline
+    pytest tests/benchmarks
+"""
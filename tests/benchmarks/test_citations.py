@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Citation rendering throughput with the cached styles."""
+
+from unittest import mock
+
+from citeproc import CitationStylesStyle
+from citeproc_styles import get_style_filepath
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.resources.serializers.csl import (
+    get_citation_string,
+    get_citation_strings,
+)
+from tests.benchmarks.utils import benchmark, run
+
+ITERATIONS = 10
+
+PAGE = [
+    {
+        "id": str(i),
+        "type": "dataset",
+        "title": f"InvenioRDM dataset {i}",
+        "author": [{"family": "Nielsen", "given": "Lars Holm"}],
+        "issued": {"date-parts": [[2024]]},
+        "publisher": "InvenioRDM",
+        "DOI": f"10.1234/{i}",
+    }
+    for i in range(25)
+]
+
+
+def render_page(style):
+    """Render a search page record by record."""
+    return [get_citation_string(json, json["id"], style, "en-US") for json in PAGE]
+
+
+@benchmark
+def test_citation_styles_cache(base_app):
+    """Cached styles and batch pages must render faster than parsing per record."""
+    style = get_style_filepath("chicago-author-date")
+
+    with base_app.app_context():
+        batch = run("batch", get_citation_strings, ITERATIONS, PAGE, style, "en-US")
+        cached = run("cached", render_page, ITERATIONS, style)
+
+        styles = current_rdm_records.citation_styles
+        with mock.patch.object(
+            styles,
+            "get",
+            lambda style, locale: CitationStylesStyle(
+                style, locale=locale, validate=False
+            ),
+        ):
+            parsed = run("parsed per record", render_page, ITERATIONS, style)
+
+    assert cached.per_second > parsed.per_second
+    assert batch.per_second > parsed.per_second
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""DataCite client throughput against a local stand-in of the REST API."""
+
+from datacite import DataCiteRESTClient
+
+from invenio_rdm_records.services.pids.providers.sessions import (
+    PooledDataCiteRESTClient,
+    close_sessions,
+)
+from tests.benchmarks.utils import benchmark, run
+from tests.fake_datacite_client import LocalDataCiteServer
+
+ITERATIONS = 500
+
+
+@benchmark
+def test_datacite_client_pooled_vs_unpooled():
+    """Compare DOI updates per second with and without connection pooling."""
+    metadata = {"titles": [{"title": "Benchmark"}]}
+
+    with LocalDataCiteServer() as server:
+        client = DataCiteRESTClient("user", "pass", "10.1234", url=server.url)
+        plain = run("unpooled", client.update_doi, ITERATIONS, "10.1234/b", metadata)
+        plain_connections = server.connections
+
+        client = PooledDataCiteRESTClient(
+            "user", "pass", "10.1234", url=server.url, pool_size=4
+        )
+        pooled = run("pooled", client.update_doi, ITERATIONS, "10.1234/b", metadata)
+        pooled_connections = server.connections - plain_connections
+        close_sessions()
+
+    print(f"connections: unpooled {plain_connections}, pooled {pooled_connections}")
+    assert pooled_connections < plain_connections
+    assert pooled.per_second > plain.per_second
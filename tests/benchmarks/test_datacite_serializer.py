@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""DataCite serialization of records with many identifiers."""
+
+from invenio_access.permissions import system_identity
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.resources.serializers.datacite.schema import (
+    DataCite43Schema,
+    get_scheme_datacite,
+)
+from tests.benchmarks.utils import benchmark, run
+
+IDENTIFIERS = 200
+ITERATIONS = 200
+
+
+@benchmark
+def test_datacite_schema_many_identifiers(running_app, search_clear, minimal_record):
+    """Serialize a record with many (related) identifiers and creator IDs."""
+    service = current_rdm_records.records_service
+    draft = service.create(system_identity, minimal_record)
+    record = service.publish(system_identity, draft.id).to_dict()
+
+    metadata = record["metadata"]
+    metadata["identifiers"] = [
+        (
+            {"identifier": f"10.1234/alt.{i}", "scheme": "doi"}
+            if i % 2
+            else {"identifier": f"https://example.org/{i}", "scheme": "url"}
+        )
+        for i in range(IDENTIFIERS)
+    ]
+    metadata["related_identifiers"] = [
+        {
+            "identifier": f"10.1234/rel.{i}",
+            "scheme": "doi",
+            "relation_type": {"id": "iscitedby"},
+            "resource_type": {"id": "dataset"},
+        }
+        for i in range(IDENTIFIERS)
+    ]
+    metadata["creators"][0]["person_or_org"]["identifiers"] = [
+        {"identifier": "0000-0002-1825-0097", "scheme": "orcid"}
+    ] * IDENTIFIERS
+
+    schema = DataCite43Schema()
+    run("DataCite43Schema.dump", schema.dump, ITERATIONS, record)
+
+    config = running_app.app.config
+    lookups = IDENTIFIERS * ITERATIONS
+
+    def legacy_lookup():
+        for _ in range(lookups):
+            conf = config["RDM_RECORDS_IDENTIFIERS_SCHEMES"]
+            conf.get("doi", {}).get("datacite", "doi")
+
+    def registry_lookup():
+        for _ in range(lookups):
+            get_scheme_datacite("doi", "RDM_RECORDS_IDENTIFIERS_SCHEMES", "doi")
+
+    run(f"{lookups} config lookups", legacy_lookup, 10)
+    run(f"{lookups} registry lookups", registry_lookup, 10)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""DCAT serialization throughput with the shared compiled stylesheet."""
+
+from unittest import mock
+
+from lxml import etree
+from pkg_resources import resource_stream
+
+from invenio_rdm_records.resources.serializers import DCATSerializer
+from tests.benchmarks.utils import benchmark, run
+
+ITERATIONS = 200
+
+DATACITE_RECORD = {
+    "identifiers": [{"identifier": "10.1234/dcat", "identifierType": "DOI"}],
+    "creators": [
+        {
+            "name": "Nielsen, Lars Holm",
+            "nameType": "Personal",
+            "givenName": "Lars Holm",
+            "familyName": "Nielsen",
+            "nameIdentifiers": [
+                {
+                    "nameIdentifier": "0000-0001-8135-3489",
+                    "nameIdentifierScheme": "ORCID",
+                }
+            ],
+        }
+    ],
+    "titles": [{"title": "InvenioRDM"}],
+    "publisher": "InvenioRDM",
+    "publicationYear": "2024",
+    "types": {"resourceTypeGeneral": "Dataset", "resourceType": "Dataset"},
+    "descriptions": [{"description": "A dataset.", "descriptionType": "Abstract"}],
+    "schemaVersion": "http://datacite.org/schema/kernel-4",
+}
+
+
+def compile_xslt():
+    """Read and compile the stylesheet, like every new serializer used to."""
+    with resource_stream(
+        "invenio_rdm_records.resources.serializers", "dcat/datacite-to-dcat-ap.xsl"
+    ) as f:
+        return etree.XSLT(etree.XML(f.read()))
+
+
+@benchmark
+def test_dcat_shared_xslt():
+    """The shared stylesheet must keep DCAT well above per-record compilation."""
+    serializer = DCATSerializer()
+    shared = run(
+        "shared XSLT", serializer.transform_with_xslt, ITERATIONS, DATACITE_RECORD
+    )
+
+    with mock.patch.object(
+        DCATSerializer, "xslt_transform_func", property(lambda self: compile_xslt())
+    ):
+        compiled = run(
+            "compiled per record",
+            serializer.transform_with_xslt,
+            ITERATIONS,
+            DATACITE_RECORD,
+        )
+
+    assert shared.per_second > 2 * compiled.per_second
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""OAI-PMH ListRecords throughput with direct lxml serialization."""
+
+from unittest import mock
+
+from flask import g, url_for
+from invenio_access.permissions import system_identity
+from lxml import etree
+
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.api import RDMRecord
+from invenio_rdm_records.resources.serializers import DCATSerializer, MARCXMLSerializer
+from tests.benchmarks.utils import benchmark, run
+
+RECORDS = 100
+PAGES = 20
+
+
+def legacy_marcxml_etree(pid, record):
+    """MARCXML serialized to a string and parsed back, for comparison."""
+    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
+    return etree.fromstring(
+        MARCXMLSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
+    )
+
+
+def legacy_dcat_etree(pid, record):
+    """DCAT serialized to a string and parsed back, for comparison."""
+    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
+    return etree.fromstring(
+        DCATSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
+    )
+
+
+@benchmark
+def test_oai_list_records(running_app, client, search_clear, minimal_record):
+    """Compare ListRecords pages per second before and after."""
+    service = current_rdm_records_service
+    for _ in range(RECORDS):
+        draft = service.create(system_identity, minimal_record)
+        service.publish(system_identity, draft.id)
+    RDMRecord.index.refresh()
+
+    formats = running_app.app.config["OAISERVER_METADATA_FORMATS"]
+    legacy_formats = {
+        "legacy_marcxml": {
+            **formats["marcxml"],
+            "serializer": "tests.benchmarks.test_oai:legacy_marcxml_etree",
+        },
+        "legacy_dcat": {
+            **formats["dcat"],
+            "serializer": "tests.benchmarks.test_oai:legacy_dcat_etree",
+        },
+    }
+
+    def list_records(prefix):
+        url = url_for(
+            "invenio_oaiserver.response", verb="ListRecords", metadataPrefix=prefix
+        )
+        assert client.get(url).status_code == 200
+
+    with mock.patch.dict(formats, legacy_formats):
+        for prefix in ("marcxml", "dcat"):
+            before = run(
+                f"{prefix} (string round-trip)", list_records, PAGES, f"legacy_{prefix}"
+            )
+            after = run(f"{prefix} (lxml tree)", list_records, PAGES, prefix)
+            print(f"{prefix}: {after.per_second / before.per_second:.2f}x pages/s")
+        for prefix in ("oai_dc", "datacite", "oai_datacite"):
+            run(prefix, list_records, PAGES, prefix)
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Full OAI-PMH harvests of synthetic public records, per metadata prefix.
+
+The records are seeded in the database only, and the pages of the lists are
+served by an in-memory stand-in of the records index, so that the harvests
+measure the OAI-PMH server and the serializers without a search cluster.
+The number of records is set with ``RDM_BENCHMARKS_OAI_RECORDS``.
+"""
+
+import bisect
+import os
+from unittest import mock
+
+import pytest
+from flask import current_app, url_for
+from invenio_vocabularies.records.api import Vocabulary
+from invenio_vocabularies.records.models import VocabularyType
+from lxml import etree
+
+from invenio_rdm_records import oai
+from invenio_rdm_records.oai import CursorPagination, _decode_cursor
+from invenio_rdm_records.records.api import RDMDraft, RDMRecord
+from tests.benchmarks.utils import Timings, allocations, benchmark, check_baseline
+
+RECORDS = int(os.environ.get("RDM_BENCHMARKS_OAI_RECORDS", 500))
+
+PAGE_SIZE = 100
+
+PREFIXES = ["oai_dc", "datacite", "oai_datacite", "marcxml", "dcat"]
+
+NS = {"oai": "http://www.openarchives.org/OAI/2.0/"}
+
+
+class LocalSearch:
+    """In-memory stand-in of the records index for the OAI-PMH lists.
+
+    The search dumps are sorted and resumed from cursors like the pages of
+    the records index (see ``invenio_rdm_records.oai.get_records``). Sets and
+    date ranges are not supported.
+    """
+
+    def __init__(self, dumps):
+        """Constructor."""
+        # the records are in no set
+        dumps = [{**dump, "oai_sets": []} for dump in dumps]
+        self.hits = sorted(
+            (
+                {
+                    "_id": dump["uuid"],
+                    "_source": dump,
+                    "sort": [dump["updated"], dump["id"]],
+                }
+                for dump in dumps
+            ),
+            key=lambda hit: hit["sort"],
+        )
+        self.keys = [hit["sort"] for hit in self.hits]
+
+    def get_records(self, **kwargs):
+        """Get a page of records for the OAI-PMH lists."""
+        token = kwargs.get("resumptionToken") or {}
+        page = token.get("page", 1)
+        size = current_app.config["OAISERVER_PAGE_SIZE"]
+        cursor = _decode_cursor(token["scroll_id"]) if token.get("scroll_id") else {}
+
+        start = bisect.bisect_right(self.keys, cursor["after"]) if cursor else 0
+        # the pages annotate their hits
+        hits = [dict(hit) for hit in self.hits[start : start + size]]
+        response = {"hits": {"total": {"value": len(self.hits)}, "hits": hits}}
+        return CursorPagination(response, page, size)
+
+
+def synthetic_record(i):
+    """Metadata of a synthetic record."""
+    return {
+        "metadata": {
+            "resource_type": {"id": "dataset"},
+            "title": f"Synthetic record {i}",
+            "publication_date": "2024-01-01",
+            "creators": [
+                {
+                    "person_or_org": {
+                        "type": "personal",
+                        "name": f"Doe {j}, Jane",
+                        "given_name": "Jane",
+                        "family_name": f"Doe {j}",
+                    }
+                }
+                for j in range(5)
+            ],
+            "description": f"<p>Description of the synthetic record {i}.</p>",
+            "publisher": "InvenioRDM",
+            "subjects": [{"subject": f"subject {j}"} for j in range(5)],
+        },
+    }
+
+
+@pytest.fixture()
+def oai_records(base_app, db, location):
+    """Synthetic public records with OAI identifiers, in the database only."""
+    vocabulary_type = VocabularyType.create(id="resourcetypes", pid_type="rsrct")
+    resource_type = Vocabulary.create(
+        {
+            "id": "dataset",
+            "title": {"en": "Dataset"},
+            "props": {
+                "csl": "dataset",
+                "datacite_general": "Dataset",
+                "datacite_type": "",
+                "openaire_resourceType": "21",
+                "openaire_type": "dataset",
+                "eurepo": "info:eu-repo/semantics/other",
+                "schema.org": "https://schema.org/Dataset",
+                "subtype": "",
+                "type": "dataset",
+                "marc21_type": "dataset",
+                "marc21_subtype": "",
+            },
+            "icon": "table",
+            "tags": ["depositable", "linkable"],
+        },
+        type=vocabulary_type,
+    )
+    Vocabulary.pid.create(resource_type)
+    resource_type.commit()
+
+    dumps = []
+    with base_app.test_request_context():
+        for i in range(RECORDS):
+            data = synthetic_record(i)
+            draft = RDMDraft.create({**data, "files": {"enabled": False}})
+            draft.commit()
+            record = RDMRecord.publish(draft)
+            record["metadata"] = draft["metadata"]
+            record.pids = {
+                "oai": {
+                    "identifier": f"oai:inveniordm:{record.pid.pid_value}",
+                    "provider": "oai",
+                }
+            }
+            record.parent.pids = {}
+            record.parent.commit()
+            record.commit()
+            dumps.append(record.dumps())
+    db.session.commit()
+    return dumps
+
+
+@pytest.fixture()
+def local_search(base_app, oai_records):
+    """Serve the OAI-PMH lists from the in-memory stand-in."""
+    search = LocalSearch(oai_records)
+    with mock.patch.object(oai, "get_records", search.get_records):
+        with mock.patch.dict(base_app.config, {"RDM_OAI_PRECOMPUTED_SETS": True}):
+            yield search
+
+
+def harvest(app, prefix, timings):
+    """Harvest all the records, following the resumption tokens."""
+    client = app.test_client()
+    harvested = 0
+    with app.test_request_context():
+        params = {"verb": "ListRecords", "metadataPrefix": prefix}
+        while True:
+            url = url_for("invenio_oaiserver.response", **params)
+            resp = timings.measure(client.get, url)
+            assert resp.status_code == 200
+            tree = etree.fromstring(resp.data)
+            harvested += len(tree.xpath("//oai:record", namespaces=NS))
+            token = tree.xpath("//oai:resumptionToken/text()", namespaces=NS)
+            if not token:
+                return harvested
+            params = {"verb": "ListRecords", "resumptionToken": token[0]}
+
+
+@benchmark
+@pytest.mark.parametrize("prefix", PREFIXES)
+def test_harvest_throughput(base_app, local_search, prefix):
+    """Records per second, page latencies and peak memory of a full harvest."""
+    timings = Timings(f"OAI harvest {prefix}")
+
+    with mock.patch.dict(base_app.config, {"OAISERVER_PAGE_SIZE": PAGE_SIZE}):
+        # the memory is traced in a harvest of its own, as tracing slows it
+        # down; it also warms up the serializers, loaded on their first use
+        harvested = []
+        peak = allocations(
+            lambda: harvested.append(harvest(base_app, prefix, Timings(prefix)))
+        )
+        harvested.append(harvest(base_app, prefix, timings))
+
+    assert harvested == [RECORDS, RECORDS]
+    print(
+        f"{timings.name}: {RECORDS / timings.total:.1f} records/s, "
+        f"page p50 {timings.p50 * 1000:.1f}ms, p99 {timings.p99 * 1000:.1f}ms, "
+        f"peak memory {peak / 2**20:.1f} MiB"
+    )
+    check_baseline(timings)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Concurrent full OAI-PMH harvests, with scroll contexts and with cursors."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from flask import url_for
+from invenio_access.permissions import system_identity
+from invenio_search import current_search_client
+from lxml import etree
+
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.api import RDMRecord
+from tests.benchmarks.utils import Timings, benchmark, check_baseline
+
+RECORDS = 200
+PAGE_SIZE = 10
+HARVESTERS = 8
+
+NS = {"oai": "http://www.openarchives.org/OAI/2.0/"}
+
+
+def open_search_contexts():
+    """Number of scroll and point in time contexts open in the cluster."""
+    stats = current_search_client.nodes.stats(metric="indices", index_metric="search")
+    return sum(
+        node["indices"]["search"]["open_contexts"] for node in stats["nodes"].values()
+    )
+
+
+@pytest.fixture()
+def harvest_records(running_app, minimal_record, search_clear):
+    """Published records to harvest."""
+    service = current_rdm_records_service
+    for _ in range(RECORDS):
+        draft = service.create(system_identity, minimal_record)
+        service.publish(system_identity, draft.id)
+    RDMRecord.index.refresh()
+
+
+def harvest(app):
+    """Harvest all the identifiers, following the resumption tokens."""
+    client = app.test_client()
+    identifiers = []
+    with app.test_request_context():
+        params = {"verb": "ListIdentifiers", "metadataPrefix": "oai_dc"}
+        while True:
+            resp = client.get(url_for("invenio_oaiserver.response", **params))
+            assert resp.status_code == 200
+            tree = etree.fromstring(resp.data)
+            identifiers += tree.xpath("//oai:identifier/text()", namespaces=NS)
+            token = tree.xpath("//oai:resumptionToken/text()", namespaces=NS)
+            if not token:
+                return identifiers
+            params = {"verb": "ListIdentifiers", "resumptionToken": token[0]}
+
+
+MODES = {
+    "scroll": {"RDM_OAI_CURSOR_PAGINATION": False},
+    "search_after": {"RDM_OAI_CURSOR_PAGINATION": True, "RDM_OAI_POINT_IN_TIME": False},
+    "point_in_time": {"RDM_OAI_CURSOR_PAGINATION": True, "RDM_OAI_POINT_IN_TIME": True},
+}
+"""Configurations of the OAI-PMH list pagination."""
+
+
+@benchmark
+@pytest.mark.parametrize("mode", sorted(MODES))
+def test_concurrent_harvests(running_app, harvest_records, mode):
+    """Full harvests by concurrent harvesters, and the contexts they leave open."""
+    app = running_app.app
+    config = MODES[mode]
+    timings = Timings(f"OAI harvest {mode}")
+    contexts_before = open_search_contexts()
+
+    with mock.patch.dict(app.config, {"OAISERVER_PAGE_SIZE": PAGE_SIZE, **config}):
+        with ThreadPoolExecutor(max_workers=HARVESTERS) as executor:
+            results = timings.measure(
+                lambda: list(executor.map(harvest, [app] * HARVESTERS))
+            )
+        # scroll contexts are left open by the harvests until they expire
+        contexts = open_search_contexts() - contexts_before
+
+    for identifiers in results:
+        assert len(identifiers) == RECORDS
+        assert len(set(identifiers)) == RECORDS
+
+    pages = HARVESTERS * RECORDS // PAGE_SIZE
+    print(
+        f"{timings.name}: {pages / timings.total:.1f} pages/s with "
+        f"{HARVESTERS} harvesters, {contexts} search contexts left open"
+    )
+    check_baseline(timings)
+    if config["RDM_OAI_CURSOR_PAGINATION"]:
+        assert contexts <= 0
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search and pagination of the OAI sets of an instance with 50k sets."""
+
+import pytest
+from invenio_access.permissions import system_identity
+from invenio_oaiserver.models import OAISet
+
+from invenio_rdm_records.proxies import current_oaipmh_server_service
+from tests.benchmarks.utils import benchmark, check_baseline, run
+
+SETS = 50000
+
+PAGE_SIZE = 25
+
+ITERATIONS = 20
+
+
+@pytest.fixture()
+def oai_sets(base_app, db):
+    """50k community-like sets."""
+    db.session.bulk_insert_mappings(
+        OAISet,
+        [
+            {
+                "spec": f"community-{i:05d}",
+                "name": f"Community number {i}",
+                "search_pattern": f"parent.communities.ids:{i}",
+                "system_created": True,
+            }
+            for i in range(SETS)
+        ],
+    )
+    db.session.commit()
+
+
+@benchmark
+def test_deep_pages(base_app, oai_sets):
+    """A deep page is found faster after a cursor than with an offset."""
+    service = current_oaipmh_server_service
+    params = {"size": PAGE_SIZE, "sort": "name", "sort_direction": "asc"}
+    last_page = SETS // PAGE_SIZE
+
+    # the cursor of the last page, as in the "next" link of the page before
+    previous = service.search(system_identity, {**params, "page": last_page - 1})
+    after = previous.pagination.after
+    assert after
+
+    def offset():
+        return list(service.search(system_identity, {**params, "page": last_page}))
+
+    def keyset():
+        return list(
+            service.search(
+                system_identity, {**params, "page": last_page, "after": after}
+            )
+        )
+
+    assert offset() == keyset()
+    offset_timings = run("OAI sets last page offset", offset, ITERATIONS)
+    keyset_timings = run("OAI sets last page keyset", keyset, ITERATIONS)
+    check_baseline(keyset_timings)
+    assert keyset_timings.p50 < offset_timings.p50
+
+
+@benchmark
+def test_query(base_app, oai_sets):
+    """Substring search of the names and specs."""
+    service = current_oaipmh_server_service
+
+    def search():
+        return service.search(system_identity, {"q": "number 4999", "size": 25})
+
+    assert search().total == 11
+    timings = run("OAI sets substring search", search, ITERATIONS)
+    check_baseline(timings)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Encoding of search pages of large records in the UI JSON format."""
+
+from unittest import mock
+
+import pytest
+from invenio_access.permissions import system_identity
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMRecord
+from invenio_rdm_records.resources.serializers import UIJSONSerializer
+from invenio_rdm_records.resources.serializers.fastjson import (
+    json_dumps,
+    orjson_dumps,
+)
+from tests.benchmarks.test_serializers import grow
+from tests.benchmarks.utils import benchmark, check_baseline, run
+
+ITERATIONS = 10
+
+PAGE_SIZE = 100
+
+
+@pytest.fixture()
+def search_page(running_app, full_record, search_clear):
+    """A search page of 100 records with 50 creators each."""
+    service = current_rdm_records.records_service
+    full_record["pids"] = {}
+    draft = service.create(system_identity, full_record)
+    service.publish(system_identity, draft.id)
+    RDMRecord.index.refresh()
+
+    page = service.search(system_identity, params={"size": PAGE_SIZE}).to_dict()
+    hit = grow(page["hits"]["hits"][0], 50)
+    page["hits"]["hits"] = [hit] * PAGE_SIZE
+    return page
+
+
+@benchmark
+def test_search_page_ui_json(running_app, search_page):
+    """orjson encodes the search pages faster than the standard library."""
+    pytest.importorskip("orjson")
+    assert len(search_page["hits"]["hits"]) == PAGE_SIZE
+    serializer = UIJSONSerializer()
+    ext = current_rdm_records._get_current_object()
+
+    with running_app.app.test_request_context():
+        with mock.patch.object(ext, "json_encoder", json_dumps):
+            stdlib = run(
+                "stdlib", serializer.serialize_object_list, ITERATIONS, search_page
+            )
+        with mock.patch.object(ext, "json_encoder", orjson_dumps):
+            fast = run(
+                "orjson", serializer.serialize_object_list, ITERATIONS, search_page
+            )
+
+    check_baseline(fast)
+    assert fast.per_second > stdlib.per_second
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Latency and allocations of every record serializer, by record size."""
+
+import math
+from copy import deepcopy
+
+import pytest
+from flask_resources.context import ResourceRequestCtx
+from invenio_access.permissions import system_identity
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.resources.config import (
+    RDMRecordResourceConfig,
+    record_serializers,
+)
+from invenio_rdm_records.resources.serializers import (
+    CFFSerializer,
+    CodemetaSerializer,
+)
+from tests.benchmarks.utils import allocations, benchmark, check_baseline, run
+
+SERIALIZERS = {
+    **{
+        mimetype: handler.serializer for mimetype, handler in record_serializers.items()
+    },
+    # registered as exporters by the application
+    "application/x-cff": CFFSerializer(),
+    "application/x-codemeta+json": CodemetaSerializer(),
+}
+"""Serializers of the REST API and of the record exports."""
+
+SIZES = {
+    "minimal": (None, 100),
+    "full": (1, 100),
+    "large": (100, 20),
+    "huge": (500, 5),
+}
+"""Number of creators, identifiers and locations, and iterations, by size."""
+
+
+def polygon(index, points=16):
+    """A closed polygon around a point of the globe."""
+    lon, lat = (index * 7) % 360 - 180, (index * 3) % 160 - 80
+    ring = [
+        [
+            round(lon + math.cos(2 * math.pi * i / points), 6),
+            round(lat + math.sin(2 * math.pi * i / points), 6),
+        ]
+        for i in range(points)
+    ]
+    return {"type": "Polygon", "coordinates": [ring + [ring[0]]]}
+
+
+def grow(record, count):
+    """Copy a full record with ``count`` creators, identifiers and locations."""
+    record = deepcopy(record)
+    metadata = record["metadata"]
+
+    creator = metadata["creators"][0]
+    metadata["creators"] = []
+    for i in range(count):
+        copy = deepcopy(creator)
+        copy["person_or_org"]["family_name"] = f"Doe {i}"
+        copy["person_or_org"]["name"] = f"Doe {i}, John"
+        metadata["creators"].append(copy)
+
+    metadata["identifiers"] = [
+        {"identifier": f"10.1234/alt.{i}", "scheme": "doi"} for i in range(count)
+    ]
+
+    related = metadata["related_identifiers"][0]
+    metadata["related_identifiers"] = []
+    for i in range(count):
+        copy = deepcopy(related)
+        copy["identifier"] = f"10.1234/rel.{i}"
+        copy["scheme"] = "doi"
+        metadata["related_identifiers"].append(copy)
+
+    feature = metadata["locations"]["features"][0]
+    metadata["locations"]["features"] = []
+    for i in range(count):
+        copy = deepcopy(feature)
+        copy["geometry"] = polygon(i)
+        metadata["locations"]["features"].append(copy)
+
+    return record
+
+
+@pytest.fixture()
+def records(running_app, minimal_record, full_record):
+    """Published records of all sizes, as given to the serializers."""
+    service = current_rdm_records.records_service
+
+    def publish(data):
+        draft = service.create(system_identity, data)
+        return service.publish(system_identity, draft.id).to_dict()
+
+    full_record["pids"] = {}
+    full = publish(full_record)
+    return {
+        size: publish(minimal_record) if count is None else grow(full, count)
+        for size, (count, _) in SIZES.items()
+    }
+
+
+@benchmark
+@pytest.mark.parametrize("mimetype", sorted(SERIALIZERS))
+def test_serializer(running_app, records, mimetype):
+    """Serialize records of increasing size in one format."""
+    serializer = SERIALIZERS[mimetype]
+
+    ctx = ResourceRequestCtx(RDMRecordResourceConfig)
+    ctx.update(
+        {
+            "args": {"style": "chicago-author-date", "locale": "en-US"},
+            "accept_mimetype": mimetype,
+        }
+    )
+    with running_app.app.test_request_context(), ctx:
+        for size, (_, iterations) in SIZES.items():
+            record = records[size]
+            timings = run(
+                f"{mimetype} {size}",
+                serializer.serialize_object,
+                iterations,
+                record,
+            )
+            peak = allocations(serializer.serialize_object, record)
+            print(f"{mimetype} {size}: peak {peak / 1024:.1f} KiB allocated")
+            check_baseline(timings)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmark helpers."""
+
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+import pytest
+
+benchmark = pytest.mark.skipif(
+    not os.environ.get("RDM_BENCHMARKS"),
+    reason="Set RDM_BENCHMARKS=1 to run the benchmarks.",
+)
+"""Marker for benchmarks, which only run when ``RDM_BENCHMARKS`` is set."""
+
+
+class Timings:
+    """Collected durations of a benchmarked operation."""
+
+    def __init__(self, name):
+        """Constructor."""
+        self.name = name
+        self.durations = []
+
+    def measure(self, func, *args, **kwargs):
+        """Call ``func`` and record how long it took."""
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.durations.append(time.perf_counter() - start)
+        return result
+
+    @property
+    def count(self):
+        """Number of measured calls."""
+        return len(self.durations)
+
+    @property
+    def total(self):
+        """Total time spent in seconds."""
+        return sum(self.durations)
+
+    @property
+    def per_second(self):
+        """Calls per second."""
+        return self.count / self.total if self.total else float("inf")
+
+    def percentile(self, pct):
+        """Duration in seconds at the given percentile."""
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    @property
+    def p50(self):
+        """Median duration in seconds."""
+        return statistics.median(self.durations) if self.durations else 0.0
+
+    @property
+    def p99(self):
+        """99th percentile duration in seconds."""
+        return self.percentile(99)
+
+    def report(self):
+        """Human readable summary."""
+        return (
+            f"{self.name}: {self.count} calls, {self.per_second:.1f}/s, "
+            f"p50 {self.p50 * 1000:.2f}ms, p99 {self.p99 * 1000:.2f}ms"
+        )
+
+
+def run(name, func, iterations, *args, **kwargs):
+    """Call ``func`` ``iterations`` times, print and return the timings."""
+    timings = Timings(name)
+    for _ in range(iterations):
+        timings.measure(func, *args, **kwargs)
+    print(timings.report())
+    return timings
+
+
+def allocations(func, *args, **kwargs):
+    """Peak memory in bytes allocated during a call of ``func``."""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def check_baseline(timings):
+    """Fail if the median duration regressed compared to a baseline.
+
+    ``RDM_BENCHMARKS_BASELINE`` is the path to a JSON file with the median
+    durations in seconds by benchmark name, e.g. produced on the main branch
+    by running the benchmarks with ``RDM_BENCHMARKS_BASELINE_UPDATE=1``. A
+    benchmark fails if it is slower than its baseline times
+    ``RDM_BENCHMARKS_THRESHOLD`` (``1.25`` by default). Benchmarks missing
+    from the baseline are not checked.
+    """
+    path = os.environ.get("RDM_BENCHMARKS_BASELINE")
+    if not path:
+        return
+
+    baseline = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            baseline = json.load(f)
+
+    if os.environ.get("RDM_BENCHMARKS_BASELINE_UPDATE"):
+        baseline[timings.name] = timings.p50
+        with open(path, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        return
+
+    reference = baseline.get(timings.name)
+    if reference is None:
+        return
+    threshold = float(os.environ.get("RDM_BENCHMARKS_THRESHOLD", "1.25"))
+    assert timings.p50 <= reference * threshold, (
+        f"{timings.name} regressed: p50 {timings.p50 * 1000:.2f}ms, "
+        f"baseline {reference * 1000:.2f}ms"
+    )
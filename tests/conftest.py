@@ -199,7 +199,10 @@ def app_config(app_config, mock_datacite_client):
     app_config["OAISERVER_CREATED_KEY"] = "created"
     app_config["OAISERVER_RECORD_CLS"] = "invenio_rdm_records.records.api:RDMRecord"
     app_config["OAISERVER_RECORD_SETS_FETCHER"] = (
-        "invenio_oaiserver.percolator:find_sets_for_record"
+        "invenio_rdm_records.oai:record_sets_fetcher"
+    )
+    app_config["OAISERVER_SET_RECORDS_QUERY_FETCHER"] = (
+        "invenio_rdm_records.oai:set_records_query_fetcher"
     )
     app_config["OAISERVER_GETRECORD_FETCHER"] = (
         "invenio_rdm_records.oai:getrecord_fetcher"
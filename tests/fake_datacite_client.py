@@ -7,8 +7,12 @@
 
 """DataCite DOI Client."""
 
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
 from unittest.mock import Mock
 
+from datacite.errors import DataCiteServerError
 from idutils import normalize_doi
 
 from invenio_rdm_records.services.pids import providers
@@ -17,6 +21,9 @@ from invenio_rdm_records.services.pids import providers
 class FakeDataCiteRESTClient:
     """DataCite REST API client wrapper."""
 
+    unavailable = False
+    """Simulate an outage: all the remote operations fail with a 503."""
+
     def __init__(
         self, username, password, prefix, test_mode=False, url=None, timeout=None
     ):
@@ -44,6 +51,10 @@ class FakeDataCiteRESTClient:
 
         self.timeout = timeout
 
+    def _check_available(self):
+        if self.unavailable:
+            raise DataCiteServerError("Service Unavailable")
+
     def public_doi(self, metadata, url, doi=None):
         """Create a public doi ... not.
 
@@ -52,6 +63,7 @@ class FakeDataCiteRESTClient:
         :param url: URL where the doi will resolve.
         :return:
         """
+        self._check_available()
         return Mock()
 
     def update_doi(self, doi, metadata=None, url=None):
@@ -61,6 +73,7 @@ class FakeDataCiteRESTClient:
         :param metadata: JSON format of the metadata.
         :return:
         """
+        self._check_available()
         return Mock()
 
     def delete_doi(self, doi):
@@ -71,6 +84,7 @@ class FakeDataCiteRESTClient:
         :param doi: DOI (e.g. 10.123/456)
         :return:
         """
+        self._check_available()
         return Mock()
 
     def hide_doi(self, doi):
@@ -82,6 +96,7 @@ class FakeDataCiteRESTClient:
         :param doi: DOI to hide e.g. 10.12345/1.
         :return:
         """
+        self._check_available()
         return Mock()
 
     def show_doi(self, doi):
@@ -93,6 +108,7 @@ class FakeDataCiteRESTClient:
         :param doi: DOI to hide e.g. 10.12345/1.
         :return:
         """
+        self._check_available()
         return Mock()
 
     def check_doi(self, doi):
@@ -135,3 +151,69 @@ class FakeDataCiteClient(providers.DataCiteClient):
                 self.cfg("test_mode", True),
             )
         return self._api
+
+
+class _LocalDataCiteHandler(BaseHTTPRequestHandler):
+    """Minimal DataCite REST API stand-in answering DOI updates."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        """Count the accepted connections."""
+        super().setup()
+        self.server.connections += 1
+
+    def _reply(self, status, body=b"{}"):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/vnd.api+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        """Update a DOI."""
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        doi = self.path.split("dois/", 1)[-1]
+        body = {"data": {"id": doi, "attributes": {"doi": doi}}}
+        self._reply(200, json.dumps(body).encode("utf-8"))
+
+    def do_GET(self):
+        """Get a DOI."""
+        self._reply(200, b'{"data": {"attributes": {"url": "https://127.0.0.1"}}}')
+
+    def log_message(self, *args):
+        """Silence the request log."""
+
+
+class LocalDataCiteServer:
+    """Threaded local HTTP server standing in for the DataCite REST API."""
+
+    def __init__(self):
+        """Constructor."""
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _LocalDataCiteHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.connections = 0
+        self.thread = Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        """Base URL of the server."""
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/"
+
+    @property
+    def connections(self):
+        """Number of TCP connections accepted so far."""
+        return self.httpd.connections
+
+    def __enter__(self):
+        """Start serving."""
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        """Stop serving."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -8,8 +8,30 @@
 """Tests for the OAI-PMH endpoint."""
 
 import itertools
+from copy import deepcopy
+from unittest import mock
 
+import pytest
 from flask import url_for
+from invenio_access.permissions import system_identity
+from invenio_oaiserver.errors import OAINoRecordsMatchError
+from lxml import etree
+
+from invenio_rdm_records.oai import (
+    CursorPagination,
+    _decode_cursor,
+    oaipmh_response,
+    set_records_query_fetcher,
+    sets_search_all,
+)
+from invenio_rdm_records.oaiserver.indexer import OAISetsRecordIndexer
+from invenio_rdm_records.proxies import (
+    current_rdm_records,
+    current_rdm_records_service,
+)
+from invenio_rdm_records.records.api import RDMRecord
+
+NS = {"oai": "http://www.openarchives.org/OAI/2.0/"}
 
 
 def test_identify(running_app, client, search_clear):
@@ -93,3 +115,177 @@ def test_harvest(running_app, client, record_factory, search_clear):
         assert f"<identifier>{oai_id}</identifier>" in resp.text
         if record["id"] == community_record["id"]:
             assert "<setSpec>community-blr</setSpec>" in resp.text
+
+
+def test_oaipmh_view(base_app):
+    """The OAI-PMH endpoint lists the records with ``oai.get_records``."""
+    assert base_app.view_functions["invenio_oaiserver.response"] is oaipmh_response
+
+
+@pytest.mark.parametrize("cursor_pagination", [False, True])
+def test_harvest_resumption(
+    running_app, client, minimal_record, search_clear, cursor_pagination
+):
+    """Full lists are harvested page by page with resumption tokens."""
+    app = running_app.app
+    service = current_rdm_records_service
+    ids = []
+    for _ in range(5):
+        draft = service.create(system_identity, minimal_record)
+        ids.append(service.publish(system_identity, draft.id).id)
+    RDMRecord.index.refresh()
+
+    config = {
+        "OAISERVER_PAGE_SIZE": 2,
+        "RDM_OAI_CURSOR_PAGINATION": cursor_pagination,
+    }
+    with mock.patch.dict(app.config, config):
+        harvested = []
+        params = {"verb": "ListIdentifiers", "metadataPrefix": "oai_dc"}
+        while True:
+            resp = client.get(url_for("invenio_oaiserver.response", **params))
+            assert resp.status_code == 200
+            tree = etree.fromstring(resp.data)
+            harvested += tree.xpath("//oai:identifier/text()", namespaces=NS)
+            token = tree.xpath("//oai:resumptionToken/text()", namespaces=NS)
+            if not token:
+                break
+            params = {"verb": "ListIdentifiers", "resumptionToken": token[0]}
+
+    assert sorted(harvested) == sorted(f"oai:inveniordm:{id_}" for id_ in ids)
+
+
+def test_precomputed_sets(
+    running_app, client, minimal_record, monkeypatch, search_clear
+):
+    """Set membership is stored in the records index and follows set changes."""
+    monkeypatch.setitem(running_app.app.config, "RDM_OAI_PRECOMPUTED_SETS", True)
+    service = current_rdm_records_service
+    sets_service = current_rdm_records.oaipmh_server_service
+
+    oai_set = sets_service.create(
+        system_identity,
+        {"name": "Lab", "spec": "lab", "search_pattern": "metadata.title:lab"},
+    )
+    ids = {}
+    for title in ["lab", "field"]:
+        data = deepcopy(minimal_record)
+        data["metadata"]["title"] = title
+        draft = service.create(system_identity, data)
+        ids[title] = service.publish(system_identity, draft.id).id
+    RDMRecord.index.refresh()
+
+    def harvest():
+        params = {"verb": "ListIdentifiers", "metadataPrefix": "oai_dc", "set": "lab"}
+        resp = client.get(url_for("invenio_oaiserver.response", **params))
+        tree = etree.fromstring(resp.data)
+        identifiers = tree.xpath("//oai:identifier/text()", namespaces=NS)
+        specs = tree.xpath("//oai:setSpec/text()", namespaces=NS)
+        assert specs == ["lab"] * len(identifiers)
+        return identifiers
+
+    hit = RDMRecord.index.search().filter("term", id=ids["lab"]).execute()[0]
+    assert list(hit.oai_sets) == ["lab"]
+    assert harvest() == [f"oai:inveniordm:{ids['lab']}"]
+
+    # the records of the old and new search patterns are reindexed
+    sets_service.update(
+        system_identity,
+        oai_set.id,
+        {"name": "Lab", "spec": "lab", "search_pattern": "metadata.title:field"},
+    )
+    RDMRecord.index.refresh()
+    assert harvest() == [f"oai:inveniordm:{ids['field']}"]
+
+    sets_service.delete(system_identity, oai_set.id)
+    RDMRecord.index.refresh()
+    assert harvest() == []
+
+
+def test_cursor_pagination(base_app):
+    """The cursor of the last record is given to the next page."""
+    hits = [{"_id": str(i), "sort": ["2024-01-01", str(i)]} for i in range(3)]
+    response = {"hits": {"total": {"value": 5}, "hits": hits}, "pit_id": "pit"}
+
+    page = CursorPagination(response, 1, 3)
+    assert page.has_next
+    assert page.next_num == 2
+    assert _decode_cursor(page._scroll_id) == {
+        "after": ["2024-01-01", "2"],
+        "pit": "pit",
+    }
+
+    # the point in time is closed after the last page
+    response["hits"]["hits"] = hits[:2]
+    with mock.patch("invenio_rdm_records.oai._close_pit") as close_pit:
+        page = CursorPagination(response, 2, 3)
+    assert not page.has_next
+    assert page._scroll_id is None
+    close_pit.assert_called_once_with("pit")
+
+    response["hits"] = {"total": {"value": 0}, "hits": []}
+    with pytest.raises(OAINoRecordsMatchError):
+        CursorPagination(response, 1, 3)
+
+
+def test_stored_sets(base_app):
+    """The stored set specs are used, and the others percolated."""
+    records = [{"id": "1", "oai_sets": ["a", "b"]}, {"id": "2"}, {"id": "3"}]
+    with mock.patch("invenio_rdm_records.oai.percolate_sets") as percolate:
+        percolate.return_value = [["c"], []]
+        assert sets_search_all(records) == [["a", "b"], ["c"], []]
+        percolate.assert_called_once_with(records[1:])
+
+    config = {"RDM_OAI_PRECOMPUTED_SETS": True}
+    with base_app.app_context(), mock.patch.dict(base_app.config, config):
+        query = set_records_query_fetcher("a")
+    assert query.to_dict() == {"term": {"oai_sets": "a"}}
+
+
+def test_oai_sets_indexer(base_app):
+    """The sets are percolated when indexing, by batch when bulk indexing."""
+
+    class Record(dict):
+        is_draft = False
+        enable_jsonref = False
+        revision_id = 1
+
+        @property
+        def id(self):
+            return self["id"]
+
+        @classmethod
+        def get_record(cls, id_):
+            return cls(id=id_)
+
+        def dumps(self, dumper=None):
+            return dict(self)
+
+    def percolate_sets(documents):
+        calls.append([doc["id"] for doc in documents])
+        return [[f"set-{doc['id']}"] for doc in documents]
+
+    def message(id_):
+        return mock.Mock(decode=mock.Mock(return_value={"id": id_, "op": "index"}))
+
+    calls = []
+    indexer = OAISetsRecordIndexer(
+        record_cls=Record, record_to_index=lambda record: "records"
+    )
+    indexer.percolate_batch_size = 2
+    config = {"RDM_OAI_PRECOMPUTED_SETS": True}
+    with base_app.app_context(), mock.patch.dict(base_app.config, config):
+        with mock.patch(
+            "invenio_rdm_records.oaiserver.indexer.percolate_sets", percolate_sets
+        ):
+            data = indexer._prepare_record(Record(id="1"), "records")
+            assert data["oai_sets"] == ["set-1"]
+
+            calls.clear()
+            actions = list(indexer._actionsiter(message(i) for i in "abc"))
+            assert [a["_source"]["oai_sets"] for a in actions] == [
+                ["set-a"],
+                ["set-b"],
+                ["set-c"],
+            ]
+            assert calls == [["a", "b"], ["c"]]
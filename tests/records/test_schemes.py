@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Identifier schemes registry tests."""
+
+from invenio_rdm_records.records.schemes import SchemeRegistry, always_valid
+
+
+def test_scheme_registry():
+    """The registry is compiled from the schemes configuration."""
+
+    def normalize(value):
+        return value.lower()
+
+    registry = SchemeRegistry(
+        {
+            "RDM_RECORDS_IDENTIFIERS_SCHEMES": {
+                "doi": {"label": "DOI", "datacite": "DOI"},
+                "other": {"label": "Other"},
+            },
+            "RDM_RECORDS_PERSONORG_SCHEMES": {"orcid": {"datacite": "ORCID"}},
+            "RDM_PERSISTENT_IDENTIFIERS": {
+                "doi": {"label": "DOI", "validator": bool, "normalizer": normalize},
+                "oai": {"label": "OAI"},
+            },
+        }
+    )
+
+    name = "RDM_RECORDS_IDENTIFIERS_SCHEMES"
+    assert registry.datacite_scheme("doi", name) == "DOI"
+    assert registry.datacite_scheme("other", name, default="x") == "x"
+    assert registry.datacite_scheme("orcid", "RDM_RECORDS_PERSONORG_SCHEMES") == "ORCID"
+    assert registry.datacite_scheme("ror", "VOCABULARIES_AFFILIATION_SCHEMES") is None
+
+    assert registry.pid_scheme("doi") == (bool, normalize, "DOI")
+    assert registry.pid_scheme("oai") == (always_valid, None, "OAI")
+    assert registry.pid_scheme("ark") == (always_valid, None, "ark")
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Versions index tests."""
+
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMDraft, RDMRecord
+from invenio_rdm_records.records.versions import VersionsIndex
+
+
+def test_versions_index(running_app, search_clear, minimal_record, superuser_identity):
+    """The DOIs of the published versions are listed, latest first."""
+    service = current_rdm_records.records_service
+    minimal_record["pids"] = {}
+    draft = service.create(superuser_identity, minimal_record)
+    record_v1 = service.publish(superuser_identity, draft.id)
+    parent_id = record_v1._record.parent.id
+    doi_v1 = record_v1["pids"]["doi"]["identifier"]
+    assert VersionsIndex.pids(parent_id) == [doi_v1]
+
+    # publishing a new version invalidates the cached DOIs
+    draft = service.new_version(superuser_identity, record_v1.id)
+    draft_data = draft.data.copy()
+    draft_data["metadata"]["publication_date"] = "2023-01-01"
+    draft_data["pids"] = {}
+    draft = service.update_draft(superuser_identity, draft.id, data=draft_data)
+    record_v2 = service.publish(superuser_identity, draft.id)
+    doi_v2 = record_v2["pids"]["doi"]["identifier"]
+    assert VersionsIndex.pids(parent_id) == [doi_v2, doi_v1]
+
+    # deleted versions are not listed
+    service.delete_record(
+        superuser_identity,
+        id_=record_v1.id,
+        data={"note": "no specific reason"},
+    )
+    assert VersionsIndex.pids(parent_id) == [doi_v2]
+
+
+def test_versions_index_registered_pids(base_app, db, location):
+    """Only the registered PIDs of the versions are listed."""
+    draft = RDMDraft.create({"files": {"enabled": False}})
+    draft.commit()
+    record = RDMRecord.publish(draft)
+    record.commit()
+    db.session.commit()
+
+    # e.g. the DOIs of an edit draft or of a deleted version
+    PersistentIdentifier.create(
+        "doi",
+        "10.1234/registered",
+        object_type="rec",
+        object_uuid=record.id,
+        status=PIDStatus.REGISTERED,
+    )
+    PersistentIdentifier.create(
+        "doi",
+        "10.1234/reserved",
+        object_type="rec",
+        object_uuid=record.id,
+        status=PIDStatus.RESERVED,
+    )
+    PersistentIdentifier.create(
+        "doi",
+        "10.1234/deleted",
+        object_type="rec",
+        object_uuid=record.id,
+        status=PIDStatus.REGISTERED,
+    ).delete()
+    db.session.commit()
+
+    assert [row.pid_value for row in VersionsIndex.query(record.parent.id)] == [
+        "10.1234/registered"
+    ]
@@ -7,6 +7,7 @@
 
 """Resources serializers tests."""
 
+import threading
 from copy import deepcopy
 
 from citeproc_styles import get_style_filepath
@@ -17,7 +18,12 @@ from invenio_rdm_records.resources.serializers import (
     CSLJSONSerializer,
     StringCitationSerializer,
 )
-from invenio_rdm_records.resources.serializers.csl import get_citation_string
+from invenio_rdm_records.resources.serializers.csl import (
+    CitationStylesCache,
+    get_citation_string,
+    get_citation_strings,
+    get_csl_locale,
+)
 from invenio_rdm_records.resources.serializers.csl.schema import CSLJSONSchema
 
 
@@ -159,3 +165,106 @@ def test_citation_string_serializer_empty_record(running_app, empty_record):
     serialized_record = serializer.dump(empty_record)
 
     assert serialized_record == expected_data
+
+
+def test_citation_styles_cache():
+    """Test the LRU cache of the parsed citation styles."""
+    cache = CitationStylesCache(maxsize=2)
+    apa = get_style_filepath("apa")
+    ieee = get_style_filepath("ieee")
+
+    style = cache.get(apa, "en-US")
+    assert cache.get(apa, "en-US") is style
+    assert cache.get(apa, "de-DE") is not style
+
+    # the least recently used style is evicted
+    cache.get(apa, "en-US")
+    cache.get(ieee, "en-US")
+    assert list(cache._styles) == [(apa, "en-US"), (ieee, "en-US")]
+    # the thread's copies are found without looking up the shared styles
+    assert list(cache._parsed) == [(apa, "de-DE"), (ieee, "en-US")]
+
+    cache.clear()
+    assert list(cache._styles) == []
+    assert list(cache._parsed) == []
+
+
+def test_citation_styles_cache_threads(base_app):
+    """Test that the threads render with copies of the shared parsed styles."""
+    cache = CitationStylesCache(maxsize=2)
+    style = get_style_filepath("chicago-author-date")
+    styles = {}
+
+    def get():
+        styles[threading.get_ident()] = cache.get(style, "en-US")
+
+    threads = [threading.Thread(target=get) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # parsed once, copied for each thread
+    assert list(cache._parsed) == [(style, "en-US")]
+    first, second = styles.values()
+    assert first is not second
+    assert first.root is not second.root
+    assert first.root.locales[0].style is first.root
+
+    json = {
+        "id": "1",
+        "type": "book",
+        "title": "Title",
+        "author": [{"family": "Doe", "given": "John"}],
+        "issued": {"date-parts": [[2020]]},
+    }
+    with base_app.app_context():
+        expected = get_citation_string(json, "1", style, "en-US")
+        citation_style = current_rdm_records.citation_styles.get(style, "en-US")
+        assert citation_style is not current_rdm_records.citation_styles.parse(
+            style, "en-US"
+        )
+        assert get_citation_string(json, "1", style, "en-US") == expected
+
+
+def test_citation_styles_cache_warm_up(base_app):
+    """Test parsing the configured citation styles ahead of the requests."""
+    cache = CitationStylesCache(maxsize=3)
+    with base_app.app_context():
+        cache.warm_up(["chicago-author-date", "unknown", "ieee"], ["en-US", "de-DE"])
+    style = get_style_filepath("chicago-author-date")
+    assert list(cache._parsed) == [
+        (style, "en-US"),
+        (style, "de-DE"),
+        (get_style_filepath("ieee"), "en-US"),
+    ]
+    # the requests copy the parsed styles
+    assert list(cache._styles) == []
+
+    assert get_csl_locale("de") == "de-DE"
+    assert get_csl_locale("en") == "en-US"
+    assert get_csl_locale("pt_BR") == "pt-BR"
+    assert get_csl_locale(None) == "en-US"
+
+
+def test_citation_strings(base_app):
+    """Test rendering several citations with a single bibliography."""
+    style = get_style_filepath("chicago-author-date")
+    jsons = [
+        {
+            "id": str(i),
+            "type": "book",
+            "title": f"Title {i}",
+            "author": [{"family": "Doe", "given": "John"}],
+            "issued": {"date-parts": [[2020 + i]]},
+            "publisher": "Zenodo",
+        }
+        for i in (2, 0, 1)
+    ]
+
+    with base_app.app_context():
+        citations = get_citation_strings(jsons, style, "en-US")
+        assert citations == [
+            get_citation_string(json, json["id"], style, "en-US") for json in jsons
+        ]
+        assert "Title 2" in citations[0]
@@ -7,7 +7,12 @@
 
 """Resources serializers tests."""
 
+import threading
+
+from lxml import etree
+
 from invenio_rdm_records.resources.serializers import DCATSerializer
+from invenio_rdm_records.resources.serializers.dcat import get_xslt_transform
 
 
 def test_dcat_serializer(running_app, full_record_to_dict):
@@ -237,3 +242,27 @@ def test_dcat_serializer(running_app, full_record_to_dict):
     serializer = DCATSerializer()
     serialized_record = serializer.serialize_object(full_record_to_dict)
     assert serialized_record == expected_data
+
+
+def test_dcat_serializer_etree(running_app, full_record_to_dict):
+    """The lxml tree matches the serialized string."""
+    full_record_to_dict["links"] = dict(self_html="https://self-link.com")
+    serializer = DCATSerializer()
+    parser = etree.XMLParser(remove_blank_text=True)
+    expected = etree.fromstring(
+        serializer.serialize_object(full_record_to_dict).encode("utf-8"), parser
+    )
+    tree = serializer.serialize_object_etree(full_record_to_dict)
+    assert etree.tostring(tree) == etree.tostring(expected)
+
+
+def test_dcat_xslt_shared_per_thread():
+    """The stylesheet is compiled once and copied once per thread."""
+    transform = get_xslt_transform()
+    assert get_xslt_transform() is transform
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(get_xslt_transform()))
+    thread.start()
+    thread.join()
+    assert other[0] is not transform
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Fast JSON serializer tests."""
+
+import json
+from datetime import date, datetime
+
+import pytest
+from invenio_i18n import lazy_gettext as _
+
+from invenio_rdm_records.resources.serializers import FastJSONSerializer
+from invenio_rdm_records.resources.serializers.fastjson import (
+    json_dumps,
+    orjson_dumps,
+)
+
+RECORD = {
+    "id": "abcd-1234",
+    "title": _("Title"),
+    "created": datetime(2024, 1, 2, 3, 4, 5),
+    "published": date(2024, 1, 2),
+    "creators": [{"name": "Doe, Jöhn", "affiliations": [{"id": "cern"}]}],
+    "stats": {1: 2},
+}
+
+
+def test_orjson_dumps_as_stdlib(base_app):
+    """Both encoders produce the same JSON."""
+    pytest.importorskip("orjson")
+    with base_app.test_request_context():
+        expected = json.loads(json_dumps(RECORD))
+        assert json.loads(orjson_dumps(RECORD)) == expected
+        assert expected["title"] == "Title"
+        assert expected["created"] == "Tue, 02 Jan 2024 03:04:05 GMT"
+
+        pretty = orjson_dumps(RECORD, indent=2, sort_keys=True)
+        assert pretty.startswith('{\n  "created"')
+
+        # integers unsupported by orjson
+        assert orjson_dumps({"big": 2**70}) == '{"big": 1180591620717411303424}'
+
+
+def test_fast_json_serializer(base_app):
+    """The serializer uses the encoder of the application."""
+    serializer = FastJSONSerializer()
+    with base_app.test_request_context("/?prettyprint=1"):
+        data = serializer.serialize_object(RECORD)
+        assert data.startswith('{\n  "created"')
+        assert json.loads(serializer.serialize_object_list([RECORD])) == [
+            json.loads(data)
+        ]
@@ -10,6 +10,7 @@
 import pytest
 from dateutil.parser import parse
 from invenio_access.permissions import system_identity
+from lxml import etree
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.resources.serializers.marcxml import MARCXMLSerializer
@@ -339,3 +340,14 @@ def test_marcxml_serializer_full_record(db, running_app, updated_full_record):
 """
 
     assert serialized_record == expected_data
+
+
+def test_marcxml_serializer_etree(running_app, updated_full_record):
+    """The lxml tree matches the serialized string."""
+    serializer = MARCXMLSerializer()
+    parser = etree.XMLParser(remove_blank_text=True)
+    expected = etree.fromstring(
+        serializer.serialize_object(updated_full_record).encode("utf-8"), parser
+    )
+    tree = serializer.serialize_object_etree(updated_full_record)
+    assert etree.tostring(tree) == etree.tostring(expected)
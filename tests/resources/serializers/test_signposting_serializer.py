@@ -7,6 +7,9 @@
 
 """Resources serializers tests."""
 
+from copy import deepcopy
+from unittest import mock
+
 from invenio_rdm_records.resources.serializers import (
     FAIRSignpostingProfileLvl2Serializer,
 )
@@ -218,3 +221,29 @@ def test_signposting_serializer_minimal(running_app, minimal_record_to_dict):
     serialized = FAIRSignpostingProfileLvl2Serializer().dump_obj(minimal_record_to_dict)
 
     assert expected == serialized
+
+
+def test_signposting_serializer_cache(running_app, minimal_record_to_dict):
+    """The linksets of public records are computed once per revision."""
+    serializer = FAIRSignpostingProfileLvl2Serializer()
+    record = deepcopy(minimal_record_to_dict)
+    record["id"] = "cache-test"
+    restricted = deepcopy(record)
+    restricted["access"]["files"] = "restricted"
+
+    with mock.patch.object(
+        serializer.object_schema, "dump", wraps=serializer.object_schema.dump
+    ) as dump:
+        linkset = serializer.dump_obj(record)
+        assert serializer.dump_obj(record) == linkset
+        assert dump.call_count == 1
+
+        # new revision
+        record["revision_id"] += 1
+        serializer.dump_obj(record)
+        assert dump.call_count == 2
+
+        # not cached
+        serializer.dump_obj(restricted)
+        serializer.dump_obj(restricted)
+        assert dump.call_count == 4
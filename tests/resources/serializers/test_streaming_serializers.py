@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Streaming serializers tests."""
+
+import gzip
+import json
+
+from flask_resources import JSONSerializer
+
+from invenio_rdm_records.resources.serializers import CSVRecordSerializer
+from invenio_rdm_records.resources.serializers.streaming import (
+    CSVStreamSerializer,
+    StreamSerializer,
+    encode_stream,
+)
+
+RECORDS = [
+    {"id": "1", "metadata": {"title": "One"}},
+    {"id": "2", "metadata": {"title": "Two", "version": "v2"}},
+]
+
+
+def records():
+    """Iterate over the records, like a search scan."""
+    return iter(RECORDS)
+
+
+def test_stream_serializer(base_app):
+    """Records are serialized one by one into a JSON array."""
+    serializer = StreamSerializer(
+        JSONSerializer(), prefix="[", separator=",", suffix="]"
+    )
+    with base_app.test_request_context():
+        chunks = list(serializer.serialize_object_stream(records))
+    assert len(chunks) == 5
+    assert json.loads("".join(chunks)) == RECORDS
+
+
+def test_csv_stream_serializer():
+    """The CSV rows are streamed with the columns of all the records."""
+    serializer = CSVStreamSerializer(CSVRecordSerializer())
+    chunks = list(serializer.serialize_object_stream(records))
+    assert chunks == [
+        "id,metadata.title,metadata.version\r\n",
+        "1,One,\r\n",
+        "2,Two,v2\r\n",
+    ]
+    assert "".join(chunks) == CSVRecordSerializer().serialize_object_list(
+        {"hits": {"hits": RECORDS}}
+    )
+
+
+def test_encode_stream():
+    """Chunks are buffered and optionally compressed."""
+    chunks = ["a" * 10] * 100
+    assert list(encode_stream(chunks, buffer_size=500)) == [b"a" * 500, b"a" * 500]
+
+    data = b"".join(encode_stream(chunks, "gzip"))
+    assert gzip.decompress(data) == b"a" * 1000
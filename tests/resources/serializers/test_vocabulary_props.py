@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Vocabulary props cache tests."""
+
+from unittest import mock
+
+import pytest
+from invenio_access.permissions import system_identity
+from invenio_vocabularies.proxies import current_service as vocabulary_service
+from invenio_vocabularies.records.api import Vocabulary
+from invenio_vocabularies.records.models import VocabularyType
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.resources.serializers.errors import VocabularyItemNotFoundError
+from invenio_rdm_records.resources.serializers.utils import (
+    VocabularyPropsCache,
+    get_vocabulary_props,
+)
+
+
+def test_vocabulary_props_cache(running_app):
+    """Props are read from the in-memory tables, without searching."""
+    cache = current_rdm_records.vocabulary_props_cache
+    cache.clear()
+    fields = ["props.datacite_general", "props.datacite_type"]
+
+    with mock.patch("invenio_search.engine.dsl.Search.execute") as execute:
+        props = get_vocabulary_props("resourcetypes", fields, "dataset")
+        assert props == {"datacite_general": "Dataset", "datacite_type": ""}
+        assert get_vocabulary_props("datetypes", ["props.datacite"], "other")
+        with pytest.raises(VocabularyItemNotFoundError):
+            get_vocabulary_props("resourcetypes", fields, "invalid")
+        execute.assert_not_called()
+
+    # the configured vocabularies were loaded together with the first lookup
+    assert {"resourcetypes", "datetypes", "relationtypes"} <= set(cache._tables)
+
+    item = vocabulary_service.read(system_identity, ("resourcetypes", "dataset"))
+    data = {k: item.data[k] for k in ("id", "icon", "props", "title", "tags")}
+    data["props"]["datacite_type"] = "Data"
+    data["type"] = "resourcetypes"
+    vocabulary_service.update(system_identity, ("resourcetypes", "dataset"), data)
+
+    # updates are picked up once the tables are checked again
+    props = get_vocabulary_props("resourcetypes", fields, "dataset")
+    assert props["datacite_type"] == ""
+    with mock.patch.dict(running_app.app.config, {"RDM_VOCABULARY_PROPS_CACHE_TTL": 0}):
+        props = get_vocabulary_props("resourcetypes", fields, "dataset")
+    assert props["datacite_type"] == "Data"
+
+
+def test_vocabulary_props_cache_misses(base_app, db):
+    """Missing items are not looked up again before the tables are checked."""
+    vocabulary_type = VocabularyType.create(id="resourcetypes", pid_type="rsrct")
+    for id_ in ["dataset", "image"]:
+        Vocabulary.create(
+            {"id": id_, "title": {"en": id_}, "props": {"type": id_}},
+            type=vocabulary_type,
+        ).commit()
+    db.session.commit()
+
+    now = [0]
+    ttl = base_app.config["RDM_VOCABULARY_PROPS_CACHE_TTL"]
+    cache = VocabularyPropsCache(clock=lambda: now[0])
+    with mock.patch.object(cache, "versions", wraps=cache.versions) as versions:
+        assert cache.get("resourcetypes", "dataset") == {"type": "dataset"}
+        assert versions.call_count == 1
+
+        # the first lookup of a missing item checks the tables, not the next ones
+        assert cache.get("resourcetypes", "invalid") is None
+        assert cache.get("resourcetypes", "invalid") is None
+        assert versions.call_count == 2
+
+        # other missing items are still looked up
+        assert cache.get("resourcetypes", "other") is None
+        assert cache.get("resourcetypes", "invalid") is None
+        assert versions.call_count == 3
+
+        # until the tables are checked again
+        now[0] += ttl
+        assert cache.get("resourcetypes", "invalid") is None
+        assert versions.call_count == 5
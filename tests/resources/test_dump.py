@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Records dump tests."""
+
+import gzip
+import hashlib
+import json
+import os
+from unittest import mock
+from xml.etree import ElementTree
+
+from invenio_rdm_records.resources.dump import (
+    RECID_ALPHABET,
+    RecordsDump,
+    id_ranges,
+    write_dump_files,
+)
+
+
+class FakeSerializer:
+    """Serializer of records to JSON or XML."""
+
+    def __init__(self, xml=False):
+        """Constructor."""
+        self.xml = xml
+
+    def serialize_object(self, obj):
+        """Serialize a record."""
+        if self.xml:
+            return f'<?xml version="1.0"?>\n<record id="{obj["id"]}"/>'
+        return json.dumps(obj)
+
+
+def test_id_ranges():
+    """The ranges cover all the ids, without overlaps."""
+    assert id_ranges(1) == [(None, None)]
+
+    ranges = id_ranges(8)
+    assert len(ranges) == 8
+    assert ranges[0][0] is None and ranges[-1][1] is None
+    for (_, upper), (lower, _) in zip(ranges[:-1], ranges[1:]):
+        assert upper == lower
+    bounds = [upper for _, upper in ranges[:-1]]
+    assert bounds == sorted(bounds)
+    assert all(c in RECID_ALPHABET for bound in bounds for c in bound)
+
+
+def test_write_dump_files(tmp_path):
+    """Records are written in independently compressed JSON lines files."""
+    records = [{"id": str(i)} for i in range(25)]
+    files = write_dump_files(
+        records,
+        FakeSerializer(),
+        "application/json",
+        str(tmp_path / "records-0000"),
+        records_per_file=10,
+    )
+
+    assert [f["name"] for f in files] == [
+        "records-0000-0000.jsonl.gz",
+        "records-0000-0001.jsonl.gz",
+        "records-0000-0002.jsonl.gz",
+    ]
+    assert [f["records"] for f in files] == [10, 10, 5]
+
+    dumped = []
+    for f in files:
+        with open(tmp_path / f["name"], "rb") as fp:
+            data = fp.read()
+        assert len(data) == f["size"]
+        assert hashlib.sha256(data).hexdigest() == f["sha256"]
+        dumped += [json.loads(line) for line in gzip.decompress(data).splitlines()]
+    assert dumped == records
+
+
+def test_write_dump_files_xml(tmp_path):
+    """XML records are wrapped in a root element of each file."""
+    files = write_dump_files(
+        [{"id": "a"}, {"id": "b"}],
+        FakeSerializer(xml=True),
+        "application/marcxml+xml",
+        str(tmp_path / "records-0000"),
+        compression=None,
+    )
+    assert files[0]["name"] == "records-0000-0000.xml"
+    root = ElementTree.parse(tmp_path / files[0]["name"]).getroot()
+    assert root.tag == "records"
+    assert [child.get("id") for child in root] == ["a", "b"]
+
+
+def test_write_dump_files_empty(tmp_path):
+    """Empty shards have no files."""
+    files = write_dump_files(
+        [], FakeSerializer(), "application/json", str(tmp_path / "records-0000")
+    )
+    assert files == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_incremental_dump_deletions(base_app, tmp_path, monkeypatch):
+    """Incremental dumps list the records deleted or restricted since then."""
+    public = [{"id": "abcd-1234"}]
+    hidden = [{"id": "wxyz-5678"}, {"id": "efgh-9012"}]
+
+    def scan(identity, params=None, extra_filter=None, **kwargs):
+        include_deleted = (params or {}).get("include_deleted")
+        return mock.Mock(hits=iter(hidden if include_deleted else public))
+
+    service = base_app.extensions["invenio-rdm-records"].records_service
+    monkeypatch.setattr(service, "scan", scan)
+    monkeypatch.setattr(RecordsDump, "serializer", FakeSerializer())
+
+    with base_app.app_context():
+        manifest = RecordsDump(str(tmp_path / "full"), shards=1, workers=1).run()
+        assert manifest["records"] == 1
+        assert manifest["deletions"] == []
+
+        manifest = RecordsDump(
+            str(tmp_path / "incremental"), shards=1, workers=1, since="2024-01-01"
+        ).run()
+    assert manifest["records"] == 1
+    assert manifest["deletions"] == ["efgh-9012", "wxyz-5678"]
+    with open(tmp_path / "incremental" / "manifest.json") as fp:
+        assert json.load(fp)["deletions"] == manifest["deletions"]
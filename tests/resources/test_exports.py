@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Materialized exports tests."""
+
+from unittest import mock
+
+import pytest
+from flask import g
+from flask_resources.context import ResourceRequestCtx
+from invenio_access.permissions import system_identity
+from invenio_records_resources.resources.records.headers import etag_headers
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMDraft
+from invenio_rdm_records.resources import cache, exports
+from invenio_rdm_records.resources.cache import CachedResponseHandler
+from invenio_rdm_records.resources.exports import (
+    DBExportsStore,
+    FileSystemExportsStore,
+)
+from invenio_rdm_records.resources.serializers import DCATSerializer
+from invenio_rdm_records.services.components import (
+    DefaultRecordsComponents,
+    ExportsComponent,
+)
+
+
+@pytest.fixture()
+def fs_store(base_app, tmp_path):
+    """Filesystem exports store."""
+    base_app.config["RDM_RECORDS_EXPORTS_PATH"] = str(tmp_path)
+    return FileSystemExportsStore(base_app)
+
+
+def _test_store(store):
+    """Exports are only returned for the rendered record and parent revisions."""
+    mimetype = "application/dcat+xml"
+    assert store.get("abcd-1234", mimetype, 1, 1) is None
+
+    store.set("abcd-1234", mimetype, 1, 1, b"<rev1/>")
+    assert store.get("abcd-1234", mimetype, 1, 1) == b"<rev1/>"
+    assert store.get("abcd-1234", "application/marcxml+xml", 1, 1) is None
+    # the parent changed
+    assert store.get("abcd-1234", mimetype, 1, 2) is None
+
+    store.set("abcd-1234", mimetype, 2, 1, b"<rev2/>")
+    assert store.get("abcd-1234", mimetype, 1, 1) is None
+    assert store.get("abcd-1234", mimetype, 2, 1) == b"<rev2/>"
+
+    store.delete("abcd-1234")
+    assert store.get("abcd-1234", mimetype, 2, 1) is None
+
+
+def test_filesystem_exports_store(fs_store):
+    """Test the filesystem exports store."""
+    _test_store(fs_store)
+
+
+def test_db_exports_store(base_app, db):
+    """Test the database exports store."""
+    _test_store(DBExportsStore(base_app))
+
+
+def test_cached_response_handler_materialized(base_app, fs_store):
+    """The materialized export of the record revision is served."""
+    serializer = mock.Mock()
+    serializer.serialize_object.side_effect = lambda obj: f"rev {obj['revision_id']}"
+    handler = CachedResponseHandler(serializer, headers=etag_headers)
+    fs_store.set("abcd-1234", "application/dcat+xml", 1, 1, b"materialized")
+    parent = {"id": "efgh-5678"}
+
+    def get(obj, path="/records/abcd-1234", mimetype="application/dcat+xml"):
+        with base_app.test_request_context(path):
+            g.resource_requestctx = ResourceRequestCtx(None)
+            g.resource_requestctx.accept_mimetype = mimetype
+            return handler.make_response(obj, 200)
+
+    ext = base_app.extensions["invenio-rdm-records"]
+    parent_revisions = {"efgh-5678": 1}
+    parent_revision_id = mock.patch.object(
+        cache, "parent_revision_id", side_effect=lambda pid: parent_revisions[pid]
+    )
+    with mock.patch.object(ext, "exports_store", fs_store), parent_revision_id:
+        response = get({"id": "abcd-1234", "revision_id": 1, "parent": parent})
+        assert response.get_data() == b"materialized"
+        assert response.headers["ETag"] == '"1"'
+        assert serializer.serialize_object.call_count == 0
+
+        # the exports are rendered without the query arguments
+        obj = {"id": "abcd-1234", "revision_id": 1, "parent": parent}
+        response = get(obj, path="/records/abcd-1234?style=apa")
+        assert response.get_data(as_text=True) == "rev 1"
+
+        # not an export format
+        fs_store.set("abcd-1234", "application/x-bibtex", 1, 1, b"materialized")
+        response = get(obj, mimetype="application/x-bibtex")
+        assert response.get_data(as_text=True) == "rev 1"
+
+        # stale export
+        response = get({"id": "abcd-1234", "revision_id": 2, "parent": parent})
+        assert response.get_data(as_text=True) == "rev 2"
+
+        # stale parent
+        parent_revisions["efgh-5678"] = 2
+        response = get({"id": "abcd-1234", "revision_id": 1, "parent": parent})
+        assert response.get_data(as_text=True) == "rev 1"
+
+
+def test_exports_component(
+    running_app, minimal_record, monkeypatch, fs_store, search_clear
+):
+    """The configured formats are rendered when a record is published."""
+    app = running_app.app
+    monkeypatch.setitem(
+        app.config,
+        "RDM_RECORDS_SERVICE_COMPONENTS",
+        DefaultRecordsComponents + [ExportsComponent],
+    )
+    monkeypatch.setattr(current_rdm_records, "exports_store", fs_store)
+    service = current_rdm_records.records_service
+
+    draft = service.create(system_identity, minimal_record)
+    record = service.publish(system_identity, draft.id)
+
+    revision_id = record._record.revision_id
+    parent_revision_id = record._record.parent.revision_id
+    assert parent_revision_id == exports.parent_revision_id(record["parent"]["id"])
+    for mimetype in app.config["RDM_RECORDS_EXPORTS_FORMATS"]:
+        data = fs_store.get(record.id, mimetype, revision_id, parent_revision_id)
+        assert data.startswith(b"<")
+
+    # the exports of deleted records are removed
+    service.delete_record(system_identity, record.id, {})
+    assert (
+        fs_store.get(record.id, "application/dcat+xml", revision_id, parent_revision_id)
+        is None
+    )
+
+
+def test_exports_serializers(base_app):
+    """The serializers of the export formats are read from the configuration."""
+    serializers = exports.get_exports_serializers(base_app)
+    assert list(serializers) == list(base_app.config["RDM_RECORDS_EXPORTS_FORMATS"])
+    assert isinstance(serializers["application/dcat+xml"], DCATSerializer)
+
+
+def test_parent_revision_id(base_app, db, location):
+    """The current revision of a parent is read by its PID."""
+    draft = RDMDraft.create({})
+    draft.commit()
+    db.session.commit()
+    parent = draft.parent
+    assert exports.parent_revision_id(parent.pid.pid_value) == parent.revision_id
+
+    parent.commit()
+    db.session.commit()
+    assert exports.parent_revision_id(parent.pid.pid_value) == parent.revision_id
+    assert exports.parent_revision_id("unknown") is None
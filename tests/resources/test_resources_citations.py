@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Bulk citations tests."""
+
+from copy import deepcopy
+
+from invenio_access.permissions import system_identity
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMRecord
+
+
+def test_citations(running_app, client, search_clear, minimal_record):
+    """Citations of several records are returned in a single response."""
+    service = current_rdm_records.records_service
+    ids = []
+    for title in ("First", "Second", "Third"):
+        data = deepcopy(minimal_record)
+        data["metadata"]["title"] = title
+        if title == "Third":
+            data["access"]["record"] = "restricted"
+        draft = service.create(system_identity, data)
+        ids.append(service.publish(system_identity, draft.id).id)
+    RDMRecord.index.refresh()
+
+    # restricted records are left out and the order of the ids is kept
+    res = client.post(
+        "/records/citations",
+        json={"ids": list(reversed(ids)), "style": "chicago-author-date"},
+    )
+    assert res.status_code == 200
+    assert res.json["style"] == "chicago-author-date"
+    hits = res.json["hits"]["hits"]
+    assert [hit["id"] for hit in hits] == [ids[1], ids[0]]
+    assert "Second" in hits[0]["citation"]
+    assert "First" in hits[1]["citation"]
+
+    res = client.post(
+        "/records/citations",
+        json={"q": "metadata.title:First", "style": "chicago-author-date"},
+    )
+    assert res.status_code == 200
+    assert res.json["hits"]["total"] == 1
+    assert "First" in res.json["hits"]["hits"][0]["citation"]
+
+    res = client.post("/records/citations", json={"ids": ids, "q": "First"})
+    assert res.status_code == 400
+
+    res = client.post("/records/citations", json={"ids": ids, "style": "unknown"})
+    assert res.status_code == 400
+
+
+def test_citations_versions(running_app, client, search_clear, minimal_record):
+    """Older versions of a record are cited by id as well."""
+    service = current_rdm_records.records_service
+    draft = service.create(system_identity, minimal_record)
+    first = service.publish(system_identity, draft.id)
+    draft = service.new_version(system_identity, first.id)
+    data = deepcopy(draft.data)
+    data["metadata"]["title"] = "Second version"
+    data["metadata"]["publication_date"] = "2024-01-01"
+    draft = service.update_draft(system_identity, draft.id, data)
+    second = service.publish(system_identity, draft.id)
+    RDMRecord.index.refresh()
+
+    res = client.post("/records/citations", json={"ids": [first.id, second.id]})
+    assert res.status_code == 200
+    assert [hit["id"] for hit in res.json["hits"]["hits"]] == [first.id, second.id]
+
+
+def test_citations_locale(running_app, client):
+    """The language of the request is cited with its CSL locale."""
+    res = client.post("/records/citations", json={"ids": []})
+    assert res.status_code == 200
+    assert res.json["locale"] == "en-US"
+
+    res = client.post("/records/citations", json={"ids": [], "locale": "de"})
+    assert res.json["locale"] == "de-DE"
+
+
+def test_citations_max_records(running_app, client):
+    """The number of cited records is limited."""
+    max_records = running_app.app.config["RDM_CITATIONS_MAX_RECORDS"]
+    res = client.post(
+        "/records/citations", json={"ids": [str(i) for i in range(max_records + 1)]}
+    )
+    assert res.status_code == 400
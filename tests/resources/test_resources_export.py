@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Streamed search exports tests."""
+
+import gzip
+import json
+
+from invenio_access.permissions import system_identity
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMRecord
+
+
+def test_export(
+    running_app, client, search_clear, minimal_record, uploader, monkeypatch
+):
+    """All the matching records are streamed in the requested format."""
+    service = current_rdm_records.records_service
+    for title in ("First", "Second", "Third"):
+        minimal_record["metadata"]["title"] = title
+        draft = service.create(system_identity, minimal_record)
+        service.publish(system_identity, draft.id)
+    RDMRecord.index.refresh()
+
+    # anonymous users can't export
+    res = client.get("/records/export", headers={"accept": "application/json"})
+    assert res.status_code == 403
+
+    client = uploader.login(client)
+    res = client.get(
+        "/records/export",
+        query_string={"size": 1},
+        headers={"accept": "application/json"},
+    )
+    assert res.status_code == 200
+    titles = {hit["metadata"]["title"] for hit in json.loads(res.data)}
+    assert titles == {"First", "Second", "Third"}
+
+    res = client.get(
+        "/records/export",
+        query_string={"q": "metadata.title:Second"},
+        headers={
+            "accept": "application/vnd.inveniordm.v1.simple+csv",
+            "accept-encoding": "gzip",
+        },
+    )
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    lines = gzip.decompress(res.data).decode("utf-8").splitlines()
+    assert len(lines) == 2
+    assert "Second" in lines[1]
+
+    res = client.get("/records/export", headers={"accept": "application/x-dc+xml"})
+    assert res.status_code == 406
+
+    # searches matching too many records are rejected
+    monkeypatch.setitem(running_app.app.config, "RDM_RECORDS_EXPORT_MAX_RESULTS", 2)
+    res = client.get("/records/export", headers={"accept": "application/json"})
+    assert res.status_code == 400
+    assert "at most 2 records" in res.json["message"]
+    res = client.get(
+        "/records/export",
+        query_string={"q": "metadata.title:Second"},
+        headers={"accept": "application/json"},
+    )
+    assert len(json.loads(res.data)) == 1
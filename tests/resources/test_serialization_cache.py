@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Serialized records cache tests."""
+
+from unittest import mock
+
+from flask import g
+from flask_resources.context import ResourceRequestCtx
+from invenio_records_resources.resources.records.headers import etag_headers
+
+from invenio_rdm_records.resources.cache import (
+    CachedResponseHandler,
+    LRUSerializationCache,
+)
+
+
+def test_lru_serialization_cache(base_app):
+    """Entries are evicted when the cache is full or when they expire."""
+    now = [0]
+    base_app.config.update(
+        RDM_RECORDS_SERIALIZATION_CACHE_SIZE=2,
+        RDM_RECORDS_SERIALIZATION_CACHE_TIMEOUT=10,
+    )
+    cache = LRUSerializationCache(base_app, clock=lambda: now[0])
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("1", "3")
+
+    now[0] = 10
+    assert cache.get("a") is None
+
+
+def test_cached_response_handler(base_app):
+    """A record revision is serialized once per mimetype and arguments."""
+    serializer = mock.Mock()
+    serializer.serialize_object.side_effect = lambda obj: f"rev {obj['revision_id']}"
+    handler = CachedResponseHandler(serializer, headers=etag_headers)
+    cache = LRUSerializationCache(base_app)
+    record = {
+        "id": "abcd-1234",
+        "revision_id": 1,
+        "parent": {"id": "abcd-0000", "communities": {}},
+        "versions": {"index": 1, "is_latest": True},
+    }
+
+    def get(obj, query="", **kwargs):
+        with base_app.test_request_context(f"/records/abcd-1234{query}", **kwargs):
+            g.resource_requestctx = ResourceRequestCtx(None)
+            g.resource_requestctx.accept_mimetype = "application/x-bibtex"
+            return handler.make_response(obj, 200)
+
+    ext = base_app.extensions["invenio-rdm-records"]
+    with mock.patch.object(ext, "serialization_cache", cache):
+        response = get(record)
+        assert response.get_data(as_text=True) == "rev 1"
+        assert response.headers["ETag"] == '"1"'
+        get(record)
+        assert serializer.serialize_object.call_count == 1
+
+        get(record, "?style=apa")
+        assert serializer.serialize_object.call_count == 2
+
+        response = get({**record, "revision_id": 2})
+        assert response.get_data(as_text=True) == "rev 2"
+        assert serializer.serialize_object.call_count == 3
+
+        # changes of the parent or of the versions do not change the revision
+        get({**record, "parent": {"id": "abcd-0000", "communities": {"ids": ["c"]}}})
+        get({**record, "versions": {"index": 1, "is_latest": False}})
+        assert serializer.serialize_object.call_count == 5
+
+        # localized formats
+        get(record, headers={"Accept-Language": "de"})
+        assert serializer.serialize_object.call_count == 6
@@ -25,6 +25,23 @@ def test_link_in_metadata_resource_response_headers(
     )
 
 
+def test_link_header_opt_out(
+    running_app, client_with_login, minimal_record, publish_record, monkeypatch
+):
+    """The header can be disabled, or skipped by the clients."""
+    record_json = publish_record(client_with_login, minimal_record)
+    url = f"/records/{record_json['id']}"
+
+    response = client_with_login.get(url, headers={"Prefer": "return=minimal"})
+    assert response.status_code == 200
+    assert "Link" not in response.headers
+    assert response.headers["Preference-Applied"] == "return=minimal"
+
+    monkeypatch.setitem(running_app.app.config, "RDM_SIGNPOSTING_LINK_HEADER", False)
+    response = client_with_login.get(url)
+    assert "Link" not in response.headers
+
+
 # Just a sanity check
 def test_signposting_link_permissions(
     client, client_with_login, minimal_restricted_record, publish_record
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Circuit breaker tests."""
+
+from invenio_rdm_records.services.pids.providers.circuitbreaker import CircuitBreaker
+
+
+def test_circuit_breaker():
+    """The circuit opens after consecutive failures and recovers after a while."""
+    now = [0]
+    breaker = CircuitBreaker(
+        "test", threshold=2, reset_timeout=10, clock=lambda: now[0]
+    )
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    assert not breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    # a failed trial request opens the circuit again
+    now[0] = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert breaker.record_failure()
+    assert not breaker.allow()
+
+    # a single trial request is let through
+    now[0] = 20
+    assert breaker.allow()
+    assert not breaker.allow()
+    # unless it did not complete in time
+    now[0] = 30
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    # a successful trial request closes it
+    assert breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+    assert not breaker.record_success()
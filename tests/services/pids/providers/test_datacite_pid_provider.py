@@ -17,6 +17,7 @@ from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.records import RDMDraft, RDMRecord
+from invenio_rdm_records.records.models import RDMPIDOutbox
 from invenio_rdm_records.services.pids.providers import (
     DataCiteClient,
     DataCitePIDProvider,
@@ -28,6 +29,10 @@ def datacite_provider(mocker):
     mocker.patch(
         "invenio_rdm_records.services.pids.providers.datacite.DataCiteRESTClient"
     )
+    mocker.patch(
+        "invenio_rdm_records.services.pids.providers.datacite."
+        "PooledDataCiteRESTClient"
+    )
 
     return DataCitePIDProvider("datacite", client=DataCiteClient("datacite"))
 
@@ -122,6 +127,63 @@ def test_datacite_provider_update(record_w_links, datacite_provider, mocker):
     assert db_pid.status == PIDStatus.REGISTERED
 
 
+def test_datacite_payload_hash():
+    doc = {"titles": [{"title": "A title"}]}
+    url = "https://127.0.0.1:5000/records/abcd-1234"
+    payload_hash = DataCitePIDProvider._payload_hash(doc, url)
+
+    # the event of the updates is not part of the payload
+    assert DataCitePIDProvider._payload_hash({**doc, "event": "publish"}, url) == (
+        payload_hash
+    )
+    assert DataCitePIDProvider._payload_hash(doc) != payload_hash
+
+
+def test_datacite_provider_update_unchanged(record_w_links, datacite_provider):
+    created_pid = datacite_provider.get(record_w_links["pids"]["doi"]["identifier"])
+    url = record_w_links["links"]["self_html"]
+    assert datacite_provider.register(pid=created_pid, record=record_w_links, url=url)
+    api = datacite_provider.client.api
+
+    # updates identical to the registered payload are skipped
+    assert datacite_provider.update(pid=created_pid, record=record_w_links, url=url)
+    assert datacite_provider.update(pid=created_pid, record=record_w_links, url=url)
+    assert api.update_doi.call_count == 0
+    assert datacite_provider.counters["updates_sent"] == 0
+    assert datacite_provider.counters["updates_skipped"] == 2
+
+    # changed metadata, new URL or forced updates are sent
+    record_w_links["metadata"]["title"] = "An updated title"
+    assert datacite_provider.update(pid=created_pid, record=record_w_links, url=url)
+    assert datacite_provider.update(pid=created_pid, record=record_w_links, url=None)
+    assert datacite_provider.update(
+        pid=created_pid, record=record_w_links, url=None, force=True
+    )
+    assert api.update_doi.call_count == 3
+    assert datacite_provider.counters["updates_skipped"] == 2
+
+
+def test_datacite_provider_update_throttled(
+    running_app, record_w_links, datacite_provider, monkeypatch
+):
+    monkeypatch.setitem(running_app.app.config, "DATACITE_RATE_LIMIT", 10)
+    created_pid = datacite_provider.get(record_w_links["pids"]["doi"]["identifier"])
+    url = record_w_links["links"]["self_html"]
+    assert datacite_provider.register(pid=created_pid, record=record_w_links, url=url)
+    api = datacite_provider.client.api
+    api.update_doi.side_effect = DataCiteError.factory(429, "Too many requests")
+    rate = datacite_provider.client.limiter.rate
+
+    # the failed update is re-queued in the outbox instead of being lost
+    assert not datacite_provider.update(pid=created_pid, record=record_w_links, url=url)
+    assert datacite_provider.counters["throttled"] == 1
+    assert datacite_provider.counters["requeued"] == 1
+    assert datacite_provider.client.limiter.rate < rate
+    entry = RDMPIDOutbox.query.filter_by(record_pid=record_w_links["id"]).one()
+    assert entry.attempts == 1
+    assert entry.next_attempt is not None
+
+
 def test_datacite_provider_unregister_new(record, datacite_provider):
     # Unregister NEW is a hard delete
     created_pid = datacite_provider.create(record)
@@ -292,3 +354,27 @@ def test_log_error_msg(app, mocker):
             "DataCite error (field: %(field)s): %(reason)s",
             expected_msg_args={"field": None, "reason": "Unauthorized"},
         )
+
+
+def test_datacite_provider_circuit_closed(
+    base_app, datacite_provider, mocker, monkeypatch
+):
+    """The journal is replayed when DataCite is available again."""
+    replay = mocker.patch(
+        "invenio_rdm_records.services.pids.providers.datacite.replay_pid_journal"
+    )
+    monkeypatch.setitem(base_app.config, "DATACITE_CIRCUIT_BREAKER_THRESHOLD", 1)
+    with base_app.app_context():
+        breaker = datacite_provider.client.breaker
+        datacite_provider._api_call("show_doi", "10.1234/abcd-1234")
+        assert replay.delay.call_count == 0
+
+        breaker.record_failure()
+        breaker.opened_at -= breaker.reset_timeout
+        assert not datacite_provider._is_unavailable()
+        # a single trial request is sent while half-open
+        assert datacite_provider._is_unavailable()
+        datacite_provider._api_call("show_doi", "10.1234/abcd-1234")
+        assert breaker.state == breaker.CLOSED
+        assert replay.delay.call_count == 1
+        assert datacite_provider.counters["circuit_closed"] == 1
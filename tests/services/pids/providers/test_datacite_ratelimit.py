@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""DataCite rate limiter tests."""
+
+from invenio_rdm_records.services.pids.providers import DataCiteClient
+from invenio_rdm_records.services.pids.providers.ratelimit import LocalRateLimiter
+
+
+def test_local_rate_limiter_schedule():
+    """Requests are spaced according to the rate."""
+    limiter = LocalRateLimiter("test", rate=4)
+    assert limiter.reserve(100.0) == 0
+    assert limiter.reserve(100.0) == 0.25
+    assert limiter.reserve(100.0) == 0.5
+    # idle time is not accumulated
+    assert limiter.reserve(200.0) == 0
+
+
+def test_local_rate_limiter_adapts():
+    """The rate decreases when throttled and slowly recovers."""
+    limiter = LocalRateLimiter("test", rate=4, min_rate=1, increase=0.5)
+    limiter.penalize()
+    assert limiter.rate == 2
+    limiter.penalize()
+    limiter.penalize()
+    assert limiter.rate == 1
+    for _ in range(10):
+        limiter.reward()
+    assert limiter.rate == 4
+
+
+def test_datacite_client_limiter_config(base_app):
+    """The limiter can be disabled with DATACITE_RATE_LIMIT."""
+    with base_app.app_context():
+        client = DataCiteClient("datacite", config_overrides={"DATACITE_RATE_LIMIT": 5})
+        assert isinstance(client.limiter, LocalRateLimiter)
+        assert client.limiter.max_rate == 5
+        assert client.limiter is client.limiter
+
+        client = DataCiteClient(
+            "datacite", config_overrides={"DATACITE_RATE_LIMIT": None}
+        )
+        assert client.limiter is None
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Pooled DataCite REST API sessions tests."""
+
+from invenio_rdm_records.services.pids.providers import DataCiteClient
+from invenio_rdm_records.services.pids.providers.sessions import (
+    PooledDataCiteRESTClient,
+    close_sessions,
+)
+from tests.fake_datacite_client import LocalDataCiteServer
+
+
+def test_pooled_client_reuses_connections():
+    """Consecutive DOI updates go through a single kept-alive connection."""
+    with LocalDataCiteServer() as server:
+        client = PooledDataCiteRESTClient(
+            "user", "pass", "10.1234", url=server.url, pool_size=2
+        )
+        for i in range(5):
+            assert client.update_doi(f"10.1234/{i}", {})["doi"] == f"10.1234/{i}"
+        close_sessions()
+
+    assert server.connections == 1
+
+
+def test_datacite_client_pool_config(base_app):
+    """The pool is used unless disabled with DATACITE_HTTP_POOL_SIZE."""
+    with base_app.app_context():
+        client = DataCiteClient(
+            "datacite", config_overrides={"DATACITE_HTTP_POOL_SIZE": 3}
+        )
+        assert isinstance(client.api, PooledDataCiteRESTClient)
+        assert client.api.pool_size == 3
+
+        client = DataCiteClient(
+            "datacite", config_overrides={"DATACITE_HTTP_POOL_SIZE": 0}
+        )
+        assert not isinstance(client.api, PooledDataCiteRESTClient)
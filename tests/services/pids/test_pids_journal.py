@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN
+#
+# Invenio-RDM-Records is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""PID journal tests, for operations deferred during provider outages."""
+
+import pytest
+from invenio_access.permissions import system_identity
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.models import RDMPIDJournal
+from invenio_rdm_records.services.pids.tasks import replay_pid_journal
+
+
+@pytest.fixture()
+def datacite_outage(running_app, monkeypatch):
+    """Make the fake DataCite REST client unavailable."""
+    service = current_rdm_records.records_service
+    provider = service.pids.pid_manager._get_provider("doi", "datacite")
+    monkeypatch.setattr(provider.client.api, "unavailable", True)
+    monkeypatch.setitem(running_app.app.config, "DATACITE_CIRCUIT_BREAKER_THRESHOLD", 1)
+    monkeypatch.setattr(provider.client, "_breaker", None)
+    yield provider
+    provider.client._breaker = None
+
+
+def test_operations_journaled_during_outage(
+    running_app, search_clear, minimal_record, superuser_identity, datacite_outage
+):
+    """Operations are journaled while the circuit is open and replayed later."""
+    service = current_rdm_records.records_service
+    provider = datacite_outage
+    minimal_record["pids"] = {}
+
+    # the first failure opens the circuit
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    assert provider.client.breaker.state == provider.client.breaker.OPEN
+
+    # subsequent operations are journaled without contacting DataCite
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    doi = record["pids"]["doi"]["identifier"]
+    entry = RDMPIDJournal.query.filter_by(record_pid=record.id).one()
+    assert entry.operation == "register"
+    assert provider.get(doi).status == PIDStatus.RESERVED
+
+    # the journal is replayed once DataCite is back
+    provider.client.api.unavailable = False
+    provider.client.breaker.record_success()
+    replay_pid_journal.delay()
+    assert RDMPIDJournal.query.filter_by(record_pid=record.id).count() == 0
+    assert provider.get(doi).status == PIDStatus.REGISTERED
+
+
+def test_replay_removed_pid(base_app, db):
+    """Entries of PIDs removed since they were journaled are dropped."""
+    service = current_rdm_records.records_service
+    pid = PersistentIdentifier.create("doi", "10.1234/abcd-1234")
+    RDMPIDJournal.add(pid.id, "datacite", "update")
+    db.session.delete(pid)
+    db.session.commit()
+
+    assert service.pids.replay_journal(system_identity) == 0
+    assert RDMPIDJournal.query.count() == 0
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 CERN
+#
+# Invenio-RDM-Records is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""PID bulk synchronization tests."""
+
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+from invenio_access.permissions import system_identity
+from invenio_db import db
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.models import RDMPIDRemoteState
+from invenio_rdm_records.services.pids.sync import (
+    BulkPIDSync,
+    SyncCheckpoint,
+    SyncItem,
+    SyncSummary,
+    TokenBucket,
+)
+
+
+@pytest.fixture(scope="module")
+def mock_datacite_client(mock_datacite_client):
+    """Mock DataCite client API calls."""
+    with mock.patch.object(mock_datacite_client, "api"):
+        yield mock_datacite_client
+
+
+def test_token_bucket():
+    """The bucket allows bursts up to its capacity, then waits for refills."""
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    async def acquire(n):
+        for _ in range(n):
+            await bucket.acquire()
+
+    with mock.patch("asyncio.sleep", fake_sleep):
+        asyncio.run(acquire(4))
+
+    assert sleeps == [0.5, 0.5]
+
+
+def test_sync_checkpoint(tmp_path):
+    """The checkpoint is stored and loaded from a file."""
+    path = tmp_path / "checkpoint.json"
+    SyncCheckpoint(str(path)).save("abc")
+    assert json.loads(path.read_text()) == {"last_id": "abc"}
+    assert SyncCheckpoint(str(path)).last_id == "abc"
+    assert SyncCheckpoint(str(tmp_path / "missing.json")).last_id is None
+
+
+def test_sync_update_through_provider(base_app):
+    """Payloads are sent through the provider, unless DataCite is unavailable."""
+    provider = mock.Mock()
+    provider._is_unavailable.return_value = False
+    item = SyncItem("abcd-1234", 1, "10.1234/abcd-1234", provider, {}, None, "h")
+
+    assert BulkPIDSync._update(base_app, item)
+    provider._api_call.assert_called_once_with(
+        "update_doi", metadata={}, doi="10.1234/abcd-1234", url=None, rate_limit=True
+    )
+
+    # the bulk rate replaces the rate limiter of the provider
+    provider.reset_mock()
+    assert BulkPIDSync._update(base_app, item, rate_limit=False)
+    assert provider._api_call.call_args.kwargs["rate_limit"] is False
+
+    provider.reset_mock()
+    provider._is_unavailable.return_value = True
+    assert not BulkPIDSync._update(base_app, item)
+    provider._api_call.assert_not_called()
+
+
+def test_sync_summary():
+    """The skipped records are counted by reason."""
+    summary = SyncSummary()
+    summary.add("sent")
+    summary.skip("unchanged")
+    summary.skip("unchanged")
+    summary.skip("not latest version")
+    summary.add_latency(0.1)
+    summary.stop()
+
+    assert (summary.sent, summary.failed, summary.skipped) == (1, 0, 3)
+    assert "skipped: 3 (not latest version: 1, unchanged: 2)" in str(summary)
+
+
+def test_bulk_sync(
+    running_app, search_clear, minimal_record, mock_datacite_client, tmp_path
+):
+    """Registered DOIs are pushed once, unchanged ones are skipped."""
+    service = current_rdm_records.records_service
+    minimal_record["pids"] = {}
+    draft = service.create(system_identity, minimal_record)
+    record = service.publish(system_identity, draft.id)
+    doi = record["pids"]["doi"]["identifier"]
+
+    # the payload registered at publication is unchanged
+    summary = service.pids.bulk_sync(system_identity)
+    assert (summary.sent, summary.skipped) == (0, 1)
+    assert summary.skips == {"unchanged": 1}
+
+    # forget the registered payloads, e.g. of DOIs registered before they were
+    # tracked, so that they are all sent
+    RDMPIDRemoteState.query.delete()
+    db.session.commit()
+    mock_datacite_client.api.update_doi.reset_mock()
+
+    checkpoint = str(tmp_path / "checkpoint.json")
+    summary = service.pids.bulk_sync(system_identity, checkpoint=checkpoint)
+    assert summary.sent == 1
+    assert summary.failed == 0
+    mock_datacite_client.api.update_doi.assert_called_once()
+    assert mock_datacite_client.api.update_doi.call_args.kwargs["doi"] == doi
+
+    # resuming from the checkpoint has nothing left to do
+    summary = service.pids.bulk_sync(system_identity, checkpoint=checkpoint)
+    assert summary.sent == summary.skipped == 0
+
+    # a new run skips the unchanged payload, unless forced
+    summary = service.pids.bulk_sync(system_identity)
+    assert (summary.sent, summary.skipped) == (0, 1)
+    summary = service.pids.bulk_sync(system_identity, force=True)
+    assert summary.sent == 1
@@ -13,13 +13,21 @@ from copy import deepcopy
 from unittest import mock
 
 import pytest
+from invenio_access.permissions import system_identity
+from invenio_db import db
 from invenio_pidstore.models import PIDStatus
+from invenio_records_resources.services.uow import UnitOfWork
 
 from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.models import RDMPIDOutbox, RDMPIDRemoteState
 from invenio_rdm_records.records.systemfields.deletion_status import (
     RecordDeletionStatusEnum,
 )
-from invenio_rdm_records.services.pids.tasks import register_or_update_pid
+from invenio_rdm_records.services.pids.tasks import (
+    dispatch_pid_outbox,
+    register_or_update_pid,
+)
+from invenio_rdm_records.services.pids.uow import PIDOutboxOp
 
 
 @pytest.fixture(scope="module")
@@ -810,3 +818,136 @@ def test_full_record_register(
             )
         ]
     )
+
+
+def test_pid_outbox_coalesces_operations(
+    running_app,
+    search_clear,
+    minimal_record,
+    monkeypatch,
+    superuser_identity,
+    mock_datacite_client,
+):
+    """Operations on the same record/scheme/parent result in a single push."""
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    # publishing dispatches the outbox right away
+    assert RDMPIDOutbox.query.count() == 0
+
+    monkeypatch.setitem(
+        running_app.app.config, "RDM_PIDS_OUTBOX_DISPATCH_ON_COMMIT", False
+    )
+    for _ in range(3):
+        with UnitOfWork(db.session) as uow:
+            uow.register(PIDOutboxOp(record.id, "doi"))
+            uow.register(PIDOutboxOp(record.id, "doi", parent=True))
+            uow.commit()
+    assert RDMPIDOutbox.query.count() == 2
+
+    # forget the registered payloads, so that the unchanged updates are sent
+    RDMPIDRemoteState.query.delete()
+    mock_datacite_client.api.update_doi.reset_mock()
+    dispatch_pid_outbox()
+
+    assert mock_datacite_client.api.update_doi.call_count == 2
+    assert RDMPIDOutbox.query.count() == 0
+
+
+def test_pid_outbox_keeps_failed_operations(
+    running_app,
+    search_clear,
+    minimal_record,
+    monkeypatch,
+    superuser_identity,
+    mock_datacite_client,
+):
+    """Failed operations stay in the outbox until the max attempts."""
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+
+    monkeypatch.setitem(
+        running_app.app.config, "RDM_PIDS_OUTBOX_DISPATCH_ON_COMMIT", False
+    )
+    monkeypatch.setitem(running_app.app.config, "RDM_PIDS_OUTBOX_MAX_ATTEMPTS", 2)
+    monkeypatch.setitem(running_app.app.config, "RDM_PIDS_OUTBOX_RETRY_DELAY", 0)
+    with UnitOfWork(db.session) as uow:
+        uow.register(PIDOutboxOp(record.id, "doi"))
+        uow.commit()
+
+    with mock.patch.object(
+        service.pids, "register_or_update", side_effect=RuntimeError("down")
+    ):
+        assert service.pids.dispatch_outbox(superuser_identity) == 0
+        entry = RDMPIDOutbox.query.one()
+        assert entry.attempts == 1
+        assert entry.next_attempt is not None
+        service.pids.dispatch_outbox(superuser_identity)
+        assert RDMPIDOutbox.query.count() == 0
+
+
+def test_pid_outbox_claimed_operations(base_app, db):
+    """Operations claimed by a dispatch are skipped by concurrent dispatches."""
+    service = current_rdm_records.records_service
+    RDMPIDOutbox.enqueue("abcd-1234", "doi")
+    db.session.commit()
+
+    claimed = RDMPIDOutbox.claim()
+    db.session.commit()
+    assert [entry.record_pid for entry in claimed] == ["abcd-1234"]
+    assert RDMPIDOutbox.claim() == []
+
+    with mock.patch.object(service.pids, "register_or_update") as register:
+        assert service.pids.dispatch_outbox(system_identity) == 0
+        register.assert_not_called()
+
+    # an entry retried during the push keeps its next attempt
+    assert not RDMPIDOutbox.release(claimed[0].id, attempts=1)
+
+    # an entry enqueued again during the push is due again right away
+    assert RDMPIDOutbox.release(claimed[0].id, attempts=0)
+    db.session.commit()
+    with mock.patch.object(service.pids, "register_or_update") as register:
+        assert service.pids.dispatch_outbox(system_identity) == 1
+        register.assert_called_once_with(
+            system_identity, "abcd-1234", "doi", parent=False
+        )
+    assert RDMPIDOutbox.query.count() == 0
+
+
+def test_pid_outbox_enqueue_resets_retries(base_app, db):
+    """A new operation on a retried entry is due right away."""
+    entry = RDMPIDOutbox.retry("abcd-1234", "doi")
+    entry = RDMPIDOutbox.retry("abcd-1234", "doi")
+    db.session.commit()
+    assert entry.attempts == 2
+    assert entry.next_attempt is not None
+
+    entry = RDMPIDOutbox.enqueue("abcd-1234", "doi")
+    db.session.commit()
+    assert (entry.attempts, entry.next_attempt) == (0, None)
+    assert [e.record_pid for e in RDMPIDOutbox.claim()] == ["abcd-1234"]
+
+
+def test_pid_outbox_dispatches_retried_operations(base_app, db):
+    """A dispatch with failed operations schedules another one at their retry."""
+    service = current_rdm_records.records_service
+    RDMPIDOutbox.enqueue("abcd-1234", "doi")
+    db.session.commit()
+
+    with mock.patch.object(
+        service.pids, "register_or_update", side_effect=RuntimeError("down")
+    ):
+        with mock.patch.object(dispatch_pid_outbox, "apply_async") as apply_async:
+            dispatch_pid_outbox()
+
+    entry = RDMPIDOutbox.query.one()
+    assert entry.attempts == 1
+    apply_async.assert_called_once()
+    assert 0 < apply_async.call_args.kwargs["countdown"] <= 60
+
+    # nothing is scheduled when no operation was retried
+    with mock.patch.object(dispatch_pid_outbox, "apply_async") as apply_async:
+        dispatch_pid_outbox()
+    apply_async.assert_not_called()
@@ -9,6 +9,7 @@
 """Service level tests for OAI Sets."""
 
 import pytest
+from invenio_access.permissions import system_identity
 from invenio_db import db
 from invenio_oaiserver.models import OAISet
 from invenio_search import current_search_client
@@ -117,3 +118,84 @@ def test_rebuild_index(running_app, search_clear, minimal_oai_set):
     assert oai_hit["_source"] == {
         "query": {"query_string": {"query": "is_published:true"}}
     }
+
+
+def test_search_keyset_pagination(base_app, db):
+    """The next pages are resumed after the last set of the previous page."""
+    db.session.bulk_insert_mappings(
+        OAISet,
+        [
+            {
+                "spec": f"set-{i}",
+                "name": f"Set {i % 3}",
+                "search_pattern": "*",
+                "system_created": False,
+            }
+            for i in range(7)
+        ],
+    )
+    db.session.commit()
+    service = current_oaipmh_server_service
+
+    for sort, direction in [("name", "asc"), ("created", "desc"), ("spec", "asc")]:
+        params = {"size": 3, "sort": sort, "sort_direction": direction}
+        everything = service.search(system_identity, {**params, "size": 7})
+        expected = [hit["spec"] for hit in everything.hits]
+
+        harvested = []
+        result = service.search(system_identity, params)
+        while True:
+            harvested += [hit["spec"] for hit in result.hits]
+            after = result.pagination.after
+            if not after:
+                assert "next" not in result.to_dict()["links"]
+                break
+            assert f"after={after}" in result.to_dict()["links"]["next"]
+            next_page = result.pagination.next_page.page
+            result = service.search(
+                system_identity, {**params, "page": next_page, "after": after}
+            )
+            assert result.total == 7
+
+        assert harvested == expected
+
+    with pytest.raises(ValidationError):
+        service.search(system_identity, {"after": "invalid"})
+
+
+def test_search_keyset_pagination_unnamed_sets(base_app, db):
+    """Unnamed sets are resumed after by name, as if named with ""."""
+    db.session.bulk_insert_mappings(
+        OAISet,
+        [
+            {
+                "spec": f"set-{i}",
+                "name": f"Set {i}" if i % 2 else None,
+                "search_pattern": "*",
+                "system_created": False,
+            }
+            for i in range(5)
+        ],
+    )
+    db.session.commit()
+    service = current_oaipmh_server_service
+
+    for direction in ("asc", "desc"):
+        params = {"size": 2, "sort": "name", "sort_direction": direction}
+        harvested = []
+        result = service.search(system_identity, params)
+        while True:
+            harvested += [hit["spec"] for hit in result.hits]
+            after = result.pagination.after
+            if not after:
+                break
+            result = service.search(
+                system_identity,
+                {**params, "page": result.pagination.next_page.page, "after": after},
+            )
+
+        unnamed, named = ["set-0", "set-2", "set-4"], ["set-1", "set-3"]
+        if direction == "asc":
+            assert harvested == unnamed + named
+        else:
+            assert harvested == named[::-1] + unnamed[::-1]
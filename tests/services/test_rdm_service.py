@@ -11,13 +11,16 @@
 """Service level tests for Invenio RDM Records."""
 
 from copy import deepcopy
+from types import SimpleNamespace
 
 import pytest
 from invenio_access.permissions import system_identity
 
 from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.api import RDMRecord
 from invenio_rdm_records.services.errors import (
     EmbargoNotLiftedError,
+    ExportLimitError,
     ValidationErrorWithMessageAsList,
 )
 
@@ -407,3 +410,46 @@ def test_search_sort_verified_enabled(
 
     expected_order = [v_record.id, nv_record.id]
     assert expected_order == [h["id"] for h in hits]
+
+
+def test_oai_result_items(running_app, search_clear, minimal_record):
+    """A page of OAI records is projected as the records one by one."""
+    service = current_rdm_records.records_service
+    for title in ("First", "Second"):
+        data = deepcopy(minimal_record)
+        data["metadata"]["title"] = title
+        draft = service.create(system_identity, data)
+        service.publish(system_identity, draft.id)
+    RDMRecord.index.refresh()
+
+    sources = [hit.to_dict() for hit in RDMRecord.index.search().execute()]
+    projections = service.oai_result_items(system_identity, sources)
+
+    titles = [p["metadata"]["title"] for p in projections]
+    assert sorted(titles) == ["First", "Second"]
+    assert projections == [
+        service.oai_result_item(system_identity, source).to_dict() for source in sources
+    ]
+
+
+def test_scan_export_limit(base_app, db, monkeypatch):
+    """Searches matching more records than can be exported are rejected."""
+    service = base_app.extensions["invenio-rdm-records"].records_service
+    totals = []
+    monkeypatch.setitem(base_app.config, "RDM_RECORDS_EXPORT_MAX_RESULTS", 2)
+    monkeypatch.setattr(
+        service, "search", lambda *args, **kwargs: SimpleNamespace(total=totals[-1])
+    )
+    monkeypatch.setattr(
+        service, "scan", lambda *args, **kwargs: SimpleNamespace(hits=iter([]))
+    )
+
+    with base_app.app_context():
+        totals.append(3)
+        with pytest.raises(ExportLimitError) as exc:
+            service.scan_export(system_identity, params={"q": "title"})
+        assert (exc.value.total, exc.value.limit) == (3, 2)
+        assert "at most 2 records" in str(exc.value.description)
+
+        totals.append(2)
+        assert list(service.scan_export(system_identity, params={"q": "title"})) == []